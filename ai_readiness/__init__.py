@@ -0,0 +1 @@
+"""Headless AI-Readiness (AI-R) scoring engines used by the Streamlit pages."""
@@ -0,0 +1,160 @@
+"""Server-side aggregates of large scored populations for charting.
+
+A ``ColumnAggregate`` bins one score column into ``FINE_BINS`` equal-width
+bins in a single pass (chunk by chunk if needed) and keeps the count, mean,
+sum of squared deviations, minimum and maximum. The mean and variance of each
+chunk are merged into the running ones with Chan et al.'s pairwise update, so
+the variance does not lose precision the way ``E[x^2] - E[x]^2`` does over
+millions of rows. NaNs are counted as missing and infinite values as
+infinite; neither enters the bins or the statistics.
+
+Display histograms with fewer bins, quantiles and quantile bins are derived
+from the fine counts, so a distribution over millions of rows is drawn from a
+few kilobytes of data. Quantiles are interpolated inside a fine bin and are
+therefore accurate to ``(max - min) / FINE_BINS``.
+
+``summarize`` builds the aggregates of several columns; ``page`` slices a
+table for paginated display.
+"""
+import numpy as np
+import pandas as pd
+
+from ai_readiness.batch import SCORE_COLUMNS
+
+FINE_BINS = 4096
+DEFAULT_CHUNK_ROWS = 1_000_000
+
+
+class ColumnAggregate:
+    def __init__(self, low, high, fine_bins=FINE_BINS):
+        if not np.isfinite(low) or not np.isfinite(high):
+            raise ValueError("Aggregate range must be finite")
+        if high <= low:
+            high = low + 1.0
+        self.low, self.high = float(low), float(high)
+        self.counts = np.zeros(fine_bins, dtype=np.int64)
+        self.n_missing = 0
+        self.n_infinite = 0
+        self.mean = 0.0
+        self.squared_deviations = 0.0
+        self.minimum = np.inf
+        self.maximum = -np.inf
+
+    @property
+    def fine_bins(self):
+        return len(self.counts)
+
+    @property
+    def count(self):
+        return int(self.counts.sum())
+
+    @property
+    def edges(self):
+        return np.linspace(self.low, self.high, self.fine_bins + 1)
+
+    def update(self, values):
+        """Add ``values``; NaNs and infinities are only counted, finite values outside the range go to the end bins."""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        finite = np.isfinite(values)
+        if not finite.all():
+            missing = int(np.isnan(values).sum())
+            self.n_missing += missing
+            self.n_infinite += int(values.size - finite.sum()) - missing
+            values = values[finite]
+        if not values.size:
+            return self
+        previous = self.count
+        scaled = (values - self.low) * (self.fine_bins / (self.high - self.low))
+        index = np.clip(scaled.astype(np.int64), 0, self.fine_bins - 1)
+        self.counts += np.bincount(index, minlength=self.fine_bins)
+
+        # Chan et al.: merge the chunk's mean and squared deviations into the running ones.
+        n = values.size
+        chunk_mean = float(values.mean())
+        deviations = values - chunk_mean
+        chunk_squared_deviations = float(np.dot(deviations, deviations))
+        total = previous + n
+        delta = chunk_mean - self.mean
+        self.mean += delta * n / total
+        self.squared_deviations += chunk_squared_deviations + delta * delta * previous * n / total
+
+        self.minimum = min(self.minimum, float(values.min()))
+        self.maximum = max(self.maximum, float(values.max()))
+        return self
+
+    def stats(self):
+        count = self.count
+        variance = self.squared_deviations / count if count else np.nan
+        return {
+            'count': count, 'missing': self.n_missing, 'infinite': self.n_infinite,
+            'mean': self.mean if count else np.nan, 'std': float(np.sqrt(variance)),
+            'min': self.minimum if count else np.nan, 'max': self.maximum if count else np.nan,
+        }
+
+    def histogram(self, bins=50):
+        """Return ``bins`` contiguous bins (``bin_left``, ``bin_right``, ``count``) covering the range."""
+        bins = max(1, min(bins, self.fine_bins))
+        splits = np.linspace(0, self.fine_bins, bins + 1).round().astype(np.int64)
+        edges = self.edges
+        return pd.DataFrame({
+            'bin_left': edges[splits[:-1]],
+            'bin_right': edges[splits[1:]],
+            'count': np.add.reduceat(self.counts, splits[:-1]),
+        })
+
+    def quantiles(self, qs):
+        """Return the ``qs`` quantiles (in ``[0, 1]``) interpolated from the fine bins."""
+        qs = np.asarray(qs, dtype=np.float64)
+        count = self.count
+        if not count:
+            return np.full(qs.shape, np.nan)
+        cumulative = np.concatenate([[0], np.cumsum(self.counts)])
+        positions = np.interp(qs * count, cumulative, self.edges)
+        return np.clip(positions, self.minimum, self.maximum)
+
+    def quantile_bins(self, n_bins=10):
+        """Return ``n_bins`` equal-count bins with their bounds and row counts."""
+        bounds = self.quantiles(np.linspace(0, 1, n_bins + 1))
+        return pd.DataFrame({
+            'bin': np.arange(1, n_bins + 1),
+            'lower': bounds[:-1],
+            'upper': bounds[1:],
+            'count': np.diff(np.linspace(0, self.count, n_bins + 1).round().astype(np.int64)),
+        })
+
+
+def _column(data, column, start, stop):
+    return np.asarray(data[column][start:stop], dtype=np.float64)
+
+
+def summarize(data, columns=SCORE_COLUMNS, ranges=None, chunk_rows=DEFAULT_CHUNK_ROWS, fine_bins=FINE_BINS):
+    """Return ``{column: ColumnAggregate}`` over ``data`` (anything whose ``data[column]`` can be sliced).
+
+    Columns without a ``ranges`` entry take their range from a first min/max
+    pass over the data.
+    """
+    ranges = dict(ranges or {})
+    n_rows = len(data[columns[0]]) if columns else 0
+    for column in columns:
+        if column not in ranges:
+            low, high = np.inf, -np.inf
+            for start in range(0, n_rows, chunk_rows):
+                values = _column(data, column, start, start + chunk_rows)
+                values = values[np.isfinite(values)]
+                if values.size:
+                    low, high = min(low, values.min()), max(high, values.max())
+            ranges[column] = (low, high) if np.isfinite(low) else (0.0, 1.0)
+
+    aggregates = {column: ColumnAggregate(*ranges[column], fine_bins=fine_bins) for column in columns}
+    for start in range(0, n_rows, chunk_rows):
+        for column, aggregate in aggregates.items():
+            aggregate.update(_column(data, column, start, start + chunk_rows))
+    return aggregates
+
+
+def page(frame, page_number, page_size=100):
+    """Return rows of 1-based ``page_number`` and the number of pages."""
+    n_pages = max(1, -(-len(frame) // page_size))
+    page_number = min(max(page_number, 1), n_pages)
+    start = (page_number - 1) * page_size
+    return frame.iloc[start:start + page_size], n_pages
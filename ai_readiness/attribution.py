@@ -0,0 +1,102 @@
+"""Bulk attribution of AI-R to its model components.
+
+AI-R is linear in V^R and H^R apart from the Synergy term, and V^R and H_base
+are weighted sums, so every score splits exactly into additive contributions::
+
+    AI-R = alpha * V^R + (1 - alpha) * H^R + beta * Synergy%
+
+    alpha * V^R       = sum over s1..s4, the domain-expertise components and
+                        the adaptive-capacity sliders of
+                        alpha * w(V^R) * w(component) * value
+    (1 - alpha) * H^R = sum over the H_base components of
+                        (1 - alpha) * w(H_base) * value * growth * regional
+    beta * Synergy%   = a single ``synergy`` contribution
+
+The weights are read off the ``ai_readiness.batch`` functions (by evaluating
+them on unit vectors), so they always match the model. The contributions of a
+person sum to their AI-R up to floating-point rounding.
+"""
+import numpy as np
+import pandas as pd
+
+from ai_readiness import batch
+
+TERMS = ['vr', 'hr', 'synergy']
+
+COMPONENTS = [
+    ('vr', 's1'), ('vr', 's2'), ('vr', 's3'), ('vr', 's4'),
+    ('vr', 'education_foundation'), ('vr', 'practical_experience'), ('vr', 'specialization_depth'),
+    ('vr', 'cognitive_flexibility'), ('vr', 'social_emotional_intelligence'), ('vr', 'strategic_career_management'),
+    ('hr', 'ai_enhancement'), ('hr', 'job_growth_projection'), ('hr', 'wage_premium'), ('hr', 'entry_accessibility'),
+    ('synergy', 'synergy'),
+]
+
+ADAPTIVE_CAPACITY_COLUMNS = ['cognitive_flexibility', 'social_emotional_intelligence', 'strategic_career_management']
+H_BASE_COLUMNS = ['ai_enhancement', 'job_growth_projection', 'wage_premium', 'entry_accessibility']
+
+
+def linear_weights(func, n_arguments):
+    """Return the coefficients of a linear ``func`` by evaluating it on unit vectors."""
+    return np.asarray(func(*np.eye(n_arguments)), dtype=np.float64)
+
+
+def component_weights():
+    """Return the weight of every V^R component in V^R and of every H_base component in H_base."""
+    vr = linear_weights(batch.calculate_idiosyncratic_readiness, 3)
+    ai_fluency = linear_weights(batch.calculate_ai_fluency, 4)
+    domain_expertise = linear_weights(batch.calculate_domain_expertise, 3)
+    adaptive_capacity = linear_weights(batch.calculate_adaptive_capacity, 3)
+    vr_weights = np.concatenate([vr[0] * ai_fluency, vr[1] * domain_expertise, vr[2] * adaptive_capacity])
+    return vr_weights, linear_weights(batch.calculate_base_opportunity_score, 4)
+
+
+def contribution_tensor(profiles, occupation, skills_match_score=0.0, alpha=0.6, beta=0.15, lambda_val=0.3, gamma_val=0.2, max_possible_match=100):
+    """Return the ``(n_profiles, len(COMPONENTS))`` contribution array and the AI-R scores.
+
+    ``occupation`` and ``skills_match_score`` are interpreted as in
+    ``batch.score_population``. ``alpha`` and ``beta`` may be scalars or
+    per-profile arrays.
+    """
+    vr = batch.compute_vr_components(profiles)
+    hr = batch.compute_hr_components(occupation, lambda_val, gamma_val)
+    n = len(vr)
+    alpha = np.asarray(alpha, dtype=np.float64)
+    beta = np.asarray(beta, dtype=np.float64)
+    vr_weights, h_base_weights = component_weights()
+
+    vr_values = np.column_stack(
+        [vr[name].to_numpy() for name in ['s1', 's2', 's3', 's4', 'education_foundation', 'practical_experience', 'specialization_depth']]
+        + [np.asarray(profiles[name], dtype=np.float64) for name in ADAPTIVE_CAPACITY_COLUMNS]
+    )
+    multiplier = np.broadcast_to((hr['growth_multiplier'] * hr['regional_multiplier']).to_numpy(), (n,))
+    h_base_values = np.broadcast_to(hr[H_BASE_COLUMNS].to_numpy(), (n, len(H_BASE_COLUMNS)))
+    vr_score = vr['vr_score'].to_numpy()
+    hr_score = np.broadcast_to(hr['hr_score'].to_numpy(), (n,))
+    _, synergy_percentage, ai_r_score = batch.combine_scores(vr_score, hr_score, profiles['years_experience'], skills_match_score, alpha, beta, max_possible_match)
+
+    n_vr = len(vr_weights)
+    contributions = np.empty((n, len(COMPONENTS)))
+    np.multiply(vr_values, vr_weights, out=contributions[:, :n_vr])
+    contributions[:, :n_vr] *= alpha[..., None]
+    np.multiply(h_base_values, h_base_weights, out=contributions[:, n_vr:-1])
+    contributions[:, n_vr:-1] *= ((1 - alpha) * multiplier)[:, None]
+    contributions[:, -1] = beta * synergy_percentage
+    return contributions, ai_r_score
+
+
+def attribute(profiles, occupation, skills_match_score=0.0, alpha=0.6, beta=0.15, lambda_val=0.3, gamma_val=0.2, max_possible_match=100):
+    """Return every profile's AI-R contributions as a DataFrame with ``(term, component)`` columns.
+
+    ``frame['vr']`` selects the V^R contributions and ``term_totals(frame)``
+    the three AI-R terms.
+    """
+    contributions, _ = contribution_tensor(profiles, occupation, skills_match_score, alpha, beta, lambda_val, gamma_val, max_possible_match)
+    frame = pd.DataFrame(contributions, columns=pd.MultiIndex.from_tuples(COMPONENTS, names=['term', 'component']))
+    if isinstance(profiles, pd.DataFrame):
+        frame.index = profiles.index
+    return frame
+
+
+def term_totals(frame):
+    """Sum an ``attribute`` frame to the alpha*V^R, (1-alpha)*H^R and beta*Synergy% terms."""
+    return pd.DataFrame({term: frame[term].sum(axis=1) for term in TERMS}, index=frame.index)
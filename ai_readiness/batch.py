@@ -0,0 +1,269 @@
+"""Column-wise AI-R scoring for whole populations.
+
+Every function mirrors the scalar ``calculate_*`` function of the same name in
+``ai_readiness.model`` but operates on NumPy arrays, so a roster of
+profiles is scored in a handful of vectorized passes. The zero-denominator
+guards of the scalar versions are reproduced with masks, and the arithmetic is
+performed in the same order so the results are identical to the scalar path.
+
+Inputs may be a ``pandas.DataFrame``, a dict of arrays or a structured NumPy
+array; anything that supports ``data[column]`` works.
+"""
+import numpy as np
+import pandas as pd
+
+from ai_readiness.encoding import EDUCATION, EDUCATION_FOUNDATION_TABLE
+
+PROFILE_COLUMNS = [
+    'prompting_score', 'tools_score', 'understanding_score', 'datalit_score',
+    'output_quality_with_ai', 'output_quality_without_ai',
+    'time_without_ai', 'time_with_ai', 'errors_caught',
+    'total_ai_errors', 'appropriate_trust_decisions',
+    'total_decisions', 'delta_proficiency',
+    'delta_t_hours_invested', 'education_level',
+    'years_experience', 'portfolio_score', 'recognition_score',
+    'credentials_score', 'cognitive_flexibility',
+    'social_emotional_intelligence', 'strategic_career_management',
+]
+
+OCCUPATION_COLUMNS = [
+    'ai_enhancement_score', 'job_growth_rate_g', 'ai_skilled_wage', 'median_wage',
+    'education_years_required', 'experience_years_required',
+    'current_job_postings', 'previous_job_postings', 'remote_work_factor',
+    'local_demand', 'national_avg_demand',
+]
+
+SCORE_COLUMNS = ['vr_score', 'hr_score', 'synergy_percentage', 'ai_r_score']
+
+
+def _as_float(values):
+    return np.asarray(values, dtype=np.float64)
+
+
+def _has_column(data, name):
+    names = getattr(getattr(data, 'dtype', None), 'names', None)
+    return name in (names or data)
+
+
+def safe_divide(numerator, denominator):
+    numerator, denominator = np.broadcast_arrays(_as_float(numerator), _as_float(denominator))
+    out = np.zeros(numerator.shape, dtype=np.float64)
+    np.divide(numerator, denominator, out=out, where=denominator != 0)
+    return out
+
+
+def _power(base, exponent):
+    # np.power may differ from Python's ``**`` in the last ulp, so evaluate it
+    # once per distinct base to stay bit-identical with the scalar functions.
+    base = _as_float(base)
+    unique, inverse = np.unique(base, return_inverse=True)
+    powered = np.fromiter((b ** exponent for b in unique.tolist()), dtype=np.float64, count=unique.size)
+    return powered[inverse].reshape(base.shape)
+
+
+def calculate_technical_ai_skills(prompting, tools, understanding, data_lit):
+    return (_as_float(prompting) + _as_float(tools) + _as_float(understanding) + _as_float(data_lit)) / 4
+
+
+def calculate_ai_augmented_productivity(output_quality_with_ai, output_quality_without_ai, time_without_ai, time_with_ai):
+    output_quality_without_ai = _as_float(output_quality_without_ai)
+    time_with_ai = _as_float(time_with_ai)
+    valid = (output_quality_without_ai != 0) & (time_with_ai != 0)
+    return np.where(valid, safe_divide(output_quality_with_ai, output_quality_without_ai) * safe_divide(time_without_ai, time_with_ai), 0.0)
+
+
+def calculate_critical_ai_judgment(errors_caught, total_ai_errors, appropriate_trust_decisions, total_decisions):
+    no_errors = _as_float(total_ai_errors) == 0
+    no_decisions = _as_float(total_decisions) == 0
+    caught_rate = safe_divide(errors_caught, total_ai_errors)
+    trust_rate = safe_divide(appropriate_trust_decisions, total_decisions)
+    return np.select(
+        [no_errors & no_decisions, no_errors, no_decisions],
+        [0.0, 1 - trust_rate / 2, 1 - caught_rate / 2],
+        default=1 - (caught_rate + trust_rate) / 2,
+    )
+
+
+def calculate_ai_learning_velocity(delta_proficiency, delta_t_hours_invested):
+    return safe_divide(delta_proficiency, delta_t_hours_invested)
+
+
+def calculate_ai_fluency(s1, s2, s3, s4):
+    return 0.1 * _as_float(s1) + 0.2 * _as_float(s2) + 0.3 * _as_float(s3) + 0.4 * _as_float(s4)
+
+
+def calculate_education_foundation(education_level):
+    # Unlike the scalar version, levels outside EDUCATION_LEVELS raise instead of scoring 0.0.
+    return EDUCATION_FOUNDATION_TABLE[EDUCATION.encode(education_level)]
+
+
+def calculate_practical_experience(years_experience, gamma=0.15):
+    years_experience = _as_float(years_experience)
+    return years_experience / (years_experience + (1 / gamma))
+
+
+def calculate_specialization_depth(portfolio_score, recognition_score, credentials_score):
+    return (_as_float(portfolio_score) + _as_float(recognition_score) + _as_float(credentials_score)) / 3
+
+
+def calculate_domain_expertise(education_foundation, practical_experience, specialization_depth):
+    return 0.125 * _as_float(education_foundation) + 0.25 * _as_float(practical_experience) + 0.625 * _as_float(specialization_depth)
+
+
+def calculate_adaptive_capacity(cognitive_flexibility, social_emotional_intelligence, strategic_career_management):
+    return (_as_float(cognitive_flexibility) + _as_float(social_emotional_intelligence) + _as_float(strategic_career_management)) / 3
+
+
+def calculate_idiosyncratic_readiness(ai_fluency, domain_expertise, adaptive_capacity, w1=0.45, w2=0.35, w3=0.20):
+    return (w1 * _as_float(ai_fluency)) + (w2 * _as_float(domain_expertise)) + (w3 * _as_float(adaptive_capacity))
+
+
+def calculate_ai_enhancement_potential(ai_enhancement_score):
+    return _as_float(ai_enhancement_score)
+
+
+def calculate_job_growth_projection(growth_rate_g):
+    score = 50 + (_as_float(growth_rate_g) * 100)
+    return np.trunc(np.clip(score, 0, 100))
+
+
+def calculate_wage_premium(ai_skilled_wage, median_wage):
+    return safe_divide(_as_float(ai_skilled_wage) - _as_float(median_wage), median_wage)
+
+
+def calculate_entry_accessibility(education_years_required, experience_years_required):
+    return 1 / (1 + 0.1 * (_as_float(education_years_required) + _as_float(experience_years_required)))
+
+
+def calculate_base_opportunity_score(ai_enhancement, job_growth_normalized, wage_premium, entry_accessibility, w1=0.30, w2=0.30, w3=0.25, w4=0.15):
+    return (w1 * _as_float(ai_enhancement) +
+            w2 * _as_float(job_growth_normalized) +
+            w3 * _as_float(wage_premium) +
+            w4 * _as_float(entry_accessibility))
+
+
+def calculate_growth_multiplier(current_job_postings, previous_job_postings, lambda_val=0.3):
+    previous_job_postings = _as_float(previous_job_postings)
+    return np.where(previous_job_postings == 0, 1.0, _power(safe_divide(current_job_postings, previous_job_postings), lambda_val))
+
+
+def calculate_regional_multiplier(local_demand, national_avg_demand, remote_work_factor, gamma=0.2):
+    national_avg_demand = _as_float(national_avg_demand)
+    return np.where(national_avg_demand == 0, 1.0, 1 + gamma * (safe_divide(local_demand, national_avg_demand) + _as_float(remote_work_factor) - 1))
+
+
+def calculate_systematic_opportunity(h_base, growth_multiplier, regional_multiplier):
+    return _as_float(h_base) * _as_float(growth_multiplier) * _as_float(regional_multiplier)
+
+
+def calculate_timing_factor(years_experience):
+    years_experience = _as_float(years_experience)
+    return np.where(years_experience <= 0, 1.0, 1 + (years_experience / 5))
+
+
+def calculate_alignment_factor(skills_match_score, max_possible_match, timing_factor):
+    max_possible_match = _as_float(max_possible_match)
+    return np.where(max_possible_match == 0, 0.0, safe_divide(skills_match_score, max_possible_match) * _as_float(timing_factor))
+
+
+def calculate_synergy_percentage(vr_score, hr_score, alignment_factor):
+    return (_as_float(vr_score) * _as_float(hr_score) * _as_float(alignment_factor)) / 100.0
+
+
+def calculate_ai_readiness_score(vr_score, hr_score, synergy_percentage, alpha, beta):
+    return alpha * _as_float(vr_score) + (1-alpha) * _as_float(hr_score) + beta * _as_float(synergy_percentage)
+
+
+def compute_vr_components(profiles):
+    """Return V^R and its intermediate subscores for every profile as a DataFrame.
+
+    A precomputed ``education_foundation`` column takes precedence over
+    ``education_level``.
+    """
+    s1 = calculate_technical_ai_skills(profiles['prompting_score'], profiles['tools_score'], profiles['understanding_score'], profiles['datalit_score'])
+    s2 = calculate_ai_augmented_productivity(profiles['output_quality_with_ai'], profiles['output_quality_without_ai'], profiles['time_without_ai'], profiles['time_with_ai'])
+    s3 = calculate_critical_ai_judgment(profiles['errors_caught'], profiles['total_ai_errors'], profiles['appropriate_trust_decisions'], profiles['total_decisions'])
+    s4 = calculate_ai_learning_velocity(profiles['delta_proficiency'], profiles['delta_t_hours_invested'])
+    ai_fluency = calculate_ai_fluency(s1, s2, s3, s4)
+
+    if _has_column(profiles, 'education_foundation'):
+        education_foundation = _as_float(profiles['education_foundation'])
+    else:
+        education_foundation = calculate_education_foundation(profiles['education_level'])
+    practical_experience = calculate_practical_experience(profiles['years_experience'])
+    specialization_depth = calculate_specialization_depth(profiles['portfolio_score'], profiles['recognition_score'], profiles['credentials_score'])
+    domain_expertise = calculate_domain_expertise(education_foundation, practical_experience, specialization_depth)
+
+    adaptive_capacity = calculate_adaptive_capacity(profiles['cognitive_flexibility'], profiles['social_emotional_intelligence'], profiles['strategic_career_management'])
+
+    return pd.DataFrame({
+        's1': s1, 's2': s2, 's3': s3, 's4': s4,
+        'ai_fluency': ai_fluency,
+        'education_foundation': education_foundation,
+        'practical_experience': practical_experience,
+        'specialization_depth': specialization_depth,
+        'domain_expertise': domain_expertise,
+        'adaptive_capacity': adaptive_capacity,
+        'vr_score': calculate_idiosyncratic_readiness(ai_fluency, domain_expertise, adaptive_capacity),
+    })
+
+
+def compute_hr_components(occupations, lambda_val=0.3, gamma_val=0.2):
+    """Return H^R and its intermediate subscores for every occupation row as a DataFrame."""
+    ai_enhancement = calculate_ai_enhancement_potential(occupations['ai_enhancement_score'])
+    job_growth_projection = calculate_job_growth_projection(occupations['job_growth_rate_g'])
+    wage_premium = calculate_wage_premium(occupations['ai_skilled_wage'], occupations['median_wage'])
+    entry_accessibility = calculate_entry_accessibility(occupations['education_years_required'], occupations['experience_years_required'])
+    h_base = calculate_base_opportunity_score(ai_enhancement, job_growth_projection, wage_premium, entry_accessibility)
+
+    growth_multiplier = calculate_growth_multiplier(occupations['current_job_postings'], occupations['previous_job_postings'], lambda_val)
+    regional_multiplier = calculate_regional_multiplier(occupations['local_demand'], occupations['national_avg_demand'], occupations['remote_work_factor'], gamma_val)
+
+    return pd.DataFrame({
+        'ai_enhancement': np.atleast_1d(ai_enhancement),
+        'job_growth_projection': np.atleast_1d(job_growth_projection),
+        'wage_premium': np.atleast_1d(wage_premium),
+        'entry_accessibility': np.atleast_1d(entry_accessibility),
+        'h_base': np.atleast_1d(h_base),
+        'growth_multiplier': np.atleast_1d(growth_multiplier),
+        'regional_multiplier': np.atleast_1d(regional_multiplier),
+        'hr_score': np.atleast_1d(calculate_systematic_opportunity(h_base, growth_multiplier, regional_multiplier)),
+    })
+
+
+def combine_scores(vr_score, hr_score, years_experience, skills_match_score=0.0, alpha=0.6, beta=0.15, max_possible_match=100):
+    """Return the alignment factor, Synergy% and AI-R for precomputed V^R and H^R."""
+    timing_factor = calculate_timing_factor(years_experience)
+    alignment_factor = calculate_alignment_factor(skills_match_score, max_possible_match, timing_factor)
+    synergy_percentage = calculate_synergy_percentage(vr_score, hr_score, alignment_factor)
+    ai_r_score = calculate_ai_readiness_score(vr_score, hr_score, synergy_percentage, alpha, beta)
+    return alignment_factor, synergy_percentage, ai_r_score
+
+
+def score_population(profiles, occupation, skills_match_score=0.0, alpha=0.6, beta=0.15, lambda_val=0.3, gamma_val=0.2, max_possible_match=100):
+    """Score every profile against ``occupation``.
+
+    ``occupation`` is either a single occupation record (a row of
+    ``occupational_data_df`` or a dict) applied to everyone, or an occupation
+    table aligned row-for-row with ``profiles``. ``skills_match_score`` is a
+    scalar or a per-profile array of values from ``calculate_skills_match_score``.
+    """
+    hr_score = compute_hr_components(occupation, lambda_val, gamma_val)['hr_score'].to_numpy()
+    return score_profiles_with_hr(profiles, hr_score, skills_match_score, alpha, beta, max_possible_match)
+
+
+def score_profiles_with_hr(profiles, hr_score, skills_match_score=0.0, alpha=0.6, beta=0.15, max_possible_match=100):
+    """Score every profile against an already computed H^R (scalar or per-profile array)."""
+    vr = compute_vr_components(profiles)
+    vr_score = vr['vr_score'].to_numpy()
+    hr_score = _as_float(hr_score)
+    alignment_factor, synergy_percentage, ai_r_score = combine_scores(vr_score, hr_score, profiles['years_experience'], skills_match_score, alpha, beta, max_possible_match)
+
+    result = vr[['ai_fluency', 'domain_expertise', 'adaptive_capacity', 'vr_score']].copy()
+    result['hr_score'] = np.broadcast_to(hr_score, vr_score.shape)
+    result['alignment_factor'] = alignment_factor
+    result['synergy_percentage'] = synergy_percentage
+    result['ai_r_score'] = ai_r_score
+    if isinstance(profiles, pd.DataFrame):
+        result.index = profiles.index
+    return result
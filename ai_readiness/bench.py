@@ -0,0 +1,497 @@
+"""Throughput and latency benchmarks for the AI-R model.
+
+Four groups of benchmarks run at every population size (1 to 10^7 by default):
+
+* ``functions``: every ``calculate_*`` function on its own;
+* ``skills``: ``calculate_skills_match_score`` as the number of skills grows;
+* ``pipeline``: the full page1 computation (the score graph per profile, or
+  ``batch.score_profiles_with_hr`` for a whole population);
+* ``pathway``: ``simulate_pathway_impact``.
+
+Each one is measured for the scalar implementation in ``ai_readiness.model``
+and for the batched one (``ai_readiness.batch``, ``SkillMatchIndex``,
+``monte_carlo.simulate_pathway_impact``). A fifth group, ``scaling``, only
+runs when asked for: it times ``parallel.ParallelScorer.score`` (process pool
+start-up included) for every ``--workers`` count, and the results document
+lists its speedup and efficiency against one worker under ``scaling``. Profiles come from
+``ai_readiness.synthetic``. Sizes above ``--chunk-rows`` are processed as
+repeated chunks so memory stays bounded. The scalar implementations are timed
+on at most ``--scalar-rows`` rows and scaled to the full size;
+``measured_rows`` in each record says how many rows were actually timed.
+
+Results are written as JSON: one record per (benchmark, implementation, size)
+with ``seconds``, ``rows_per_second`` and ``ns_per_row``, plus scalar/batch
+speedups. Every timing is the median of ``--repeat`` timing loops. Passing
+``--baseline`` with an earlier results file reports every record whose
+throughput dropped by more than ``--tolerance`` and exits with status 1.
+Records whose measured call took less than ``--gate-min-time`` seconds in the
+baseline are not gated: at that scale call overhead and timer noise move
+throughput by more than the tolerance between identical runs. ``--rounds``
+repeats the whole suite, keeps each record's median round and records the
+range over all rounds; a drop is only reported when the two runs' ranges do
+not overlap. This keeps slow spells of a shared or throttled machine, which
+last seconds, from failing the check.
+
+Usage::
+
+    python -m ai_readiness.bench --output bench.json
+    python -m ai_readiness.bench --benchmarks functions --sizes 1 1000 1000000 --rounds 3 --baseline bench.json
+    python -m ai_readiness.bench --benchmarks scaling --sizes 1000000 --workers 1 2 4 8
+"""
+import argparse
+import datetime
+import itertools
+import json
+import math
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from ai_readiness import batch, model, monte_carlo, parallel, synthetic
+from ai_readiness.hr_table import OccupationHRTable
+from ai_readiness.reference_data import OCCUPATION_REQUIRED_SKILLS_DATA, OCCUPATIONAL_DATA
+from ai_readiness.skills_index import SkillMatchIndex
+
+BENCHMARKS = ['functions', 'skills', 'pipeline', 'pathway', 'scaling']
+DEFAULT_BENCHMARKS = BENCHMARKS[:4]
+IMPLEMENTATIONS = ['scalar', 'batch']
+DEFAULT_SIZES = [10 ** i for i in range(8)]
+DEFAULT_SKILL_COUNTS = [1, 10, 100, 1000]
+SCALAR_ROWS = 1_000
+CHUNK_ROWS = 1_000_000
+# Batched skills matching is bounded by person-skill pairs rather than persons.
+SKILL_PAIRS_MAX = 2_000_000
+REPEAT = 7
+GATE_MIN_TIME = 1e-3
+
+FUNCTION_ARGUMENTS = {
+    'calculate_technical_ai_skills': ['prompting_score', 'tools_score', 'understanding_score', 'datalit_score'],
+    'calculate_ai_augmented_productivity': ['output_quality_with_ai', 'output_quality_without_ai', 'time_without_ai', 'time_with_ai'],
+    'calculate_critical_ai_judgment': ['errors_caught', 'total_ai_errors', 'appropriate_trust_decisions', 'total_decisions'],
+    'calculate_ai_learning_velocity': ['delta_proficiency', 'delta_t_hours_invested'],
+    'calculate_ai_fluency': ['s1', 's2', 's3', 's4'],
+    'calculate_education_foundation': ['education_level'],
+    'calculate_practical_experience': ['years_experience'],
+    'calculate_specialization_depth': ['portfolio_score', 'recognition_score', 'credentials_score'],
+    'calculate_domain_expertise': ['education_foundation', 'practical_experience', 'specialization_depth'],
+    'calculate_adaptive_capacity': ['cognitive_flexibility', 'social_emotional_intelligence', 'strategic_career_management'],
+    'calculate_idiosyncratic_readiness': ['ai_fluency', 'domain_expertise', 'adaptive_capacity'],
+    'calculate_ai_enhancement_potential': ['ai_enhancement_score'],
+    'calculate_job_growth_projection': ['job_growth_rate_g'],
+    'calculate_wage_premium': ['ai_skilled_wage', 'median_wage'],
+    'calculate_entry_accessibility': ['education_years_required', 'experience_years_required'],
+    'calculate_base_opportunity_score': ['ai_enhancement', 'job_growth_projection', 'wage_premium', 'entry_accessibility'],
+    'calculate_growth_multiplier': ['current_job_postings', 'previous_job_postings', 'lambda_val'],
+    'calculate_regional_multiplier': ['local_demand', 'national_avg_demand', 'remote_work_factor', 'gamma_val'],
+    'calculate_systematic_opportunity': ['h_base', 'growth_multiplier', 'regional_multiplier'],
+    'calculate_timing_factor': ['years_experience'],
+    'calculate_alignment_factor': ['skills_match_score', 'max_possible_skills_match', 'timing_factor'],
+    'calculate_synergy_percentage': ['vr_score', 'hr_score', 'alignment_factor'],
+    'calculate_ai_readiness_score': ['vr_score', 'hr_score', 'synergy_percentage', 'alpha', 'beta'],
+}
+
+PATHWAY_ARGUMENTS = ['ai_fluency', 'domain_expertise', 'adaptive_capacity', 'impact_ai_fluency', 'impact_domain_expertise', 'impact_adaptive_capacity', 'completion_score', 'mastery_score']
+
+
+def synthetic_inputs(n_rows, seed=0):
+    """Return a dict of ``n_rows`` values for every model input and intermediate."""
+    rng = np.random.default_rng(seed)
+    profiles = synthetic.profiles(rng, n_rows)
+    data = {column: profiles[column].to_numpy() for column in batch.PROFILE_COLUMNS}
+
+    occupations = pd.DataFrame(OCCUPATIONAL_DATA)
+    data['target_occupation'] = rng.choice(occupations['occupation_name'].to_numpy(), n_rows)
+    rows = occupations.set_index('occupation_name').loc[data['target_occupation']]
+    for column in batch.OCCUPATION_COLUMNS:
+        data[column] = rows[column].to_numpy()
+
+    # Global parameters are scalars, as on page1.
+    data['lambda_val'] = 0.3
+    data['gamma_val'] = 0.2
+    data['alpha'] = 0.6
+    data['beta'] = 0.15
+    data['max_possible_skills_match'] = 100
+    data['skills_match_score'] = rng.uniform(0, 100, n_rows)
+    data['completion_score'] = rng.random(n_rows)
+    data['mastery_score'] = rng.random(n_rows)
+    for column in ('impact_ai_fluency', 'impact_domain_expertise', 'impact_adaptive_capacity'):
+        data[column] = rng.uniform(0.0, 0.2, n_rows)
+
+    vr = batch.compute_vr_components(data)
+    hr = batch.compute_hr_components(data)
+    for frame in (vr, hr):
+        for column in frame.columns:
+            data[column] = frame[column].to_numpy()
+    data['timing_factor'] = batch.calculate_timing_factor(data['years_experience'])
+    data['alignment_factor'] = batch.calculate_alignment_factor(data['skills_match_score'], 100, data['timing_factor'])
+    data['synergy_percentage'] = batch.calculate_synergy_percentage(data['vr_score'], data['hr_score'], data['alignment_factor'])
+    return data
+
+
+def _slice(data, n_rows):
+    return {column: values[:n_rows] if np.ndim(values) else values for column, values in data.items()}
+
+
+def _rows(data, columns):
+    return list(zip(*(data[column].tolist() if np.ndim(data[column]) else itertools.repeat(data[column]) for column in columns)))
+
+
+def measure(func, min_time=0.05, repeat=REPEAT):
+    """Return the median time of one ``func()`` call over ``repeat`` timing loops."""
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    timings = [elapsed / number]
+    for _ in range(repeat - 1):
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter() - started) / number)
+    return float(np.median(timings))
+
+
+def _record(benchmark, impl, size, seconds, measured_rows, **extra):
+    # ``seconds`` covers ``measured_rows`` rows and is scaled to ``size``.
+    seconds = seconds * size / measured_rows
+    return {
+        'benchmark': benchmark, 'impl': impl, 'size': size, **extra,
+        'measured_rows': measured_rows,
+        'seconds': seconds,
+        'rows_per_second': size / seconds if seconds else math.inf,
+        'ns_per_row': seconds * 1e9 / size,
+    }
+
+
+def default_worker_counts():
+    """Return 1, 2, 4, ... up to the number of cores, and the number of cores itself."""
+    cores = os.cpu_count() or 1
+    return sorted({2 ** i for i in range(cores.bit_length()) if 2 ** i <= cores} | {cores})
+
+
+def _key(record):
+    return record['benchmark'], record['impl'], record['size'], record.get('skills'), record.get('workers')
+
+
+def _chunked(func, size, chunk_rows):
+    chunks = math.ceil(size / chunk_rows)
+    return (lambda: [func() for _ in range(chunks)]), chunks * min(size, chunk_rows)
+
+
+def _skills_tables(n_skills, n_persons, rng):
+    skill_names = np.array([f'skill_{i}' for i in range(2 * n_skills)])
+    required = pd.DataFrame({
+        'skill_name': skill_names[:n_skills],
+        'required_skill_score': rng.integers(50, 101, n_skills),
+        'skill_importance': rng.random(n_skills),
+    })
+    # Each person holds n_skills skills, about half of them required ones.
+    held = np.argsort(rng.random((n_persons, 2 * n_skills)), axis=1)[:, :n_skills]
+    individual = pd.DataFrame({
+        'user_id': np.repeat(np.arange(n_persons), n_skills),
+        'skill_name': skill_names[held.ravel()],
+        'individual_skill_score': rng.integers(0, 101, n_persons * n_skills),
+    })
+    return required, individual
+
+
+class _Runner:
+    """Shared state of one benchmark run.
+
+    Scalar implementations cost the same per row at any size, so they are
+    timed on at most ``scalar_rows`` rows; a timing is reused by every larger
+    size.
+    """
+
+    def __init__(self, data, impls, chunk_rows, scalar_rows, min_time, repeat, worker_counts=(1,)):
+        self.data = data
+        self.worker_counts = worker_counts
+        self.impls = impls
+        self.chunk_rows = chunk_rows
+        self.scalar_rows = scalar_rows
+        self.min_time = min_time
+        self.repeat = repeat
+        self._scalar_timings = {}
+
+    def measure(self, func):
+        return measure(func, self.min_time, self.repeat)
+
+    def scalar(self, key, n_rows, make_func):
+        key = (key, n_rows)
+        if key not in self._scalar_timings:
+            self._scalar_timings[key] = self.measure(make_func())
+        return self._scalar_timings[key]
+
+    def functions(self, size):
+        records = []
+        chunk = _slice(self.data, min(size, self.chunk_rows))
+        scalar_chunk = _slice(self.data, min(size, self.scalar_rows))
+        for name, columns in FUNCTION_ARGUMENTS.items():
+            if 'scalar' in self.impls:
+                def make_func(scalar=getattr(model, name), rows=_rows(scalar_chunk, columns)):
+                    return lambda: [scalar(*row) for row in rows]
+                n_rows = min(size, self.scalar_rows)
+                records.append(_record(name, 'scalar', size, self.scalar(name, n_rows, make_func), n_rows))
+            if 'batch' in self.impls:
+                vectorized = getattr(batch, name)
+                arrays = [chunk[column] for column in columns]
+                func, measured_rows = _chunked(lambda: vectorized(*arrays), size, self.chunk_rows)
+                records.append(_record(name, 'batch', size, self.measure(func), measured_rows))
+        return records
+
+    def skills(self, size, skill_counts, seed=0):
+        records = []
+        rng = np.random.default_rng(seed)
+        for n_skills in skill_counts:
+            n_persons = min(size, max(1, SKILL_PAIRS_MAX // n_skills))
+            required, individual = _skills_tables(n_skills, n_persons, rng)
+            if 'scalar' in self.impls:
+                n_rows = min(n_persons, self.scalar_rows)
+
+                def make_func():
+                    persons = [frame for _, frame in individual[individual['user_id'] < n_rows].groupby('user_id', sort=True)]
+                    return lambda: [model.calculate_skills_match_score(frame, required) for frame in persons]
+
+                seconds = self.scalar(('calculate_skills_match_score', n_skills), n_rows, make_func)
+                records.append(_record('calculate_skills_match_score', 'scalar', size, seconds, n_rows, skills=n_skills))
+            if 'batch' in self.impls:
+                index = SkillMatchIndex(required, occupation_column=None)
+                person_ids = np.arange(n_persons)
+                seconds = self.measure(lambda: index.match_scores(index.encode_individual_skills(individual, person_ids)))
+                records.append(_record('calculate_skills_match_score', 'batch', size, seconds, n_persons, skills=n_skills))
+        return records
+
+    def pipeline(self, size):
+        records = []
+        hr_table = OccupationHRTable(pd.DataFrame(OCCUPATIONAL_DATA))
+        if 'scalar' in self.impls:
+            n_rows = min(size, self.scalar_rows)
+
+            def make_func():
+                graph = model.build_score_graph(hr_table, pd.DataFrame(OCCUPATION_REQUIRED_SKILLS_DATA))
+                individual_skills = pd.DataFrame({'skill_name': ['Python', 'Data Visualization', 'Machine Learning'], 'individual_skill_score': [70, 60, 40]})
+                fixed = {'individual_skills': individual_skills}
+                columns = [name for name in model.SCORE_GRAPH_INPUTS if name not in fixed]
+                profiles = [dict(zip(columns, row), **fixed) for row in _rows(_slice(self.data, n_rows), columns)]
+
+                def run():
+                    for profile in profiles:
+                        graph.update(profile)
+                        graph.evaluate(['ai_r_score'])
+                return run
+
+            records.append(_record('page1_pipeline', 'scalar', size, self.scalar('page1_pipeline', n_rows, make_func), n_rows))
+        if 'batch' in self.impls:
+            chunk = _slice(self.data, min(size, self.chunk_rows))
+            profiles = pd.DataFrame({column: chunk[column] for column in batch.PROFILE_COLUMNS})
+
+            def run():
+                hr_score = hr_table.hr_scores(chunk['lambda_val'], chunk['gamma_val'])[hr_table.positions(chunk['target_occupation'])]
+                batch.score_profiles_with_hr(profiles, hr_score, chunk['skills_match_score'], chunk['alpha'], chunk['beta'], chunk['max_possible_skills_match'])
+
+            func, measured_rows = _chunked(run, size, self.chunk_rows)
+            records.append(_record('page1_pipeline', 'batch', size, self.measure(func), measured_rows))
+        return records
+
+    def pathway(self, size):
+        records = []
+        if 'scalar' in self.impls:
+            n_rows = min(size, self.scalar_rows)
+
+            def make_func():
+                rows = _rows(_slice(self.data, n_rows), PATHWAY_ARGUMENTS)
+                return lambda: [model.simulate_pathway_impact(af, de, ac, None, *rest) for af, de, ac, *rest in rows]
+
+            records.append(_record('simulate_pathway_impact', 'scalar', size, self.scalar('simulate_pathway_impact', n_rows, make_func), n_rows))
+        if 'batch' in self.impls:
+            chunk = _slice(self.data, min(size, self.chunk_rows))
+            arrays = [chunk[column] for column in PATHWAY_ARGUMENTS]
+            func, measured_rows = _chunked(lambda: monte_carlo.simulate_pathway_impact(*arrays), size, self.chunk_rows)
+            records.append(_record('simulate_pathway_impact', 'batch', size, self.measure(func), measured_rows))
+        return records
+
+
+    def scaling(self, size):
+        records = []
+        n_rows = min(size, self.chunk_rows)
+        chunk = _slice(self.data, n_rows)
+        occupations = pd.DataFrame(OCCUPATIONAL_DATA)
+        for workers in self.worker_counts:
+            # Four tasks per worker, so no worker sits idle while another finishes a large last task.
+            scorer = parallel.ParallelScorer(occupations, workers=workers, chunk_size=max(1, -(-n_rows // (4 * workers))))
+            func, measured_rows = _chunked(lambda: scorer.score(chunk, chunk['target_occupation']), size, self.chunk_rows)
+            records.append(_record('parallel_score', 'parallel', size, self.measure(func), measured_rows, workers=workers))
+        return records
+
+
+def scaling(records):
+    """Return the speedup and efficiency (speedup / workers) of every ``scaling`` record against one worker."""
+    single = {(r['benchmark'], r['size']): r['seconds'] for r in records if r.get('workers') == 1}
+    found = []
+    for record in records:
+        if 'workers' in record and (record['benchmark'], record['size']) in single:
+            speedup = single[(record['benchmark'], record['size'])] / record['seconds']
+            found.append({'benchmark': record['benchmark'], 'size': record['size'], 'workers': record['workers'],
+                          'speedup': speedup, 'efficiency': speedup / record['workers']})
+    return found
+
+
+def compare(records):
+    """Return the scalar/batch speedup for every benchmark and size measured both ways."""
+    by_key = {}
+    for record in records:
+        key = (record['benchmark'], record['size'], record.get('skills'))
+        if 'workers' not in record:
+            by_key.setdefault(key, {})[record['impl']] = record
+    comparisons = []
+    for (benchmark, size, skills), impls in by_key.items():
+        if 'scalar' in impls and 'batch' in impls:
+            comparison = {'benchmark': benchmark, 'size': size}
+            if skills is not None:
+                comparison['skills'] = skills
+            comparison['speedup'] = impls['scalar']['seconds'] / impls['batch']['seconds']
+            comparisons.append(comparison)
+    return comparisons
+
+
+def measured_seconds(record):
+    """Return the time of the call a record was measured with, before scaling to its size."""
+    return record['seconds'] * record['measured_rows'] / record['size']
+
+
+def regressions(records, baseline_records, tolerance=0.2, min_time=GATE_MIN_TIME):
+    """Return the records whose throughput fell more than ``tolerance`` below ``baseline_records``.
+
+    Records measured in under ``min_time`` seconds per call in the baseline
+    are skipped. When both runs used several ``rounds``, a drop is only
+    reported if every round of the new run is slower than every round of the
+    baseline, so a drop within the spread of the runs is treated as noise.
+    """
+    baseline = {_key(r): r for r in baseline_records}
+    found = []
+    for record in records:
+        previous = baseline.get(_key(record))
+        if previous is None or measured_seconds(previous) < min_time:
+            continue
+        overlaps = record.get('seconds_low', record['seconds']) <= previous.get('seconds_high', previous['seconds'])
+        if record['rows_per_second'] < previous['rows_per_second'] * (1 - tolerance) and not overlaps:
+            found.append({
+                'benchmark': record['benchmark'], 'impl': record['impl'], 'size': record['size'],
+                **{name: record[name] for name in ('skills', 'workers') if name in record},
+                'rows_per_second': record['rows_per_second'], 'baseline_rows_per_second': previous['rows_per_second'],
+                'ratio': record['rows_per_second'] / previous['rows_per_second'],
+            })
+    return found
+
+
+def _median_records(rounds):
+    # Keep, for every record, the round with the median time and the range over all rounds.
+    by_key = {}
+    for records in rounds:
+        for record in records:
+            by_key.setdefault(_key(record), []).append(record)
+    merged = []
+    for found in by_key.values():
+        found = sorted(found, key=lambda record: record['seconds'])
+        merged.append({**found[len(found) // 2], 'seconds_low': found[0]['seconds'], 'seconds_high': found[-1]['seconds']})
+    return merged
+
+
+def run(benchmarks=DEFAULT_BENCHMARKS, sizes=DEFAULT_SIZES, impls=IMPLEMENTATIONS, skill_counts=DEFAULT_SKILL_COUNTS,
+        chunk_rows=CHUNK_ROWS, scalar_rows=SCALAR_ROWS, min_time=0.05, seed=0, progress=None, repeat=REPEAT, rounds=1, worker_counts=None):
+    """Run the selected benchmarks and return the results document.
+
+    With ``rounds`` > 1 the whole suite runs that many times and every record
+    keeps its median round, so a slow spell of the machine affects one round
+    of each record rather than every timing of a few records.
+    """
+    unknown = sorted(set(benchmarks) - set(BENCHMARKS))
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {unknown}")
+    data = synthetic_inputs(min(max(sizes), max(chunk_rows, scalar_rows)), seed)
+    all_rounds = []
+    for _ in range(rounds):
+        runner = _Runner(data, impls, chunk_rows, scalar_rows, min_time, repeat, worker_counts or default_worker_counts())
+        records = []
+        for size in sizes:
+            for benchmark in benchmarks:
+                if benchmark == 'skills':
+                    found = runner.skills(size, skill_counts, seed)
+                else:
+                    found = getattr(runner, benchmark)(size)
+                records.extend(found)
+                if progress is not None:
+                    progress(benchmark, size, found)
+        all_rounds.append(records)
+    records = _median_records(all_rounds)
+    return {
+        'created': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'environment': {
+            'python': platform.python_version(), 'numpy': np.__version__, 'pandas': pd.__version__,
+            'platform': platform.platform(), 'cpu_count': os.cpu_count(),
+        },
+        'config': {'benchmarks': list(benchmarks), 'sizes': list(sizes), 'impls': list(impls), 'skill_counts': list(skill_counts),
+                   'chunk_rows': chunk_rows, 'scalar_rows': scalar_rows, 'min_time': min_time, 'repeat': repeat, 'rounds': rounds, 'seed': seed,
+                   **({'worker_counts': list(worker_counts or default_worker_counts())} if 'scaling' in benchmarks else {})},
+        'results': records,
+        'comparisons': compare(records),
+        **({'scaling': scaling(records)} if 'scaling' in benchmarks else {}),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the AI-R model functions and page pipelines.")
+    parser.add_argument('--benchmarks', nargs='+', choices=BENCHMARKS, default=DEFAULT_BENCHMARKS)
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--impl', choices=['scalar', 'batch', 'both'], default='both')
+    parser.add_argument('--skill-counts', type=int, nargs='+', default=DEFAULT_SKILL_COUNTS)
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS)
+    parser.add_argument('--scalar-rows', type=int, default=SCALAR_ROWS, help="Rows the scalar implementations are timed on")
+    parser.add_argument('--min-time', type=float, default=0.05, help="Minimum seconds per timing loop")
+    parser.add_argument('--repeat', type=int, default=REPEAT, help="Timing loops per measurement; the median is kept")
+    parser.add_argument('--rounds', type=int, default=1, help="Runs of the whole suite; each record keeps its median round")
+    parser.add_argument('--workers', type=int, nargs='+', help="Worker counts for the scaling benchmark (default: 1, 2, 4, ... up to the number of cores)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="Write results JSON here instead of stdout")
+    parser.add_argument('--baseline', help="Earlier results JSON to check for regressions")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="Allowed fractional throughput drop versus --baseline")
+    parser.add_argument('--gate-min-time', type=float, default=GATE_MIN_TIME, help="Skip the --baseline check for records measured in less than this many seconds per call")
+    parser.add_argument('--quiet', action='store_true')
+    args = parser.parse_args(argv)
+
+    def report(benchmark, size, records):
+        for record in records:
+            detail = ''.join(f" {name}={record[name]}" for name in ('skills', 'workers') if name in record)
+            print(f"{record['benchmark']:<38} {record['impl']:<8} n={size:<9,}{detail} {record['ns_per_row']:>12,.1f} ns/row", file=sys.stderr)
+
+    impls = IMPLEMENTATIONS if args.impl == 'both' else [args.impl]
+    results = run(args.benchmarks, args.sizes, impls, args.skill_counts, args.chunk_rows, args.scalar_rows, args.min_time, args.seed,
+                  progress=None if args.quiet else report, repeat=args.repeat, rounds=args.rounds, worker_counts=args.workers)
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            results['regressions'] = regressions(results['results'], json.load(f)['results'], args.tolerance, args.gate_min_time)
+        for found in results['regressions']:
+            print(f"regression: {found['benchmark']} {found['impl']} n={found['size']:,} at {found['ratio']:.0%} of baseline throughput", file=sys.stderr)
+        status = 1 if results['regressions'] else 0
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,180 @@
+"""Memoization of AI-R results keyed on normalized inputs.
+
+``profile_key`` hashes a canonical form of the score inputs, so equal profiles
+produce the same key however they were entered: numbers compare as floats
+(``5 == 5.0``), and an ``individual_skills`` table is reduced to what the
+skills match actually reads, its last score per skill sorted by skill name.
+
+``ResultCache`` is a thread-safe LRU bounded by ``maxsize`` entries over all
+namespaces, with hit, miss and eviction counters per namespace. It is meant to
+be created once per process (``st.cache_resource`` in the app) and shared by
+every session. ``cached_scores`` evaluates a ``build_score_graph`` graph through
+the cache with three namespaces:
+
+* ``ai_r``: every score, keyed on all ``SCORE_GRAPH_INPUTS``;
+* ``vr``: the V^R nodes, keyed on the profile fields only;
+* ``hr``: the H^R nodes, keyed on the occupation, ``lambda_val`` and ``gamma_val``.
+
+The ``hr`` and ``ai_r`` entries depend on the occupation table, so owners of
+an ``OccupationHRTable`` that changes call ``invalidate('hr', 'ai_r')`` from its
+``add_listener`` hook. A miss in ``hr`` always re-reads the table rather than
+trusting the graph's last H^R value.
+"""
+import contextlib
+import hashlib
+import math
+import numbers
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from ai_readiness.metrics import REGISTRY
+from ai_readiness.model import SCORE_GRAPH_INPUTS
+
+VR_INPUTS = SCORE_GRAPH_INPUTS[:SCORE_GRAPH_INPUTS.index('target_occupation')]
+HR_INPUTS = ['target_occupation', 'lambda_val', 'gamma_val']
+VR_NODES = ['s1', 's2', 's3', 's4', 'ai_fluency', 'education_foundation', 'practical_experience', 'specialization_depth', 'domain_expertise', 'adaptive_capacity', 'vr_score']
+HR_NODES = ['hr', 'hr_score']
+SKILL_COLUMNS = ['skill_name', 'individual_skill_score']
+
+DEFAULT_MAXSIZE = 4096
+
+
+def _canonical_skills(frame):
+    skills = frame.dropna(subset=SKILL_COLUMNS).drop_duplicates(subset='skill_name', keep='last').sort_values('skill_name', kind='stable')
+    return tuple((str(name), _canonical(score)) for name, score in zip(skills['skill_name'], skills['individual_skill_score']))
+
+
+def _canonical(value):
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    if isinstance(value, numbers.Real):
+        value = float(value)
+        if math.isnan(value):
+            return 'nan'
+        return value + 0.0  # -0.0 -> 0.0
+    if isinstance(value, pd.DataFrame):
+        if set(SKILL_COLUMNS) <= set(value.columns):
+            return _canonical_skills(value)
+        return (tuple(value.columns), tuple(tuple(map(_canonical, row)) for row in value.itertuples(index=False)))
+    if isinstance(value, dict):
+        return tuple(sorted((str(key), _canonical(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(map(_canonical, value))
+    return repr(value)
+
+
+def profile_key(inputs, names=None):
+    """Return a hex digest identifying ``inputs`` (restricted to ``names``) up to normalization."""
+    names = sorted(inputs if names is None else names)
+    canonical = tuple((name, _canonical(inputs[name])) for name in names)
+    return hashlib.blake2b(repr(canonical).encode(), digest_size=16).hexdigest()
+
+
+class ResultCache:
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _count(self, namespace, counter):
+        counters = self._counters.setdefault(namespace, {'hits': 0, 'misses': 0, 'evictions': 0})
+        counters[counter] += 1
+
+    def get(self, namespace, key, default=None):
+        with self._lock:
+            entry = (namespace, key)
+            if entry in self._entries:
+                self._entries.move_to_end(entry)
+                self._count(namespace, 'hits')
+                return self._entries[entry]
+            self._count(namespace, 'misses')
+            return default
+
+    def put(self, namespace, key, value):
+        with self._lock:
+            self._entries[(namespace, key)] = value
+            self._entries.move_to_end((namespace, key))
+            while len(self._entries) > self.maxsize:
+                (evicted_namespace, _), _ = self._entries.popitem(last=False)
+                self._count(evicted_namespace, 'evictions')
+
+    def get_or_compute(self, namespace, key, compute):
+        """Return the cached value or compute, store and return it.
+
+        ``compute`` runs outside the lock, so two sessions missing the same key
+        at once may both compute it; the results are identical.
+        """
+        missing = object()
+        value = self.get(namespace, key, missing)
+        if value is missing:
+            value = compute()
+            self.put(namespace, key, value)
+        return value
+
+    def stats(self):
+        """Return ``{namespace: {hits, misses, evictions, size, hit_rate}}``."""
+        with self._lock:
+            counters = {namespace: dict(values) for namespace, values in self._counters.items()}
+            for namespace, _ in self._entries:
+                counters.setdefault(namespace, {'hits': 0, 'misses': 0, 'evictions': 0})
+                counters[namespace]['size'] = counters[namespace].get('size', 0) + 1
+        for values in counters.values():
+            values.setdefault('size', 0)
+            lookups = values['hits'] + values['misses']
+            values['hit_rate'] = values['hits'] / lookups if lookups else 0.0
+        return counters
+
+    def invalidate(self, *namespaces):
+        """Drop every entry of ``namespaces`` and return how many were dropped."""
+        with self._lock:
+            stale = [entry for entry in self._entries if entry[0] in namespaces]
+            for entry in stale:
+                del self._entries[entry]
+        return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._counters.clear()
+
+
+def cached_scores(graph, cache, inputs, stage_prefix=None):
+    """Update ``graph`` with ``inputs`` and return every node value, reusing ``cache``.
+
+    V^R and H^R values found in the cache are assigned to the graph, so only
+    the synergy nodes are evaluated for a known profile with a new occupation.
+    With ``stage_prefix`` the V^R, H^R, skills-match and synergy steps are
+    timed as ``<prefix>.vr`` etc. in ``ai_readiness.metrics.REGISTRY``.
+    """
+    def stage(name):
+        return REGISTRY.stage(f'{stage_prefix}.{name}') if stage_prefix else contextlib.nullcontext()
+
+    key = profile_key(inputs)
+    scores = cache.get('ai_r', key)
+    if scores is not None:
+        return dict(scores)
+
+    graph.update(inputs)
+    with stage('vr'):
+        vr = cache.get_or_compute('vr', profile_key(inputs, VR_INPUTS), lambda: graph.evaluate(VR_NODES))
+        graph.assign(vr)
+    with stage('hr'):
+        def compute_hr():
+            graph.invalidate(HR_NODES)
+            return graph.evaluate(HR_NODES)
+
+        hr = cache.get_or_compute('hr', profile_key(inputs, HR_INPUTS), compute_hr)
+        graph.assign(hr)
+    scores = {**vr, **hr}
+    with stage('skills_match'):
+        scores.update(graph.evaluate(['skills_match_score', 'alignment_factor']))
+    with stage('synergy'):
+        scores.update(graph.evaluate(['synergy_percentage', 'ai_r_score']))
+    cache.put('ai_r', key, scores)
+    return dict(scores)
@@ -0,0 +1,84 @@
+"""Integer codes and lookup tables for the categorical model inputs.
+
+A ``CategoryEncoder`` maps category strings (education levels, occupation or
+pathway names) to compact integer codes in one hashed pass, and any per-
+category value is then a NumPy lookup table indexed by those codes::
+
+    codes = EDUCATION.encode(profiles['education_level'])
+    education_foundation = EDUCATION_FOUNDATION_TABLE[codes]
+
+Values that are not known categories raise a ``ValueError`` naming them
+instead of falling through to a default.
+"""
+import numpy as np
+import pandas as pd
+
+EDUCATION_FOUNDATION = {
+    "PhD": 1.0,
+    "Master's": 0.8,
+    "Bachelor's": 0.6,
+    "Associate's/Certificate": 0.4,
+    "HS + significant coursework": 0.2,
+    "Some College": 0.3,
+}
+
+# "Other" is the catch-all option of the education selectbox and scores 0.0.
+EDUCATION_LEVELS = list(EDUCATION_FOUNDATION) + ['Other']
+
+MAX_REPORTED_UNKNOWN = 10
+
+
+def _code_dtype(n_categories):
+    for dtype in (np.int8, np.int16, np.int32):
+        if n_categories <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+class CategoryEncoder:
+    def __init__(self, categories, name='category'):
+        self.categories = list(categories)
+        self.name = name
+        self._index = pd.Index(self.categories, dtype=object)
+        if not self._index.is_unique:
+            raise ValueError(f"Duplicate {name} categories: {sorted(set(self._index[self._index.duplicated()].astype(str)))}")
+        self.code_dtype = _code_dtype(len(self.categories))
+
+    def __len__(self):
+        return len(self.categories)
+
+    def __contains__(self, value):
+        return value in self._index
+
+    def encode(self, values, allow_unknown=False):
+        """Return the integer code of every value; unknown values get -1 or raise."""
+        values = np.asarray(values, dtype=object)
+        codes = self._index.get_indexer(values.ravel()).astype(self.code_dtype).reshape(values.shape)
+        if not allow_unknown and (codes < 0).any():
+            unknown = pd.unique(values[codes < 0].ravel())
+            shown = sorted(map(str, unknown[:MAX_REPORTED_UNKNOWN]))
+            more = f" and {len(unknown) - MAX_REPORTED_UNKNOWN} more" if len(unknown) > MAX_REPORTED_UNKNOWN else ""
+            raise ValueError(f"Unknown {self.name} values: {shown}{more}")
+        return codes
+
+    def decode(self, codes):
+        return np.asarray(self.categories, dtype=object)[codes]
+
+    def table(self, mapping, default=np.nan):
+        """Return ``mapping`` as a float64 array aligned with the category codes."""
+        return np.array([mapping.get(category, default) for category in self.categories], dtype=np.float64)
+
+    def lookup(self, values, table):
+        return np.asarray(table)[self.encode(values)]
+
+
+def occupation_encoder(occupations_df, column='occupation_name'):
+    return CategoryEncoder(occupations_df[column], 'occupation')
+
+
+def pathway_encoder(pathways_df, column='pathway_name'):
+    return CategoryEncoder(pathways_df[column], 'pathway')
+
+
+EDUCATION = CategoryEncoder(EDUCATION_LEVELS, 'education_level')
+EDUCATION_FOUNDATION_TABLE = EDUCATION.table(EDUCATION_FOUNDATION, default=0.0)
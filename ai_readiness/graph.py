@@ -0,0 +1,113 @@
+"""Small dataflow graph with dirty tracking for incremental recomputation.
+
+Inputs and derived nodes are registered by name. Setting an input to a new
+value marks only its transitive dependents dirty, and reading a node
+recomputes just the dirty nodes it depends on. ``last_recomputed`` lists the
+nodes evaluated by the most recent ``evaluate``/``get`` call.
+"""
+
+
+def _same(a, b):
+    if a is b:
+        return True
+    if type(a) is not type(b):
+        return False
+    equals = getattr(a, 'equals', None)
+    if equals is not None:
+        return bool(equals(b))
+    try:
+        return bool(a == b)
+    except (TypeError, ValueError):
+        return False
+
+
+class ScoreGraph:
+    def __init__(self):
+        self._inputs = {}
+        self._nodes = {}
+        self._dependents = {}
+        self._values = {}
+        self._dirty = set()
+        self.last_recomputed = []
+        self.recompute_counts = {}
+
+    def add_input(self, name, value=None):
+        self._inputs[name] = value
+        self._dependents.setdefault(name, [])
+        return self
+
+    def add_node(self, name, func, deps):
+        for dep in deps:
+            if dep not in self._inputs and dep not in self._nodes:
+                raise KeyError(f"Unknown dependency '{dep}' for node '{name}'")
+            self._dependents[dep].append(name)
+        self._nodes[name] = (func, list(deps))
+        self._dependents.setdefault(name, [])
+        self._dirty.add(name)
+        return self
+
+    def _mark_dirty(self, name):
+        # Walk every dependent: a node may be dirty while a dependent holds an
+        # assigned value, so stopping at dirty nodes could miss it.
+        stack = list(self._dependents[name])
+        seen = set()
+        while stack:
+            node = stack.pop()
+            if node not in seen:
+                seen.add(node)
+                self._dirty.add(node)
+                stack.extend(self._dependents[node])
+
+    def set(self, name, value):
+        if name not in self._inputs:
+            raise KeyError(f"'{name}' is not an input")
+        if not _same(self._inputs[name], value):
+            self._inputs[name] = value
+            self._mark_dirty(name)
+
+    def invalidate(self, names):
+        """Mark ``names`` and their dependents dirty, e.g. when a node reads external data that changed."""
+        for name in names:
+            if name not in self._nodes:
+                raise KeyError(f"'{name}' is not a derived node")
+            self._dirty.add(name)
+            self._mark_dirty(name)
+
+    def update(self, values):
+        for name, value in values.items():
+            self.set(name, value)
+
+    def assign(self, values):
+        """Store known values of derived nodes (e.g. from a cache) without computing them.
+
+        The nodes become clean, so their dependencies are not evaluated for
+        them; changing one of their inputs marks them dirty again as usual.
+        """
+        for name, value in values.items():
+            if name not in self._nodes:
+                raise KeyError(f"'{name}' is not a derived node")
+            self._values[name] = value
+            self._dirty.discard(name)
+
+    def _compute(self, name):
+        if name in self._inputs:
+            return self._inputs[name]
+        if name in self._dirty:
+            func, deps = self._nodes[name]
+            self._values[name] = func(*(self._compute(dep) for dep in deps))
+            self._dirty.discard(name)
+            self.last_recomputed.append(name)
+            self.recompute_counts[name] = self.recompute_counts.get(name, 0) + 1
+        return self._values[name]
+
+    def get(self, name):
+        self.last_recomputed = []
+        return self._compute(name)
+
+    def evaluate(self, names=None):
+        """Bring ``names`` (default: every node) up to date and return their values."""
+        self.last_recomputed = []
+        return {name: self._compute(name) for name in (names if names is not None else self._nodes)}
+
+    def dirty(self):
+        return set(self._dirty)
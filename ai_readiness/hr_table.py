@@ -0,0 +1,147 @@
+"""Precompiled systematic-opportunity (H^R) table.
+
+``h_base`` and its components depend only on the occupation record, so they
+are computed once per occupation. The growth and regional multipliers also
+depend on ``lambda_val`` and ``gamma_val``; they are cached per parameter value
+and only recomputed when a new value is requested. Updating one occupation
+record recomputes just that row in every cached column.
+
+Cached multiplier arrays are returned read-only and ``upsert`` replaces them
+instead of writing into them, so an array a caller already holds never
+changes. Caches built on top of the table (such as the ``hr`` and ``ai_r``
+namespaces of ``ai_readiness.cache.ResultCache``) register with
+``add_listener`` to be told when a record changes.
+"""
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from ai_readiness import batch
+from ai_readiness.encoding import occupation_encoder
+
+BASE_COLUMNS = ['ai_enhancement', 'job_growth_projection', 'wage_premium', 'entry_accessibility', 'h_base']
+
+
+def _base_components(occupations):
+    ai_enhancement = batch.calculate_ai_enhancement_potential(occupations['ai_enhancement_score'])
+    job_growth_projection = batch.calculate_job_growth_projection(occupations['job_growth_rate_g'])
+    wage_premium = batch.calculate_wage_premium(occupations['ai_skilled_wage'], occupations['median_wage'])
+    entry_accessibility = batch.calculate_entry_accessibility(occupations['education_years_required'], occupations['experience_years_required'])
+    h_base = batch.calculate_base_opportunity_score(ai_enhancement, job_growth_projection, wage_premium, entry_accessibility)
+    return np.column_stack([ai_enhancement, job_growth_projection, wage_premium, entry_accessibility, h_base])
+
+
+def _growth(occupations, lambda_val):
+    return batch.calculate_growth_multiplier(occupations['current_job_postings'], occupations['previous_job_postings'], lambda_val)
+
+
+def _regional(occupations, gamma_val):
+    return batch.calculate_regional_multiplier(occupations['local_demand'], occupations['national_avg_demand'], occupations['remote_work_factor'], gamma_val)
+
+
+class OccupationHRTable:
+    def __init__(self, occupations_df, max_cached_params=16):
+        self._occupations = occupations_df.reset_index(drop=True).copy()
+        self._positions = {name: i for i, name in enumerate(self._occupations['occupation_name'])}
+        self.encoder = occupation_encoder(self._occupations)
+        self._base = _base_components(self._occupations)
+        self._growth = OrderedDict()
+        self._regional = OrderedDict()
+        self._max_cached_params = max_cached_params
+        self._listeners = []
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._positions)
+
+    def __contains__(self, occupation_name):
+        return occupation_name in self._positions
+
+    @property
+    def occupation_names(self):
+        return list(self._positions)
+
+    @property
+    def occupations(self):
+        return self._occupations.copy()
+
+    def position(self, occupation_name):
+        return self._positions[occupation_name]
+
+    def positions(self, occupation_names):
+        """Return the row of every name in one pass; unknown names raise ``ValueError``."""
+        return self.encoder.encode(occupation_names)
+
+    def _cached(self, cache, key, compute):
+        with self._lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+            values = np.asarray(compute(self._occupations, key), dtype=np.float64)
+            values.setflags(write=False)
+            cache[key] = values
+            if len(cache) > self._max_cached_params:
+                cache.popitem(last=False)
+            return values
+
+    def growth_multipliers(self, lambda_val=0.3):
+        return self._cached(self._growth, float(lambda_val), _growth)
+
+    def regional_multipliers(self, gamma_val=0.2):
+        return self._cached(self._regional, float(gamma_val), _regional)
+
+    def h_base(self):
+        return self._base[:, BASE_COLUMNS.index('h_base')].copy()
+
+    def hr_scores(self, lambda_val=0.3, gamma_val=0.2):
+        """Return H^R for every occupation, in ``occupation_names`` order."""
+        with self._lock:
+            return batch.calculate_systematic_opportunity(self._base[:, -1], self.growth_multipliers(lambda_val), self.regional_multipliers(gamma_val))
+
+    def lookup(self, occupation_name, lambda_val=0.3, gamma_val=0.2):
+        """Return the H^R components of one occupation as a dict of floats."""
+        with self._lock:
+            i = self._positions[occupation_name]
+            result = dict(zip(BASE_COLUMNS, self._base[i].tolist()))
+            result['growth_multiplier'] = float(self.growth_multipliers(lambda_val)[i])
+            result['regional_multiplier'] = float(self.regional_multipliers(gamma_val)[i])
+        result['hr_score'] = float(batch.calculate_systematic_opportunity(result['h_base'], result['growth_multiplier'], result['regional_multiplier']))
+        return result
+
+    def add_listener(self, callback):
+        """Call ``callback(occupation_name)`` after every ``upsert``."""
+        with self._lock:
+            self._listeners.append(callback)
+
+    def upsert(self, record):
+        """Insert or replace one occupation record and refresh only its rows."""
+        row = pd.DataFrame([record], columns=self._occupations.columns)
+        with self._lock:
+            name = row['occupation_name'].iloc[0]
+            if name in self._positions:
+                i = self._positions[name]
+                self._occupations = pd.concat([self._occupations.iloc[:i], row, self._occupations.iloc[i + 1:]], ignore_index=True)
+                base = self._base.copy()
+                base[i] = _base_components(row)[0]
+                self._base = base
+                for cache, compute in ((self._growth, _growth), (self._regional, _regional)):
+                    for key, values in cache.items():
+                        values = values.copy()
+                        values[i] = compute(row, key)[0]
+                        values.setflags(write=False)
+                        cache[key] = values
+            else:
+                self._positions[name] = len(self._occupations)
+                self._occupations = pd.concat([self._occupations, row], ignore_index=True)
+                self._base = np.vstack([self._base, _base_components(row)])
+                for cache, compute in ((self._growth, _growth), (self._regional, _regional)):
+                    for key, values in cache.items():
+                        values = np.append(values, compute(row, key))
+                        values.setflags(write=False)
+                        cache[key] = values
+                self.encoder = occupation_encoder(self._occupations)
+            listeners = list(self._listeners)
+        for callback in listeners:
+            callback(name)
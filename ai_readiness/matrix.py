@@ -0,0 +1,87 @@
+"""Person x occupation AI-R matrices and top-K occupation recommendations.
+
+V^R depends only on the person and H^R only on the occupation, so both are
+computed once and broadcast into the N x M AI-R matrix. Profiles are processed
+in row blocks so that very large populations never materialise the full matrix
+when only the top-K occupations per person are needed.
+"""
+import numpy as np
+
+from ai_readiness import batch
+
+BLOCK_CELLS = 1 << 22
+
+
+def _block_rows(n_occupations, block_cells):
+    return max(1, block_cells // max(1, n_occupations))
+
+
+def _skills_block(skills_match, start, stop):
+    if skills_match is None:
+        return None
+    if callable(skills_match):
+        return np.asarray(skills_match(start, stop), dtype=np.float64)
+    return np.asarray(skills_match[start:stop], dtype=np.float64)
+
+
+def _score_block(vr_score, timing_factor, hr_score, skills_block, alpha, beta, max_possible_match):
+    vr_col = vr_score[:, None]
+    hr_row = hr_score[None, :]
+    if skills_block is None:
+        synergy_percentage = np.zeros((vr_score.size, hr_score.size))
+    else:
+        alignment_factor = batch.calculate_alignment_factor(skills_block, max_possible_match, timing_factor[:, None])
+        synergy_percentage = batch.calculate_synergy_percentage(vr_col, hr_row, alignment_factor)
+    return batch.calculate_ai_readiness_score(vr_col, hr_row, synergy_percentage, alpha, beta)
+
+
+def _prepare(profiles, occupations, lambda_val, gamma_val):
+    vr_score = batch.compute_vr_components(profiles)['vr_score'].to_numpy()
+    timing_factor = batch.calculate_timing_factor(profiles['years_experience'])
+    hr_score = batch.compute_hr_components(occupations, lambda_val, gamma_val)['hr_score'].to_numpy()
+    return vr_score, timing_factor, hr_score
+
+
+def score_matrix(profiles, occupations, skills_match=None, alpha=0.6, beta=0.15, lambda_val=0.3, gamma_val=0.2, max_possible_match=100):
+    """Return the dense N x M AI-R matrix of every profile against every occupation.
+
+    ``skills_match`` is ``None`` (no synergy), an N x M array of skills-match
+    scores, or a callable ``(start, stop) -> array`` returning rows
+    ``start:stop`` of that matrix.
+    """
+    vr_score, timing_factor, hr_score = _prepare(profiles, occupations, lambda_val, gamma_val)
+    skills_block = _skills_block(skills_match, 0, vr_score.size)
+    return _score_block(vr_score, timing_factor, hr_score, skills_block, alpha, beta, max_possible_match)
+
+
+def top_k_occupations(profiles, occupations, k=5, skills_match=None, alpha=0.6, beta=0.15, lambda_val=0.3, gamma_val=0.2, max_possible_match=100, block_cells=BLOCK_CELLS):
+    """Return ``(indices, scores)`` of each profile's ``k`` best occupations.
+
+    Both arrays have shape ``(N, k)`` and are ordered best first; ``indices``
+    are row positions into ``occupations``. The AI-R matrix is built in
+    blocks of roughly ``block_cells`` cells and reduced with ``argpartition``.
+    """
+    vr_score, timing_factor, hr_score = _prepare(profiles, occupations, lambda_val, gamma_val)
+    return top_k_from_scores(vr_score, timing_factor, hr_score, k, skills_match, alpha, beta, max_possible_match, block_cells)
+
+
+def top_k_from_scores(vr_score, timing_factor, hr_score, k=5, skills_match=None, alpha=0.6, beta=0.15, max_possible_match=100, block_cells=BLOCK_CELLS):
+    """``top_k_occupations`` for precomputed per-person V^R/timing factor and per-occupation H^R."""
+    n_profiles, n_occupations = vr_score.size, hr_score.size
+    k = min(k, n_occupations)
+
+    indices = np.empty((n_profiles, k), dtype=np.int64)
+    scores = np.empty((n_profiles, k), dtype=np.float64)
+    step = _block_rows(n_occupations, block_cells)
+    for start in range(0, n_profiles, step):
+        stop = min(start + step, n_profiles)
+        block = _score_block(vr_score[start:stop], timing_factor[start:stop], hr_score, _skills_block(skills_match, start, stop), alpha, beta, max_possible_match)
+        if k < n_occupations:
+            candidates = np.argpartition(-block, k - 1, axis=1)[:, :k]
+        else:
+            candidates = np.broadcast_to(np.arange(n_occupations), block.shape)
+        candidate_scores = np.take_along_axis(block, candidates, axis=1)
+        order = np.argsort(-candidate_scores, axis=1, kind='stable')
+        indices[start:stop] = np.take_along_axis(candidates, order, axis=1)
+        scores[start:stop] = np.take_along_axis(candidate_scores, order, axis=1)
+    return indices, scores
@@ -0,0 +1,220 @@
+"""Opt-in per-stage timing and allocation metrics.
+
+Instrumented code wraps each stage in ``REGISTRY.stage(name)`` or decorates a
+function with ``REGISTRY.timed(name)``. Every stage records its call count and
+total, last and maximum wall time, and, with allocation tracing on, the net
+bytes allocated and the peak traced memory above the starting point
+(``tracemalloc``). Peaks of nested stages overlap, so only the innermost peak
+is exact.
+
+The registry is disabled by default and a disabled ``stage`` is a shared no-op
+context manager, so instrumentation costs next to nothing until it is switched
+on with ``enable()`` (or ``AI_READINESS_METRICS=1`` in the environment).
+Allocation tracing slows every Python allocation and has its own switch.
+
+Snapshots export as JSON or as Prometheus text exposition format. A
+``Histogram`` keeps fixed-bucket latency distributions (always on) for
+long-running processes such as ``ai_readiness.service``.
+"""
+import bisect
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+
+_NULL_STAGE = contextlib.nullcontext()
+
+DEFAULT_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape_label(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class MetricsRegistry:
+    def __init__(self, enabled=False, trace_allocations=False):
+        self._stats = {}
+        self._lock = threading.Lock()
+        self._started_tracing = False
+        self.enabled = False
+        self.trace_allocations = False
+        if enabled:
+            self.enable(trace_allocations)
+
+    def enable(self, trace_allocations=False):
+        self.enabled = True
+        if trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        elif not trace_allocations and self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        self.trace_allocations = trace_allocations
+
+    def disable(self):
+        self.enabled = False
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        self.trace_allocations = False
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+    def record(self, name, seconds, allocated_bytes=None, peak_bytes=None):
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = {'calls': 0, 'total_seconds': 0.0, 'max_seconds': 0.0, 'last_seconds': 0.0}
+            stats['calls'] += 1
+            stats['total_seconds'] += seconds
+            stats['max_seconds'] = max(stats['max_seconds'], seconds)
+            stats['last_seconds'] = seconds
+            if allocated_bytes is not None:
+                stats['allocated_bytes'] = stats.get('allocated_bytes', 0) + allocated_bytes
+                stats['peak_bytes'] = max(stats.get('peak_bytes', 0), peak_bytes)
+
+    @contextlib.contextmanager
+    def _measure(self, name):
+        tracing = self.trace_allocations and tracemalloc.is_tracing()
+        if tracing:
+            start_bytes = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started
+            if tracing:
+                current, peak = tracemalloc.get_traced_memory()
+                self.record(name, seconds, current - start_bytes, max(peak - start_bytes, 0))
+            else:
+                self.record(name, seconds)
+
+    def stage(self, name):
+        """Context manager timing one run of stage ``name`` (a no-op while disabled)."""
+        return self._measure(name) if self.enabled else _NULL_STAGE
+
+    def timed(self, name=None):
+        """Decorator recording every call of the function as a stage."""
+        def decorate(func):
+            stage_name = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with self._measure(stage_name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def snapshot(self):
+        """Return ``{stage: stats}`` with ``mean_seconds`` added."""
+        with self._lock:
+            stats = {name: dict(values) for name, values in self._stats.items()}
+        for values in stats.values():
+            values['mean_seconds'] = values['total_seconds'] / values['calls']
+        return stats
+
+    def to_json(self, indent=2):
+        return json.dumps({'enabled': self.enabled, 'trace_allocations': self.trace_allocations, 'stages': self.snapshot()}, indent=indent)
+
+    def to_prometheus(self, prefix='ai_readiness'):
+        stats = self.snapshot()
+        metrics = [
+            ('stage_calls_total', 'counter', 'Number of times each stage ran.', 'calls'),
+            ('stage_seconds_total', 'counter', 'Total wall time spent in each stage.', 'total_seconds'),
+            ('stage_seconds_max', 'gauge', 'Longest single run of each stage.', 'max_seconds'),
+            ('stage_net_allocated_bytes', 'gauge', 'Net bytes allocated by each stage while tracing (negative if it freed more).', 'allocated_bytes'),
+            ('stage_peak_bytes', 'gauge', 'Largest traced memory peak above the stage start.', 'peak_bytes'),
+        ]
+        lines = []
+        for metric, kind, help_text, key in metrics:
+            samples = [(name, values[key]) for name, values in sorted(stats.items()) if key in values]
+            if not samples:
+                continue
+            lines.append(f'# HELP {prefix}_{metric} {help_text}')
+            lines.append(f'# TYPE {prefix}_{metric} {kind}')
+            for name, value in samples:
+                lines.append(f'{prefix}_{metric}{{stage="{_escape_label(name)}"}} {value!r}')
+        return '\n'.join(lines) + '\n' if lines else ''
+
+
+class Histogram:
+    """Thread-safe fixed-bucket histogram; ``buckets`` are the finite upper bounds."""
+
+    def __init__(self, buckets=DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        with self._lock:
+            self._counts[bisect.bisect_left(self.buckets, value)] += 1
+            self._sum += value
+
+    @contextlib.contextmanager
+    def time(self):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+    @property
+    def count(self):
+        return sum(self._counts)
+
+    def quantile(self, q):
+        """Estimate the ``q`` quantile by linear interpolation inside its bucket."""
+        with self._lock:
+            counts = list(self._counts)
+        total = sum(counts)
+        if total == 0:
+            return float('nan')
+        rank = q * total
+        seen = 0
+        for i, count in enumerate(counts):
+            if count and seen + count >= rank:
+                if i == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[i - 1] if i else 0.0
+                return lower + (self.buckets[i] - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+
+    def snapshot(self):
+        with self._lock:
+            counts = list(self._counts)
+            total_sum = self._sum
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(self.buckets + (float('inf'),), counts):
+            cumulative += count
+            buckets['+Inf' if bound == float('inf') else repr(bound)] = cumulative
+        return {
+            'count': cumulative, 'sum': total_sum, 'buckets': buckets,
+            'p50': self.quantile(0.5), 'p90': self.quantile(0.9), 'p99': self.quantile(0.99),
+        }
+
+
+def histograms_to_prometheus(name, histograms, label, help_text):
+    """Render ``{label value: Histogram}`` as one Prometheus histogram family."""
+    lines = [f'# HELP {name} {help_text}', f'# TYPE {name} histogram']
+    for value, histogram in sorted(histograms.items()):
+        snapshot = histogram.snapshot()
+        label_pair = f'{label}="{_escape_label(str(value))}"'
+        for bound, count in snapshot['buckets'].items():
+            lines.append(f'{name}_bucket{{{label_pair},le="{bound}"}} {count}')
+        lines.append(f'{name}_sum{{{label_pair}}} {snapshot["sum"]!r}')
+        lines.append(f'{name}_count{{{label_pair}}} {snapshot["count"]}')
+    return '\n'.join(lines) + '\n'
+
+
+REGISTRY = MetricsRegistry(enabled=os.environ.get('AI_READINESS_METRICS', '').lower() in ('1', 'true', 'yes'))
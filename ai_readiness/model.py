@@ -0,0 +1,175 @@
+"""Scalar AI-Readiness model shared by the Streamlit pages and headless jobs.
+
+This module only depends on the standard library, so importing it does not
+pull in Streamlit, plotly or NumPy. ``calculate_skills_match_score`` imports the
+sparse skills index on first use. The array versions of these functions live
+in ``ai_readiness.batch``.
+"""
+from ai_readiness.graph import ScoreGraph
+from ai_readiness.metrics import REGISTRY
+
+def calculate_technical_ai_skills(prompting, tools, understanding, data_lit):
+    return (prompting + tools + understanding + data_lit) / 4
+
+def calculate_ai_augmented_productivity(output_quality_with_ai, output_quality_without_ai, time_without_ai, time_with_ai):
+    if output_quality_without_ai == 0 or time_with_ai == 0:
+        return 0
+    return (output_quality_with_ai / output_quality_without_ai) * (time_without_ai / time_with_ai)
+
+def calculate_critical_ai_judgment(errors_caught, total_ai_errors, appropriate_trust_decisions, total_decisions):
+    if total_ai_errors == 0 and total_decisions == 0:
+        return 0.0
+    if total_ai_errors == 0:
+        return 1 - (appropriate_trust_decisions / total_decisions) / 2
+    if total_decisions == 0:
+        return 1 - (errors_caught / total_ai_errors) / 2
+    return 1 - (errors_caught / total_ai_errors + appropriate_trust_decisions / total_decisions) / 2
+
+def calculate_ai_learning_velocity(delta_proficiency, delta_t_hours_invested):
+    if delta_t_hours_invested == 0:
+        return 0.0
+    return delta_proficiency / delta_t_hours_invested
+
+def calculate_ai_fluency(s1, s2, s3, s4):
+    return 0.1 * s1 + 0.2 * s2 + 0.3 * s3 + 0.4 * s4
+
+def calculate_education_foundation(education_level):
+    if education_level == "PhD":
+        return 1.0
+    elif education_level == "Master's":
+        return 0.8
+    elif education_level == "Bachelor's":
+        return 0.6
+    elif education_level == "Associate's/Certificate":
+        return 0.4
+    elif education_level == "HS + significant coursework":
+        return 0.2
+    elif education_level == "Some College":
+        return 0.3
+    else:
+        return 0.0
+
+def calculate_practical_experience(years_experience, gamma=0.15):
+    return years_experience / (years_experience + (1 / gamma))
+
+def calculate_specialization_depth(portfolio_score, recognition_score, credentials_score):
+    return (portfolio_score + recognition_score + credentials_score) / 3
+
+def calculate_domain_expertise(education_foundation, practical_experience, specialization_depth):
+    return 0.125 * education_foundation + 0.25 * practical_experience + 0.625 * specialization_depth
+
+def calculate_adaptive_capacity(cognitive_flexibility, social_emotional_intelligence, strategic_career_management):
+    return (cognitive_flexibility + social_emotional_intelligence + strategic_career_management) / 3
+
+def calculate_idiosyncratic_readiness(ai_fluency, domain_expertise, adaptive_capacity, w1=0.45, w2=0.35, w3=0.20):
+    return (w1 * ai_fluency) + (w2 * domain_expertise) + (w3 * adaptive_capacity)
+
+def calculate_ai_enhancement_potential(ai_enhancement_score):
+    return ai_enhancement_score
+
+def calculate_job_growth_projection(growth_rate_g):
+    score = 50 + (growth_rate_g * 100)
+    score = max(0, min(score, 100))
+    return int(score)
+
+def calculate_wage_premium(ai_skilled_wage, median_wage):
+    if median_wage == 0:
+        return 0
+    return (ai_skilled_wage - median_wage) / median_wage
+
+def calculate_entry_accessibility(education_years_required, experience_years_required):
+    return 1 / (1 + 0.1 * (education_years_required + experience_years_required))
+
+def calculate_base_opportunity_score(ai_enhancement, job_growth_normalized, wage_premium, entry_accessibility, w1=0.30, w2=0.30, w3=0.25, w4=0.15):
+    return (w1 * ai_enhancement +
+            w2 * job_growth_normalized +
+            w3 * wage_premium +
+            w4 * entry_accessibility)
+
+def calculate_growth_multiplier(current_job_postings, previous_job_postings, lambda_val=0.3):
+    if previous_job_postings == 0:
+        return 1.0
+    return (current_job_postings / previous_job_postings)**lambda_val
+
+def calculate_regional_multiplier(local_demand, national_avg_demand, remote_work_factor, gamma=0.2):
+    if national_avg_demand == 0:
+        return 1.0
+    return 1 + gamma * (local_demand/national_avg_demand + remote_work_factor - 1)
+
+def calculate_systematic_opportunity(h_base, growth_multiplier, regional_multiplier):
+    return h_base * growth_multiplier * regional_multiplier
+
+def calculate_skills_match_score(user_skills_df, required_skills_df):
+    from ai_readiness.skills_index import skills_match_score
+    return skills_match_score(user_skills_df, required_skills_df)
+
+def calculate_timing_factor(years_experience):
+    if years_experience <= 0:
+        return 1
+    else:
+        return 1 + (years_experience / 5)
+
+def calculate_alignment_factor(skills_match_score, max_possible_match, timing_factor):
+    if max_possible_match == 0:
+        return 0
+    return (skills_match_score / max_possible_match) * timing_factor
+
+def calculate_synergy_percentage(vr_score, hr_score, alignment_factor):
+    return (vr_score * hr_score * alignment_factor) / 100.0
+
+def calculate_ai_readiness_score(vr_score, hr_score, synergy_percentage, alpha, beta):
+    return alpha * vr_score + (1-alpha) * hr_score + beta * synergy_percentage
+
+@REGISTRY.timed('simulate_pathway_impact')
+def simulate_pathway_impact(current_ai_fluency, current_domain_expertise, current_adaptive_capacity, pathway_type, impact_ai_fluency, impact_domain_expertise, impact_adaptive_capacity, completion_score=1.0, mastery_score=1.0):
+    ai_fluency = current_ai_fluency + impact_ai_fluency * completion_score * mastery_score
+    domain_expertise = current_domain_expertise + impact_domain_expertise * completion_score * mastery_score
+    adaptive_capacity = current_adaptive_capacity + impact_adaptive_capacity * completion_score * mastery_score
+
+    ai_fluency = min(ai_fluency, 1.0)
+    domain_expertise = min(domain_expertise, 1.0)
+    adaptive_capacity = min(adaptive_capacity, 1.0)
+
+    return ai_fluency, domain_expertise, adaptive_capacity
+
+SCORE_GRAPH_INPUTS = [
+    'prompting_score', 'tools_score', 'understanding_score', 'datalit_score',
+    'output_quality_with_ai', 'output_quality_without_ai', 'time_without_ai', 'time_with_ai',
+    'errors_caught', 'total_ai_errors', 'appropriate_trust_decisions', 'total_decisions',
+    'delta_proficiency', 'delta_t_hours_invested',
+    'education_level', 'years_experience', 'portfolio_score', 'recognition_score', 'credentials_score',
+    'cognitive_flexibility', 'social_emotional_intelligence', 'strategic_career_management',
+    'target_occupation', 'lambda_val', 'gamma_val',
+    'individual_skills', 'max_possible_skills_match', 'alpha', 'beta',
+]
+
+def build_score_graph(hr_table, occupation_required_skills_df):
+    graph = ScoreGraph()
+    for name in SCORE_GRAPH_INPUTS:
+        graph.add_input(name)
+
+    # VR
+    graph.add_node('s1', calculate_technical_ai_skills, ['prompting_score', 'tools_score', 'understanding_score', 'datalit_score'])
+    graph.add_node('s2', calculate_ai_augmented_productivity, ['output_quality_with_ai', 'output_quality_without_ai', 'time_without_ai', 'time_with_ai'])
+    graph.add_node('s3', calculate_critical_ai_judgment, ['errors_caught', 'total_ai_errors', 'appropriate_trust_decisions', 'total_decisions'])
+    graph.add_node('s4', calculate_ai_learning_velocity, ['delta_proficiency', 'delta_t_hours_invested'])
+    graph.add_node('ai_fluency', calculate_ai_fluency, ['s1', 's2', 's3', 's4'])
+    graph.add_node('education_foundation', calculate_education_foundation, ['education_level'])
+    graph.add_node('practical_experience', calculate_practical_experience, ['years_experience'])
+    graph.add_node('specialization_depth', calculate_specialization_depth, ['portfolio_score', 'recognition_score', 'credentials_score'])
+    graph.add_node('domain_expertise', calculate_domain_expertise, ['education_foundation', 'practical_experience', 'specialization_depth'])
+    graph.add_node('adaptive_capacity', calculate_adaptive_capacity, ['cognitive_flexibility', 'social_emotional_intelligence', 'strategic_career_management'])
+    graph.add_node('vr_score', calculate_idiosyncratic_readiness, ['ai_fluency', 'domain_expertise', 'adaptive_capacity'])
+
+    # HR
+    graph.add_node('hr', hr_table.lookup, ['target_occupation', 'lambda_val', 'gamma_val'])
+    graph.add_node('hr_score', lambda hr: hr['hr_score'], ['hr'])
+
+    # Synergy and AI-R
+    graph.add_node('required_skills', lambda occupation: occupation_required_skills_df[occupation_required_skills_df['occupation_name'] == occupation], ['target_occupation'])
+    graph.add_node('skills_match_score', calculate_skills_match_score, ['individual_skills', 'required_skills'])
+    graph.add_node('timing_factor', calculate_timing_factor, ['years_experience'])
+    graph.add_node('alignment_factor', calculate_alignment_factor, ['skills_match_score', 'max_possible_skills_match', 'timing_factor'])
+    graph.add_node('synergy_percentage', calculate_synergy_percentage, ['vr_score', 'hr_score', 'alignment_factor'])
+    graph.add_node('ai_r_score', calculate_ai_readiness_score, ['vr_score', 'hr_score', 'synergy_percentage', 'alpha', 'beta'])
+    return graph
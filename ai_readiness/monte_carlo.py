@@ -0,0 +1,79 @@
+"""Monte Carlo projection of learning-pathway outcomes.
+
+``ai_readiness.model.simulate_pathway_impact`` applies a pathway with fixed
+completion and mastery scores. Here both are drawn from configurable
+distributions for every trial and every pathway at once, giving a distribution
+of projected V^R and AI-R per pathway. Draws use ``numpy.random.default_rng(seed)``, so a seed
+reproduces the same percentiles.
+
+A distribution is a tuple ``(kind, *params)``:
+
+* ``('fixed', value)``
+* ``('uniform', low, high)``
+* ``('beta', a, b)``
+* ``('triangular', left, mode, right)``
+* ``('normal', mean, sd)``
+
+Samples are clipped to ``[0, 1]``.
+"""
+import numpy as np
+import pandas as pd
+
+from ai_readiness import batch
+from ai_readiness.metrics import REGISTRY
+
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def sample(rng, distribution, size):
+    kind, *params = distribution
+    if kind == 'fixed':
+        values = np.full(size, float(params[0]))
+    elif kind == 'uniform':
+        values = rng.uniform(params[0], params[1], size)
+    elif kind == 'beta':
+        values = rng.beta(params[0], params[1], size)
+    elif kind == 'triangular':
+        values = rng.triangular(params[0], params[1], params[2], size)
+    elif kind == 'normal':
+        values = rng.normal(params[0], params[1], size)
+    else:
+        raise ValueError(f"Unknown distribution '{kind}'")
+    return np.clip(values, 0.0, 1.0)
+
+
+def simulate_pathway_impact(current_ai_fluency, current_domain_expertise, current_adaptive_capacity, impact_ai_fluency, impact_domain_expertise, impact_adaptive_capacity, completion_score=1.0, mastery_score=1.0):
+    """Array version of ``ai_readiness.model.simulate_pathway_impact``."""
+    ai_fluency = np.minimum(current_ai_fluency + np.asarray(impact_ai_fluency, dtype=np.float64) * completion_score * mastery_score, 1.0)
+    domain_expertise = np.minimum(current_domain_expertise + np.asarray(impact_domain_expertise, dtype=np.float64) * completion_score * mastery_score, 1.0)
+    adaptive_capacity = np.minimum(current_adaptive_capacity + np.asarray(impact_adaptive_capacity, dtype=np.float64) * completion_score * mastery_score, 1.0)
+    return ai_fluency, domain_expertise, adaptive_capacity
+
+
+@REGISTRY.timed('simulate_pathways')
+def simulate_pathways(current_ai_fluency, current_domain_expertise, current_adaptive_capacity, pathways_df, hr_score, alignment_factor, alpha=0.6, beta=0.15,
+                      completion=('beta', 8, 2), mastery=('beta', 5, 2), n_trials=100_000, seed=None, percentiles=DEFAULT_PERCENTILES):
+    """Return percentiles of projected V^R and AI-R for every pathway in ``pathways_df``.
+
+    The result has one row per pathway (indexed by ``pathway_name``) with
+    ``vr_p<q>``/``ai_r_p<q>`` columns for each percentile and the means.
+    """
+    rng = np.random.default_rng(seed)
+    shape = (len(pathways_df), n_trials)
+    completion_score = sample(rng, completion, shape)
+    mastery_score = sample(rng, mastery, shape)
+
+    impacts = [pathways_df[column].to_numpy(dtype=np.float64)[:, None] for column in ('impact_ai_fluency', 'impact_domain_expertise', 'impact_adaptive_capacity')]
+    ai_fluency, domain_expertise, adaptive_capacity = simulate_pathway_impact(
+        current_ai_fluency, current_domain_expertise, current_adaptive_capacity, *impacts, completion_score, mastery_score,
+    )
+    vr_score = batch.calculate_idiosyncratic_readiness(ai_fluency, domain_expertise, adaptive_capacity)
+    synergy_percentage = batch.calculate_synergy_percentage(vr_score, hr_score, alignment_factor)
+    ai_r_score = batch.calculate_ai_readiness_score(vr_score, hr_score, synergy_percentage, alpha, beta)
+
+    result = pd.DataFrame(index=pd.Index(pathways_df['pathway_name'].to_numpy(), name='pathway_name'))
+    for name, values in (('vr', vr_score), ('ai_r', ai_r_score)):
+        for q, column in zip(percentiles, np.percentile(values, percentiles, axis=1)):
+            result[f'{name}_p{q:g}'] = column
+        result[f'{name}_mean'] = values.mean(axis=1)
+    return result
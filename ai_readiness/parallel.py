@@ -0,0 +1,201 @@
+"""Process-pool scoring for populations too large for one process.
+
+The profile columns, the occupation H^R vector and the required-skills index
+are copied once into a shared-memory block. Workers attach to it in their
+initializer and are then sent only ``(start, stop)`` row ranges; each worker
+writes its slice of the result straight into a shared output block. Nothing but
+row bounds is pickled per task, and output order never depends on scheduling.
+
+Whether more workers help depends on the machine (cores, memory bandwidth) and
+on the population size, since every call pays for starting the pool. Measure
+the speedup against one worker before relying on it::
+
+    python -m ai_readiness.bench --benchmarks scaling --sizes 1000000 --workers 1 2 4 8
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from ai_readiness import batch, matrix
+from ai_readiness.hr_table import OccupationHRTable
+from ai_readiness.skills_index import SkillMatchIndex
+
+NUMERIC_PROFILE_COLUMNS = [c for c in batch.PROFILE_COLUMNS if c != 'education_level']
+
+_ALIGNMENT = 64
+
+
+class SharedArrays:
+    """Named NumPy arrays laid out in a single shared-memory block."""
+
+    def __init__(self, arrays):
+        layout = []
+        offset = 0
+        for name, values in arrays.items():
+            values = np.asarray(values)
+            offset = -(-offset // _ALIGNMENT) * _ALIGNMENT
+            layout.append((name, values.dtype.str, values.shape, offset))
+            offset += values.nbytes
+        self.shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        self.layout = layout
+        self.arrays = _views(self.shm, layout)
+        for name, values in arrays.items():
+            self.arrays[name][...] = values
+
+    @property
+    def spec(self):
+        return self.shm.name, self.layout
+
+    def release(self):
+        self.arrays = None
+        self.shm.close()
+        self.shm.unlink()
+
+
+def _views(shm, layout):
+    return {
+        name: np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf, offset=offset)
+        for name, dtype, shape, offset in layout
+    }
+
+
+_WORKER = {}
+
+
+def _init_worker(input_spec, output_spec, occupation_names, skill_names, params):
+    _WORKER.clear()
+    blocks = []
+    for key, (name, layout) in (('inputs', input_spec), ('outputs', output_spec)):
+        shm = shared_memory.SharedMemory(name=name)
+        blocks.append(shm)
+        _WORKER[key] = _views(shm, layout)
+    _WORKER['blocks'] = blocks
+    _WORKER['params'] = params
+    _WORKER['n_skills'] = len(skill_names)
+    _WORKER['index'] = SkillMatchIndex.from_arrays(_WORKER['inputs'], occupation_names, skill_names) if skill_names else None
+
+
+def _profile_slice(start, stop):
+    inputs = _WORKER['inputs']
+    return {column: inputs[column][start:stop] for column in NUMERIC_PROFILE_COLUMNS + ['education_foundation']}
+
+
+def _person_rows(start, stop):
+    inputs = _WORKER['inputs']
+    indptr = inputs['person_indptr']
+    lo, hi = indptr[start], indptr[stop]
+    return sparse.csr_matrix(
+        (inputs['person_data'][lo:hi], inputs['person_indices'][lo:hi], indptr[start:stop + 1] - lo),
+        shape=(stop - start, _WORKER['n_skills']),
+    )
+
+
+def _score_range(bounds):
+    start, stop = bounds
+    inputs, params = _WORKER['inputs'], _WORKER['params']
+    positions = inputs['target_positions'][start:stop]
+    skills_match_score = 0.0
+    if _WORKER['index'] is not None:
+        skills_match_score = _WORKER['index'].pair_scores(_person_rows(start, stop), positions)
+    scores = batch.score_profiles_with_hr(
+        _profile_slice(start, stop), inputs['hr_score'][positions], skills_match_score,
+        params['alpha'], params['beta'], params['max_possible_match'],
+    )
+    _WORKER['outputs']['scores'][start:stop] = scores[batch.SCORE_COLUMNS].to_numpy()
+    return stop - start
+
+
+def _top_k_range(bounds):
+    start, stop = bounds
+    inputs, params = _WORKER['inputs'], _WORKER['params']
+    profiles = _profile_slice(start, stop)
+    vr_score = batch.compute_vr_components(profiles)['vr_score'].to_numpy()
+    timing_factor = batch.calculate_timing_factor(profiles['years_experience'])
+    skills_match = None
+    if _WORKER['index'] is not None:
+        skills_match = _WORKER['index'].match_blocks(_person_rows(start, stop))
+    indices, scores = matrix.top_k_from_scores(
+        vr_score, timing_factor, inputs['hr_score'], params['k'], skills_match,
+        params['alpha'], params['beta'], params['max_possible_match'],
+    )
+    _WORKER['outputs']['indices'][start:stop] = indices
+    _WORKER['outputs']['scores'][start:stop] = scores
+    return stop - start
+
+
+class ParallelScorer:
+    def __init__(self, occupations_df, required_skills_df=None, workers=None, chunk_size=50_000):
+        self.hr_table = OccupationHRTable(occupations_df)
+        self.skill_index = None
+        if required_skills_df is not None:
+            self.skill_index = SkillMatchIndex(required_skills_df, occupation_names=self.hr_table.occupation_names)
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+
+    def _inputs(self, profiles, individual_skills_df, lambda_val, gamma_val):
+        arrays = {column: np.asarray(profiles[column], dtype=np.float64) for column in NUMERIC_PROFILE_COLUMNS}
+        arrays['education_foundation'] = batch.calculate_education_foundation(profiles['education_level'])
+        arrays['hr_score'] = self.hr_table.hr_scores(lambda_val, gamma_val)
+        if self.skill_index is not None:
+            arrays.update(self.skill_index.to_arrays())
+            n_profiles = len(arrays['education_foundation'])
+            if individual_skills_df is None:
+                person_matrix = sparse.csr_matrix((n_profiles, self.skill_index.n_skills))
+            else:
+                person_matrix = self.skill_index.encode_individual_skills(individual_skills_df, person_ids=np.asarray(profiles['user_id']))
+            arrays['person_indptr'] = person_matrix.indptr
+            arrays['person_indices'] = person_matrix.indices
+            arrays['person_data'] = person_matrix.data
+        return arrays
+
+    def _run(self, task, inputs, outputs, params):
+        n_rows = len(inputs['education_foundation'])
+        bounds = [(start, min(start + self.chunk_size, n_rows)) for start in range(0, n_rows, self.chunk_size)]
+        shared_inputs = SharedArrays(inputs)
+        shared_outputs = SharedArrays(outputs)
+        skill_names = self.skill_index.skill_names if self.skill_index is not None else []
+        initargs = (shared_inputs.spec, shared_outputs.spec, self.hr_table.occupation_names, skill_names, params)
+        try:
+            if self.workers == 1:
+                _init_worker(*initargs)
+                for bound in bounds:
+                    task(bound)
+            else:
+                with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker, initargs=initargs) as executor:
+                    for _ in executor.map(task, bounds):
+                        pass
+            return {name: values.copy() for name, values in shared_outputs.arrays.items()}
+        finally:
+            for shm in _WORKER.pop('blocks', []):
+                shm.close()
+            _WORKER.clear()
+            shared_inputs.release()
+            shared_outputs.release()
+
+    def score(self, profiles, target_occupations, individual_skills_df=None, alpha=0.6, beta=0.15, lambda_val=0.3, gamma_val=0.2, max_possible_match=100):
+        """Score each profile against its target occupation (one name or one per profile)."""
+        inputs = self._inputs(profiles, individual_skills_df, lambda_val, gamma_val)
+        n_profiles = len(inputs['education_foundation'])
+        names = np.broadcast_to(np.asarray(target_occupations, dtype=object), (n_profiles,))
+        inputs['target_positions'] = self.hr_table.positions(names).astype(np.int64)
+
+        params = {'alpha': alpha, 'beta': beta, 'max_possible_match': max_possible_match}
+        outputs = {'scores': np.zeros((n_profiles, len(batch.SCORE_COLUMNS)))}
+        result = self._run(_score_range, inputs, outputs, params)
+        index = profiles.index if isinstance(profiles, pd.DataFrame) else None
+        return pd.DataFrame(result['scores'], columns=batch.SCORE_COLUMNS, index=index)
+
+    def top_k(self, profiles, k=5, individual_skills_df=None, alpha=0.6, beta=0.15, lambda_val=0.3, gamma_val=0.2, max_possible_match=100):
+        """Return ``(indices, scores)`` of each profile's ``k`` best occupations, as in ``matrix.top_k_occupations``."""
+        inputs = self._inputs(profiles, individual_skills_df, lambda_val, gamma_val)
+        n_profiles = len(inputs['education_foundation'])
+        k = min(k, len(self.hr_table))
+        params = {'alpha': alpha, 'beta': beta, 'max_possible_match': max_possible_match, 'k': k}
+        outputs = {'indices': np.zeros((n_profiles, k), dtype=np.int64), 'scores': np.zeros((n_profiles, k))}
+        result = self._run(_top_k_range, inputs, outputs, params)
+        return result['indices'], result['scores']
+
@@ -0,0 +1,272 @@
+"""Compact columnar on-disk store for individual profiles.
+
+A store is a directory with one raw fixed-width array per profile field and a
+``store.json`` manifest holding the row count, the dtypes and the
+``education_level`` dictionary::
+
+    roster.profiles/
+        store.json
+        user_id.bin              int64
+        prompting_score.bin      float32
+        errors_caught.bin        int16
+        education_level.bin      uint8 codes into store.json's categories
+        ...
+
+Columns are opened with ``numpy.memmap`` in read-only mode, so opening a store
+of millions of profiles reads nothing but the manifest, and pages are pulled in
+only for the rows that are scored. A ``ProfileStore`` pickles as its path and
+row range, which lets worker processes reopen it zero-copy.
+
+The 0-1 scores and the hour/year fields are kept as float32 and the 0-100
+slider fields as int16, so scores computed from a store can differ from the
+float64 CSV path in the seventh significant digit.
+
+Usage::
+
+    python -m ai_readiness.profile_store profiles.csv roster.profiles
+"""
+import argparse
+import copy
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from ai_readiness.encoding import EDUCATION, EDUCATION_FOUNDATION, EDUCATION_LEVELS
+from ai_readiness.stream import read_chunks
+
+MANIFEST = 'store.json'
+FORMAT_VERSION = 1
+
+STORE_SCHEMA = {
+    'user_id': 'int64',
+    'prompting_score': 'float32',
+    'tools_score': 'float32',
+    'understanding_score': 'float32',
+    'datalit_score': 'float32',
+    'output_quality_with_ai': 'int16',
+    'output_quality_without_ai': 'int16',
+    'time_without_ai': 'float32',
+    'time_with_ai': 'float32',
+    'errors_caught': 'int16',
+    'total_ai_errors': 'int16',
+    'appropriate_trust_decisions': 'int16',
+    'total_decisions': 'int16',
+    'delta_proficiency': 'float32',
+    'delta_t_hours_invested': 'float32',
+    'education_level': 'uint8',
+    'years_experience': 'float32',
+    'portfolio_score': 'float32',
+    'recognition_score': 'float32',
+    'credentials_score': 'float32',
+    'cognitive_flexibility': 'int16',
+    'social_emotional_intelligence': 'int16',
+    'strategic_career_management': 'int16',
+}
+
+def _column_path(path, column):
+    return os.path.join(path, f'{column}.bin')
+
+
+def _to_fixed_width(values, column, dtype):
+    dtype = np.dtype(dtype)
+    if dtype.kind == 'f':
+        return np.asarray(values, dtype=dtype)
+    info = np.iinfo(dtype)
+    values = np.asarray(values)
+    if values.dtype.kind in 'iu':
+        # Cast integers directly: float64 would round IDs above 2**53.
+        if values.size and (values.min() < info.min or values.max() > info.max):
+            raise ValueError(f"Column '{column}' must hold whole numbers in [{info.min}, {info.max}] to be stored as {dtype}")
+        return values.astype(dtype)
+    values = np.asarray(values, dtype=np.float64)
+    if np.isnan(values).any() or (values != np.round(values)).any() or (values < info.min).any() or (values > info.max).any():
+        raise ValueError(f"Column '{column}' must hold whole numbers in [{info.min}, {info.max}] to be stored as {dtype}")
+    return values.astype(dtype)
+
+
+class ProfileStoreWriter:
+    """Append profile chunks to a new store; ``close`` writes the manifest."""
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self.education_levels = list(EDUCATION_LEVELS)
+        self._codes = {level: code for code, level in enumerate(self.education_levels)}
+        self._files = {column: open(_column_path(path, column), 'wb') for column in STORE_SCHEMA}
+        self.n_rows = 0
+
+    def _encode_education(self, levels):
+        # Missing levels are stored under a ``None`` category (``null`` in the
+        # manifest), which ``ProfileStore`` refuses to score, like unknown ones.
+        levels = pd.Series(levels, dtype=object)
+        missing = levels.isna().to_numpy()
+        present = levels[~missing].astype(str)
+        for level in present.unique().tolist() + ([None] if missing.any() else []):
+            if level not in self._codes:
+                if len(self.education_levels) > np.iinfo(np.uint8).max:
+                    raise ValueError("education_level has more than 256 distinct values")
+                self._codes[level] = len(self.education_levels)
+                self.education_levels.append(level)
+        codes = np.zeros(len(levels), dtype=np.uint8)
+        codes[~missing] = present.map(self._codes).to_numpy(dtype=np.uint8)
+        if missing.any():
+            codes[missing] = self._codes[None]
+        return codes
+
+    def write(self, frame):
+        missing = [column for column in STORE_SCHEMA if column != 'user_id' and column not in frame.columns]
+        if missing:
+            raise ValueError(f"Profiles are missing columns: {missing}")
+        if 'user_id' in frame.columns:
+            user_id = frame['user_id']
+        else:
+            user_id = np.arange(self.n_rows + 1, self.n_rows + len(frame) + 1)
+
+        for column, dtype in STORE_SCHEMA.items():
+            if column == 'education_level':
+                values = self._encode_education(frame[column])
+            else:
+                values = _to_fixed_width(user_id if column == 'user_id' else frame[column], column, dtype)
+            values.tofile(self._files[column])
+        self.n_rows += len(frame)
+
+    def _close_files(self):
+        for f in self._files.values():
+            f.close()
+
+    def close(self):
+        self._close_files()
+        manifest = {
+            'format_version': FORMAT_VERSION,
+            'n_rows': self.n_rows,
+            'columns': STORE_SCHEMA,
+            'education_levels': self.education_levels,
+        }
+        with open(os.path.join(self.path, MANIFEST), 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Without a manifest a failed conversion cannot be opened as a store.
+        if exc_type is None:
+            self.close()
+        else:
+            self._close_files()
+
+
+def write_profiles(profiles, path):
+    """Write a profile DataFrame to a new store at ``path`` and open it."""
+    with ProfileStoreWriter(path) as writer:
+        writer.write(profiles)
+    return ProfileStore(path)
+
+
+def convert(input_path, path, chunk_size=100_000, progress=None):
+    """Convert a CSV/Parquet profile file to a store chunk by chunk and open it."""
+    with ProfileStoreWriter(path) as writer:
+        for chunk in read_chunks(input_path, chunk_size):
+            writer.write(chunk)
+            if progress is not None:
+                progress(writer.n_rows)
+    return ProfileStore(path)
+
+
+class ProfileStore:
+    """Read-only, memory-mapped view of a profile store.
+
+    ``store[column]`` returns the column for the rows in view. Besides the
+    stored fields it serves ``education_level`` decoded to strings and
+    ``education_foundation`` looked up from the codes, so a store (or a
+    ``rows(start, stop)`` slice of it) can be passed straight to
+    ``batch.score_population`` and the other vectorized scoring functions.
+    ``education_foundation`` raises ``ValueError`` if a row in view has an
+    unknown or missing ``education_level``.
+    """
+
+    def __init__(self, path, start=0, stop=None):
+        self.path = path
+        with open(os.path.join(path, MANIFEST)) as f:
+            manifest = json.load(f)
+        if manifest['format_version'] != FORMAT_VERSION:
+            raise ValueError(f"Unsupported profile store version {manifest['format_version']}")
+        self.n_total = manifest['n_rows']
+        self.dtypes = {column: np.dtype(dtype) for column, dtype in manifest['columns'].items()}
+        self.education_levels = manifest['education_levels']
+        self._education_foundation = np.array([EDUCATION_FOUNDATION.get(level, 0.0) if level in EDUCATION else np.nan for level in self.education_levels])
+        self.start = start
+        self.stop = self.n_total if stop is None else min(stop, self.n_total)
+        self._arrays = {
+            column: np.memmap(_column_path(path, column), dtype=dtype, mode='r', shape=(self.n_total,)) if self.n_total else np.empty(0, dtype=dtype)
+            for column, dtype in self.dtypes.items()
+        }
+
+    def __reduce__(self):
+        return (ProfileStore, (self.path, self.start, self.stop))
+
+    def __len__(self):
+        return self.stop - self.start
+
+    @property
+    def columns(self):
+        return list(self.dtypes)
+
+    def __contains__(self, column):
+        return column in self.dtypes or column == 'education_foundation'
+
+    def __getitem__(self, column):
+        if column == 'education_foundation':
+            education_foundation = self._education_foundation[self.education_codes()]
+            if np.isnan(education_foundation).any():
+                levels = {self.education_levels[code] for code in np.unique(self.education_codes()[np.isnan(education_foundation)])}
+                if None in levels:
+                    n_missing = int(np.count_nonzero(np.asarray([level is None for level in self.education_levels])[self.education_codes()]))
+                    raise ValueError(f"education_level is missing for {n_missing} profiles")
+                raise ValueError(f"Unknown education_level values: {sorted(levels)}")
+            return education_foundation
+        if column == 'education_level':
+            return np.asarray(self.education_levels, dtype=object)[self.education_codes()]
+        return self._arrays[column][self.start:self.stop]
+
+    def education_codes(self):
+        return self._arrays['education_level'][self.start:self.stop]
+
+    def rows(self, start, stop):
+        """Return a view of rows ``[start, stop)`` relative to this view."""
+        view = copy.copy(self)
+        view.start = min(self.start + start, self.stop)
+        view.stop = min(self.start + stop, self.stop)
+        return view
+
+    def iter_chunks(self, chunk_size):
+        for start in range(0, len(self), chunk_size):
+            yield self.rows(start, start + chunk_size)
+
+    def to_frame(self):
+        return pd.DataFrame({column: np.asarray(self[column]) for column in self.dtypes})
+
+    def nbytes(self):
+        return sum(array.nbytes for array in self._arrays.values())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert a CSV/Parquet profile file to a memory-mapped profile store.")
+    parser.add_argument('input', help="Profile file (.csv or .parquet)")
+    parser.add_argument('output', help="Store directory to create")
+    parser.add_argument('--chunk-size', type=int, default=100_000)
+    parser.add_argument('--quiet', action='store_true')
+    args = parser.parse_args(argv)
+
+    def report(rows):
+        print(f"converted {rows:,} rows", file=sys.stderr)
+
+    store = convert(args.input, args.output, args.chunk_size, progress=None if args.quiet else report)
+    print(f"done: {len(store):,} profiles, {store.nbytes() / 1e6:.1f} MB", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
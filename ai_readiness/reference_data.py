@@ -0,0 +1,80 @@
+"""Reference datasets shipped with the app.
+
+``reference_frame`` returns a dataset as a DataFrame built once per process.
+Every call gets a shallow copy of the shared frame, so under pandas
+copy-on-write a caller that modifies its copy never changes what other
+sessions see, and reading costs no data copy. Copy-on-write is always on
+from pandas 3, which requirements.txt therefore pins; on pandas 2 the copy
+would share buffers with the frame every session reads.
+"""
+import functools
+
+import pandas as pd
+
+OCCUPATIONAL_DATA = {
+    'occupation_name': ['Data Analyst with AI Skills', 'AI UX Researcher', 'AI Prompt Engineer', 'Data Scientist', 'Nursing Informatics', 'Medical Coding'],
+    'ai_enhancement_score': [0.8, 0.9, 0.7, 0.95, 0.75, 0.6],
+    'job_growth_rate_g': [0.25, 0.35, 0.4, 0.3, 0.2, 0.15],
+    'ai_skilled_wage': [120000, 130000, 140000, 150000, 110000, 90000],
+    'median_wage': [90000, 95000, 100000, 110000, 85000, 70000],
+    'education_years_required': [4, 4, 4, 4, 4, 2],
+    'experience_years_required': [2, 3, 1, 3, 2, 0],
+    'current_job_postings': [500, 400, 600, 700, 300, 200],
+    'previous_job_postings': [400, 300, 450, 500, 250, 180],
+    'remote_work_factor': [0.6, 0.7, 0.8, 0.5, 0.4, 0.3],
+    'local_demand': [1.2, 1.1, 1.3, 1.4, 1.0, 0.9],
+    'national_avg_demand': [1.0, 1.0, 1.0, 1.0, 1.0, 1.0]
+}
+
+OCCUPATION_REQUIRED_SKILLS_DATA = {
+    'occupation_name': ['Data Analyst with AI Skills'] * 3 + ['AI UX Researcher'] * 3,
+    'skill_name': ['Python', 'Data Visualization', 'Machine Learning'] + ['User Research', 'UI Design', 'AI Ethics'],
+    'required_skill_score': [80, 70, 60, 90, 80, 75],
+    'skill_importance': [0.7, 0.8, 0.5, 0.9, 0.7, 0.6]
+}
+
+LEARNING_PATHWAYS_DATA = {
+    'pathway_id': [1, 2, 3],
+    'pathway_name': ['Prompt Engineering Fundamentals', 'AI for Financial Analysis', 'Human-AI Collaboration'],
+    'pathway_type': ['AI-Fluency', 'Domain+AI Integration', 'Adaptive Capacity'],
+    'impact_ai_fluency': [0.2, 0.1, 0.05],
+    'impact_domain_expertise': [0.05, 0.2, 0.1],
+    'impact_adaptive_capacity': [0.1, 0.05, 0.2]
+}
+
+INDIVIDUAL_PROFILES_DATA = {
+    'user_id': [1], 'prompting_score': [0.75], 'tools_score': [0.6],
+    'understanding_score': [0.8], 'datalit_score': [0.9],
+    'output_quality_with_ai': [90], 'output_quality_without_ai': [60],
+    'time_without_ai': [4], 'time_with_ai': [1], 'errors_caught': [15],
+    'total_ai_errors': [20], 'appropriate_trust_decisions': [25],
+    'total_decisions': [30], 'delta_proficiency': [0.3],
+    'delta_t_hours_invested': [10], 'education_level': ["Master's"],
+    'years_experience': [5], 'portfolio_score': [0.85], 'recognition_score': [0.7],
+    'credentials_score': [0.9], 'cognitive_flexibility': [85],
+    'social_emotional_intelligence': [90], 'strategic_career_management': [75]
+}
+
+INDIVIDUAL_SKILLS_DATA = {
+    'user_id': [1] * 3,
+    'skill_name': ['Python', 'Data Visualization', 'Machine Learning'],
+    'individual_skill_score': [70, 60, 40]
+}
+
+REFERENCE_DATASETS = {
+    'occupations': OCCUPATIONAL_DATA,
+    'required_skills': OCCUPATION_REQUIRED_SKILLS_DATA,
+    'learning_pathways': LEARNING_PATHWAYS_DATA,
+    'individual_profiles': INDIVIDUAL_PROFILES_DATA,
+    'individual_skills': INDIVIDUAL_SKILLS_DATA,
+}
+
+
+@functools.cache
+def _shared_frame(name):
+    return pd.DataFrame(REFERENCE_DATASETS[name])
+
+
+def reference_frame(name):
+    """Return the ``REFERENCE_DATASETS`` entry ``name`` as a DataFrame."""
+    return _shared_frame(name).copy(deep=False)
@@ -0,0 +1,101 @@
+"""Sensitivity analysis of AI-R over ``alpha``, ``beta``, ``lambda_val`` and ``gamma_val``.
+
+A population is evaluated against a dense grid or a Latin-hypercube sample of
+the four global parameters in one broadcasted (samples x profiles) pass. The
+partial derivatives come from the closed forms of the model rather than from
+finite differences::
+
+    AI-R       = alpha * V^R + (1 - alpha) * H^R + beta * Synergy%
+    Synergy%   = V^R * H^R * alignment / 100
+    H^R        = h_base * (current / previous) ** lambda * (1 + gamma * (local / national + remote - 1))
+
+    dAI-R/dalpha  = V^R - H^R
+    dAI-R/dbeta   = Synergy%
+    dAI-R/dlambda = dAI-R/dH^R * H^R * ln(current / previous)
+    dAI-R/dgamma  = dAI-R/dH^R * h_base * growth * (local / national + remote - 1)
+    dAI-R/dH^R    = (1 - alpha) + beta * V^R * alignment / 100
+
+Elasticities are ``dAI-R/dp * p / AI-R``.
+"""
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from ai_readiness import batch
+
+PARAMETERS = ['alpha', 'beta', 'lambda_val', 'gamma_val']
+DEFAULT_BOUNDS = {'alpha': (0.0, 1.0), 'beta': (0.0, 1.0), 'lambda_val': (0.0, 1.0), 'gamma_val': (0.0, 1.0)}
+DEFAULTS = {'alpha': 0.6, 'beta': 0.15, 'lambda_val': 0.3, 'gamma_val': 0.2}
+
+
+def parameter_grid(**values):
+    """Return every combination of the given parameter values; omitted parameters keep their defaults."""
+    axes = [np.atleast_1d(values.get(name, DEFAULTS[name])) for name in PARAMETERS]
+    return pd.DataFrame(list(itertools.product(*axes)), columns=PARAMETERS)
+
+
+def latin_hypercube(n_samples, bounds=None, seed=None):
+    """Return a Latin-hypercube sample of the parameters within ``bounds``."""
+    bounds = {**DEFAULT_BOUNDS, **(bounds or {})}
+    rng = np.random.default_rng(seed)
+    samples = {}
+    for name in PARAMETERS:
+        low, high = bounds[name]
+        strata = (rng.permutation(n_samples) + rng.random(n_samples)) / n_samples
+        samples[name] = low + strata * (high - low)
+    return pd.DataFrame(samples)
+
+
+def evaluate(profiles, occupation, samples, skills_match_score=0.0, max_possible_match=100):
+    """Evaluate AI-R, its partial derivatives and elasticities for every sample and profile.
+
+    ``samples`` is a DataFrame with the four parameter columns (see
+    ``parameter_grid``/``latin_hypercube``); ``occupation`` is one occupation
+    record or a table aligned with ``profiles``. Every returned array has shape
+    ``(len(samples), len(profiles))``.
+    """
+    vr_score = batch.compute_vr_components(profiles)['vr_score'].to_numpy()[None, :]
+    timing_factor = batch.calculate_timing_factor(profiles['years_experience'])
+    alignment_factor = batch.calculate_alignment_factor(skills_match_score, max_possible_match, timing_factor)[None, :]
+
+    h_base = batch.compute_hr_components(occupation)['h_base'].to_numpy()[None, :]
+    previous = np.asarray(occupation['previous_job_postings'], dtype=np.float64)
+    ratio = batch.safe_divide(occupation['current_job_postings'], previous)
+    log_ratio = np.zeros_like(ratio)
+    np.log(ratio, out=log_ratio, where=(previous != 0) & (ratio > 0))
+    national = np.asarray(occupation['national_avg_demand'], dtype=np.float64)
+    regional_term = np.where(national == 0, 0.0, batch.safe_divide(occupation['local_demand'], national) + np.asarray(occupation['remote_work_factor'], dtype=np.float64) - 1)
+
+    alpha, beta, lambda_val, gamma_val = (samples[name].to_numpy(dtype=np.float64)[:, None] for name in PARAMETERS)
+    growth_multiplier = np.where(previous == 0, 1.0, np.power(ratio[None, ...], lambda_val))
+    regional_multiplier = 1 + gamma_val * regional_term
+    hr_score = h_base * growth_multiplier * regional_multiplier
+    synergy_percentage = batch.calculate_synergy_percentage(vr_score, hr_score, alignment_factor)
+    ai_r_score = batch.calculate_ai_readiness_score(vr_score, hr_score, synergy_percentage, alpha, beta)
+
+    d_hr = (1 - alpha) + beta * vr_score * alignment_factor / 100.0
+    derivatives = {
+        'alpha': np.broadcast_to(vr_score - hr_score, ai_r_score.shape),
+        'beta': synergy_percentage,
+        'lambda_val': d_hr * hr_score * log_ratio,
+        'gamma_val': d_hr * h_base * growth_multiplier * regional_term,
+    }
+
+    result = {'samples': samples.reset_index(drop=True), 'vr_score': np.broadcast_to(vr_score, ai_r_score.shape), 'hr_score': np.broadcast_to(hr_score, ai_r_score.shape), 'synergy_percentage': synergy_percentage, 'ai_r_score': ai_r_score}
+    for name, value in zip(PARAMETERS, (alpha, beta, lambda_val, gamma_val)):
+        result[f'd_{name}'] = derivatives[name]
+        elasticity = np.full(ai_r_score.shape, np.nan)
+        np.divide(derivatives[name] * value, ai_r_score, out=elasticity, where=ai_r_score != 0)
+        result[f'elasticity_{name}'] = elasticity
+    return result
+
+
+def summarize(result):
+    """Average the population dimension: one row per parameter sample."""
+    summary = result['samples'].copy()
+    summary['ai_r_mean'] = result['ai_r_score'].mean(axis=1)
+    for name in PARAMETERS:
+        summary[f'd_{name}_mean'] = result[f'd_{name}'].mean(axis=1)
+        summary[f'elasticity_{name}_mean'] = np.nanmean(result[f'elasticity_{name}'], axis=1)
+    return summary
@@ -0,0 +1,153 @@
+"""Plan sequences of learning pathways under an hour or cost budget.
+
+Applying pathways one after another with ``simulate_pathway_impact`` gives, for
+non-negative impacts, ``min(x + sum(impacts), 1.0)`` per component no matter
+the order. The search is therefore a branch-and-bound over *sets* of pathways
+with memoized (ai_fluency, domain_expertise, adaptive_capacity) states:
+
+* a pathway is only branched on if it still raises an uncapped component;
+* the cap bound ``min(state + remaining impacts, 1.0)`` and a fractional
+  knapsack bound on cap-limited gains prune branches that cannot beat the
+  incumbent;
+* a state reached again at the same depth with no more budget left is skipped.
+
+The first pathway caps every component at 1.0, including those above it (as
+with the page1 inputs), so the search starts from the capped current state
+and a plan has to beat that state, not the uncapped one.
+
+The chosen set is then ordered greedily by marginal V^R gain per unit of cost
+so the most valuable pathways come first. AI-R is affine in V^R for a fixed
+H^R and alignment factor, so maximizing V^R maximizes AI-R whenever its slope
+``alpha + beta * H^R * alignment / 100`` is positive.
+"""
+import numpy as np
+import pandas as pd
+
+from ai_readiness import batch
+
+VR_WEIGHTS = np.array([0.45, 0.35, 0.20])
+IMPACT_COLUMNS = ['impact_ai_fluency', 'impact_domain_expertise', 'impact_adaptive_capacity']
+
+
+def _fractional_gain(deltas, costs, gaps, budget):
+    values = np.minimum(deltas, gaps) @ VR_WEIGHTS
+    free = costs <= 0
+    gain = values[free].sum()
+    paid_values, paid_costs = values[~free], costs[~free]
+    order = np.argsort(-(paid_values / paid_costs), kind='stable')
+    spent = np.cumsum(paid_costs[order])
+    whole = spent <= budget
+    gain += paid_values[order][whole].sum()
+    partial = np.argmin(whole) if not whole.all() else None
+    if partial is not None:
+        left = budget - (spent[partial - 1] if partial > 0 else 0.0)
+        gain += paid_values[order][partial] * left / paid_costs[order][partial]
+    return gain
+
+
+class _Search:
+    def __init__(self, deltas, costs, budget, max_steps):
+        self.deltas = deltas
+        self.costs = costs
+        self.max_steps = max_steps
+        self.best_value = -np.inf
+        self.best_items = []
+        self.memo = {}
+        self.nodes = 0
+        self.budget = budget
+
+    def bound(self, i, state, remaining):
+        rest = np.arange(i, len(self.costs))
+        rest = rest[self.costs[rest] <= remaining]
+        if rest.size == 0:
+            return state @ VR_WEIGHTS
+        gaps = 1.0 - state
+        cap_bound = np.minimum(state + self.deltas[rest].sum(axis=0), 1.0) @ VR_WEIGHTS
+        knapsack = state @ VR_WEIGHTS + min(_fractional_gain(self.deltas[rest], self.costs[rest], gaps, remaining), gaps @ VR_WEIGHTS)
+        return min(cap_bound, knapsack)
+
+    def visit(self, i, state, remaining, chosen):
+        self.nodes += 1
+        value = state @ VR_WEIGHTS
+        if chosen and value > self.best_value:
+            self.best_value, self.best_items = value, list(chosen)
+        if i == len(self.costs) or (self.max_steps is not None and len(chosen) >= self.max_steps):
+            return
+        if self.bound(i, state, remaining) <= self.best_value + 1e-12:
+            return
+        key = (i, len(chosen) if self.max_steps is not None else None, tuple(np.round(state, 12)))
+        if self.memo.get(key, -np.inf) >= remaining:
+            return
+        self.memo[key] = remaining
+
+        if self.costs[i] <= remaining:
+            new_state = np.minimum(state + self.deltas[i], 1.0)
+            if new_state @ VR_WEIGHTS > value:
+                chosen.append(i)
+                self.visit(i + 1, new_state, remaining - self.costs[i], chosen)
+                chosen.pop()
+        self.visit(i + 1, state, remaining, chosen)
+
+
+def optimize_sequence(current_ai_fluency, current_domain_expertise, current_adaptive_capacity, pathways_df, budget, cost_column,
+                      hr_score=0.0, alignment_factor=0.0, alpha=0.6, beta=0.15, completion_score=1.0, mastery_score=1.0, max_steps=None):
+    """Return the best pathway sequence within ``budget`` of ``pathways_df[cost_column]``.
+
+    The result is a dict with the ordered ``plan`` (one row per step with the
+    cumulative cost, components, V^R and AI-R), the final ``vr_score`` and
+    ``ai_r_score``, ``total_cost`` and the number of search ``nodes``.
+    The reference pathway catalog has no cost column, so the caller names one.
+    """
+    if cost_column not in pathways_df.columns:
+        raise ValueError(f"Cost column {cost_column!r} is not in pathways_df; available columns: {list(pathways_df.columns)}")
+    impacts = pathways_df[IMPACT_COLUMNS].to_numpy(dtype=np.float64)
+    if (impacts < 0).any():
+        raise ValueError("optimize_sequence requires non-negative pathway impacts")
+    costs = pathways_df[cost_column].to_numpy(dtype=np.float64)
+    deltas = impacts * completion_score * mastery_score
+    current = np.array([current_ai_fluency, current_domain_expertise, current_adaptive_capacity], dtype=np.float64)
+
+    def ai_r(state):
+        vr_score = batch.calculate_idiosyncratic_readiness(*state)
+        synergy_percentage = batch.calculate_synergy_percentage(vr_score, hr_score, alignment_factor)
+        return float(vr_score), float(batch.calculate_ai_readiness_score(vr_score, hr_score, synergy_percentage, alpha, beta))
+
+    slope = alpha + beta * hr_score * alignment_factor / 100.0
+    search = None
+    chosen = []
+    if slope > 0:
+        # Most valuable pathways first so good incumbents are found early.
+        start = np.minimum(current, 1.0)
+        value = np.minimum(deltas, 1.0 - start) @ VR_WEIGHTS
+        order = np.lexsort((np.arange(len(costs)), -np.divide(value, costs, out=np.full(len(costs), np.inf), where=costs > 0)))
+        search = _Search(deltas[order], costs[order], budget, max_steps)
+        search.best_value = start @ VR_WEIGHTS
+        search.visit(0, start, float(budget), [])
+        chosen = [int(order[i]) for i in search.best_items]
+
+    # Greedy ordering of the chosen set by marginal V^R gain per unit cost.
+    state = current.copy()
+    steps = []
+    spent = 0.0
+    remaining = list(chosen)
+    while remaining:
+        gains = [(np.minimum(state + deltas[j], 1.0) - np.minimum(state, 1.0)) @ VR_WEIGHTS for j in remaining]
+        rates = [gain / costs[j] if costs[j] > 0 else np.inf for gain, j in zip(gains, remaining)]
+        j = remaining.pop(int(np.argmax(rates)))
+        state = np.minimum(state + deltas[j], 1.0)
+        spent += costs[j]
+        vr_score, ai_r_score = ai_r(state)
+        steps.append({
+            'pathway_name': pathways_df['pathway_name'].iloc[j], 'cost': costs[j], 'cumulative_cost': spent,
+            'ai_fluency': state[0], 'domain_expertise': state[1], 'adaptive_capacity': state[2],
+            'vr_score': vr_score, 'ai_r_score': ai_r_score,
+        })
+
+    vr_score, ai_r_score = ai_r(state)
+    return {
+        'plan': pd.DataFrame(steps, columns=['pathway_name', 'cost', 'cumulative_cost', 'ai_fluency', 'domain_expertise', 'adaptive_capacity', 'vr_score', 'ai_r_score']),
+        'vr_score': vr_score,
+        'ai_r_score': ai_r_score,
+        'total_cost': spent,
+        'nodes': search.nodes if search is not None else 0,
+    }
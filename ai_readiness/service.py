@@ -0,0 +1,489 @@
+"""Local HTTP scoring service with request micro-batching.
+
+A small asyncio HTTP/1.1 server (standard library only) around the vectorized
+model. The occupation H^R table and the skills-match index are built once at
+start-up and kept warm for every request. Endpoints take and return JSON:
+
+``GET /health``
+    Liveness check.
+``POST /score``
+    One profile: the page1 inputs (``SCORE_GRAPH_INPUTS``), with
+    ``individual_skills`` as a list of ``{"skill_name", "individual_skill_score"}``
+    records or a precomputed ``skills_match_score``. ``alpha``, ``beta``,
+    ``lambda_val``, ``gamma_val`` and ``max_possible_skills_match`` are optional.
+    Concurrent requests are collected for up to ``max_delay`` seconds (or
+    ``max_batch_size`` requests) and scored in one vectorized call.
+``POST /score/batch``
+    ``{"profiles": [...]}`` scored in one vectorized call.
+``POST /pathway``
+    A profile plus ``pathway_name`` (or ``pathway_type`` and the three
+    ``impact_*`` fields), ``completion_score`` and ``mastery_score``; returns
+    the current and projected scores.
+``GET /metrics``
+    Prometheus text: per-endpoint latency histograms, micro-batch sizes and the
+    ``ai_readiness.metrics`` stage metrics.
+``GET /stats``
+    The same as JSON, with estimated latency percentiles.
+
+Usage::
+
+    python -m ai_readiness.service serve --port 8000
+    python -m ai_readiness.service loadtest --url http://127.0.0.1:8000 --requests 20000 --concurrency 64
+    python -m ai_readiness.service loadtest            # against an in-process server
+"""
+import argparse
+import asyncio
+import json
+import math
+import sys
+import time
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+import numpy as np
+import pandas as pd
+
+from ai_readiness import batch, model, synthetic
+from ai_readiness.encoding import EDUCATION
+from ai_readiness.hr_table import OccupationHRTable
+from ai_readiness.metrics import REGISTRY, Histogram, histograms_to_prometheus
+from ai_readiness.reference_data import LEARNING_PATHWAYS_DATA, OCCUPATION_REQUIRED_SKILLS_DATA, OCCUPATIONAL_DATA
+from ai_readiness.skills_index import SkillMatchIndex
+
+DEFAULT_PARAMETERS = {'alpha': 0.6, 'beta': 0.15, 'lambda_val': 0.3, 'gamma_val': 0.2, 'max_possible_skills_match': 100.0}
+NUMERIC_FIELDS = [column for column in batch.PROFILE_COLUMNS if column != 'education_level']
+RESULT_COLUMNS = ['ai_fluency', 'domain_expertise', 'adaptive_capacity', 'vr_score', 'hr_score', 'skills_match_score', 'alignment_factor', 'synergy_percentage', 'ai_r_score']
+PATHWAY_IMPACTS = ['impact_ai_fluency', 'impact_domain_expertise', 'impact_adaptive_capacity']
+
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+MAX_BODY_BYTES = 64 * 1024 * 1024
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+
+def _number(payload, name, default=None):
+    value = payload.get(name, default)
+    if value is None:
+        raise ValueError(f"Missing field '{name}'")
+    if isinstance(value, bool):
+        raise ValueError(f"Field '{name}' must be a number")
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Field '{name}' must be a number") from None
+    if not math.isfinite(number):
+        raise ValueError(f"Field '{name}' must be a finite number")
+    return number
+
+
+def _name(payload, name):
+    value = payload[name]
+    if not isinstance(value, str):
+        raise ValueError(f"Field '{name}' must be a string")
+    return value
+
+
+def _json_snapshot(histogram):
+    # An empty histogram has no percentiles; report them as null rather than NaN.
+    return {key: None if isinstance(value, float) and not math.isfinite(value) else value for key, value in histogram.snapshot().items()}
+
+
+class ScoringModel:
+    """Validates request payloads and scores lists of them with warm reference tables."""
+
+    def __init__(self, occupations_df=None, required_skills_df=None, pathways_df=None):
+        self.hr_table = OccupationHRTable(occupations_df if occupations_df is not None else pd.DataFrame(OCCUPATIONAL_DATA))
+        required_skills_df = required_skills_df if required_skills_df is not None else pd.DataFrame(OCCUPATION_REQUIRED_SKILLS_DATA)
+        self.skills_index = SkillMatchIndex(required_skills_df, occupation_names=self.hr_table.occupation_names)
+        pathways_df = pathways_df if pathways_df is not None else pd.DataFrame(LEARNING_PATHWAYS_DATA)
+        self.pathways = {row['pathway_name']: row for row in pathways_df.to_dict('records')}
+        # Fill the multiplier caches for the default parameters before the first request.
+        self.hr_table.hr_scores(DEFAULT_PARAMETERS['lambda_val'], DEFAULT_PARAMETERS['gamma_val'])
+
+    def parse(self, payload):
+        """Return a validated profile record; raises ``ValueError`` on bad input."""
+        if not isinstance(payload, dict):
+            raise ValueError("Expected a JSON object")
+        missing = [name for name in batch.PROFILE_COLUMNS + ['target_occupation'] if name not in payload]
+        if missing:
+            raise ValueError(f"Missing fields: {missing}")
+        record = {name: _number(payload, name) for name in NUMERIC_FIELDS}
+        record['education_level'] = _name(payload, 'education_level')
+        if record['education_level'] not in EDUCATION:
+            raise ValueError(f"Unknown education_level: {record['education_level']!r}")
+        record['target_occupation'] = _name(payload, 'target_occupation')
+        if record['target_occupation'] not in self.hr_table:
+            raise ValueError(f"Unknown target_occupation: {record['target_occupation']!r}")
+        for name, default in DEFAULT_PARAMETERS.items():
+            record[name] = _number(payload, name, default)
+
+        if 'skills_match_score' in payload:
+            record['skills_match_score'] = _number(payload, 'skills_match_score')
+        else:
+            skills = payload.get('individual_skills') or []
+            if not isinstance(skills, list) or not all(isinstance(skill, dict) and 'skill_name' in skill for skill in skills):
+                raise ValueError("'individual_skills' must be a list of {skill_name, individual_skill_score} objects")
+            record['individual_skills'] = [(str(skill['skill_name']), _number(skill, 'individual_skill_score')) for skill in skills]
+        return record
+
+    def _skills_match_scores(self, records, positions):
+        scores = np.array([record.get('skills_match_score', 0.0) for record in records])
+        persons, names, values = [], [], []
+        for i, record in enumerate(records):
+            for name, value in record.get('individual_skills', ()):
+                persons.append(i)
+                names.append(name)
+                values.append(value)
+        if persons:
+            skills = pd.DataFrame({'user_id': persons, 'skill_name': names, 'individual_skill_score': values})
+            person_matrix = self.skills_index.encode_individual_skills(skills, person_ids=range(len(records)))
+            computed = self.skills_index.pair_scores(person_matrix, positions)
+            has_skills = np.array(['individual_skills' in record for record in records])
+            scores[has_skills] = computed[has_skills]
+        return scores
+
+    def score(self, records):
+        """Score parsed records in one vectorized pass and return one result dict per record."""
+        with REGISTRY.stage('service.score'):
+            columns = {name: np.array([record[name] for record in records], dtype=np.float64) for name in NUMERIC_FIELDS}
+            columns['education_level'] = [record['education_level'] for record in records]
+            params = {name: np.array([record[name] for record in records], dtype=np.float64) for name in DEFAULT_PARAMETERS}
+            positions = self.hr_table.positions([record['target_occupation'] for record in records])
+
+            hr_score = np.empty(len(records))
+            hr_params = np.column_stack([params['lambda_val'], params['gamma_val']])
+            for lambda_val, gamma_val in np.unique(hr_params, axis=0):
+                rows = (hr_params[:, 0] == lambda_val) & (hr_params[:, 1] == gamma_val)
+                hr_score[rows] = self.hr_table.hr_scores(lambda_val, gamma_val)[positions[rows]]
+
+            skills_match_score = self._skills_match_scores(records, positions)
+            scores = batch.score_profiles_with_hr(columns, hr_score, skills_match_score, params['alpha'], params['beta'], params['max_possible_skills_match'])
+            scores['skills_match_score'] = skills_match_score
+            return scores[RESULT_COLUMNS].to_dict('records')
+
+    def simulate_pathway(self, record, payload):
+        """Apply a learning pathway to a parsed record with the scalar model."""
+        if 'pathway_name' in payload:
+            pathway_name = _name(payload, 'pathway_name')
+            if pathway_name not in self.pathways:
+                raise ValueError(f"Unknown pathway_name: {pathway_name!r}")
+            pathway = self.pathways[pathway_name]
+        else:
+            pathway = {'pathway_type': payload.get('pathway_type'), **{name: _number(payload, name) for name in PATHWAY_IMPACTS}}
+        completion_score = _number(payload, 'completion_score', 1.0)
+        mastery_score = _number(payload, 'mastery_score', 1.0)
+
+        current = self.score([record])[0]
+        ai_fluency, domain_expertise, adaptive_capacity = model.simulate_pathway_impact(
+            current['ai_fluency'], current['domain_expertise'], current['adaptive_capacity'],
+            pathway['pathway_type'], *(float(pathway[name]) for name in PATHWAY_IMPACTS), completion_score, mastery_score,
+        )
+        vr_score = model.calculate_idiosyncratic_readiness(ai_fluency, domain_expertise, adaptive_capacity)
+        synergy_percentage = model.calculate_synergy_percentage(vr_score, current['hr_score'], current['alignment_factor'])
+        projected = {
+            'ai_fluency': ai_fluency, 'domain_expertise': domain_expertise, 'adaptive_capacity': adaptive_capacity,
+            'vr_score': vr_score, 'hr_score': current['hr_score'], 'synergy_percentage': synergy_percentage,
+            'ai_r_score': model.calculate_ai_readiness_score(vr_score, current['hr_score'], synergy_percentage, record['alpha'], record['beta']),
+        }
+        return {'current': current, 'projected': projected}
+
+
+class MicroBatcher:
+    """Collect concurrent submissions and pass them to ``score_batch`` together.
+
+    A batch is flushed when it reaches ``max_batch_size`` items or ``max_delay``
+    seconds after its first item arrived. ``score_batch`` runs in a worker
+    thread so the event loop keeps accepting requests for the next batch.
+    """
+
+    def __init__(self, score_batch, max_batch_size=256, max_delay=0.002, batch_sizes=None):
+        self.score_batch = score_batch
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.batch_sizes = batch_sizes
+        self._pending = []
+        self._timer = None
+
+    async def submit(self, item):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        if pending:
+            asyncio.get_running_loop().create_task(self._run(pending))
+
+    async def _run(self, pending):
+        if self.batch_sizes is not None:
+            self.batch_sizes.observe(len(pending))
+        try:
+            results = await asyncio.to_thread(self.score_batch, [item for item, _ in pending])
+        except Exception as exc:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), result in zip(pending, results):
+            if not future.done():
+                future.set_result(result)
+
+
+class ScoringService:
+    def __init__(self, scoring_model=None, max_batch_size=256, max_delay=0.002):
+        self.model = scoring_model if scoring_model is not None else ScoringModel()
+        self.latency = defaultdict(Histogram)
+        self.batch_sizes = Histogram(BATCH_SIZE_BUCKETS)
+        self.batcher = MicroBatcher(self.model.score, max_batch_size, max_delay, self.batch_sizes)
+        self.routes = {
+            '/health': ('GET', self._health),
+            '/score': ('POST', self._score),
+            '/score/batch': ('POST', self._score_batch),
+            '/pathway': ('POST', self._pathway),
+            '/metrics': ('GET', self._metrics),
+            '/stats': ('GET', self._stats),
+        }
+
+    async def _health(self, payload):
+        return 200, {'status': 'ok', 'occupations': len(self.model.hr_table)}
+
+    async def _score(self, payload):
+        return 200, await self.batcher.submit(self.model.parse(payload))
+
+    async def _score_batch(self, payload):
+        if not isinstance(payload, dict) or not isinstance(payload.get('profiles'), list):
+            raise ValueError("Expected {\"profiles\": [...]}")
+        records = []
+        for i, profile in enumerate(payload['profiles']):
+            try:
+                records.append(self.model.parse(profile))
+            except ValueError as exc:
+                raise ValueError(f"profiles[{i}]: {exc}") from None
+        if not records:
+            return 200, {'scores': []}
+        self.batch_sizes.observe(len(records))
+        return 200, {'scores': await asyncio.to_thread(self.model.score, records)}
+
+    async def _pathway(self, payload):
+        record = self.model.parse(payload)
+        return 200, await asyncio.to_thread(self.model.simulate_pathway, record, payload)
+
+    async def _metrics(self, payload):
+        text = histograms_to_prometheus('ai_readiness_request_seconds', self.latency, 'endpoint', 'Request latency by endpoint.')
+        text += histograms_to_prometheus('ai_readiness_batch_size', {'score': self.batch_sizes}, 'endpoint', 'Profiles per vectorized scoring call.')
+        return 200, text + REGISTRY.to_prometheus()
+
+    async def _stats(self, payload):
+        return 200, {
+            'latency': {path: _json_snapshot(histogram) for path, histogram in self.latency.items()},
+            'batch_size': _json_snapshot(self.batch_sizes),
+            'stages': REGISTRY.snapshot(),
+        }
+
+    async def handle(self, method, path, body):
+        """Dispatch one request and return ``(status, content_type, body bytes)``."""
+        started = time.perf_counter()
+        route = self.routes.get(path)
+        if route is None:
+            status, result = 404, {'error': f"No endpoint {path}"}
+        elif route[0] != method:
+            status, result = 405, {'error': f"{path} only accepts {route[0]}"}
+        else:
+            try:
+                payload = json.loads(body) if body else None
+                status, result = await route[1](payload)
+            except (ValueError, KeyError) as exc:
+                status, result = 400, {'error': str(exc)}
+            except Exception as exc:
+                status, result = 500, {'error': f"{type(exc).__name__}: {exc}"}
+            self.latency[path].observe(time.perf_counter() - started)
+        if isinstance(result, str):
+            return status, 'text/plain; version=0.0.4', result.encode()
+        try:
+            return status, 'application/json', json.dumps(result, allow_nan=False).encode()
+        except ValueError:
+            # NaN and Infinity are not JSON; strict clients would reject the body.
+            return 500, 'application/json', b'{"error": "Result is not a finite number"}'
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await _write_response(writer, 400, 'application/json', b'{"error": "Malformed request line"}', keep_alive=False)
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                try:
+                    length = int(headers.get('content-length', 0) or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await _write_response(writer, 400, 'application/json', b'{"error": "Invalid Content-Length"}', keep_alive=False)
+                    break
+                if length > MAX_BODY_BYTES:
+                    await _write_response(writer, 413, 'application/json', b'{"error": "Request body too large"}', keep_alive=False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+                keep_alive = headers.get('connection', '').lower() != 'close' and version == 'HTTP/1.1'
+                status, content_type, response = await self.handle(method, urlsplit(target).path, body)
+                await _write_response(writer, status, content_type, response, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host='127.0.0.1', port=8000):
+        return await asyncio.start_server(self._handle_connection, host, port, backlog=1024)
+
+    async def serve_forever(self, host='127.0.0.1', port=8000):
+        server = await self.start(host, port)
+        print(f"serving on http://{host}:{server.sockets[0].getsockname()[1]}", file=sys.stderr)
+        async with server:
+            await server.serve_forever()
+
+
+async def _write_response(writer, status, content_type, body, keep_alive=True):
+    head = (
+        f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    writer.write(head.encode('latin-1') + body)
+    await writer.drain()
+
+
+async def _request(reader, writer, host, method, path, body):
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode('latin-1') + body
+    )
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    return status, await reader.readexactly(length)
+
+
+def loadtest_payloads(n, seed=0, occupation_names=None):
+    """Return ``n`` synthetic ``/score`` payloads against the reference occupations."""
+    rng = np.random.default_rng(seed)
+    occupation_names = occupation_names or OCCUPATIONAL_DATA['occupation_name']
+    profiles = synthetic.profiles(rng, n)
+    payloads = profiles[batch.PROFILE_COLUMNS].to_dict('records')
+    skills = pd.DataFrame(OCCUPATION_REQUIRED_SKILLS_DATA)['skill_name'].unique()
+    for payload, occupation in zip(payloads, rng.choice(occupation_names, n)):
+        payload['target_occupation'] = str(occupation)
+        chosen = rng.choice(skills, rng.integers(0, 4), replace=False)
+        payload['individual_skills'] = [{'skill_name': str(skill), 'individual_skill_score': int(rng.integers(0, 101))} for skill in chosen]
+    return payloads
+
+
+async def loadtest(url, n_requests=10_000, concurrency=64, endpoint='/score', batch_size=100, seed=0):
+    """Send ``n_requests`` profiles over ``concurrency`` keep-alive connections and report latency."""
+    parts = urlsplit(url)
+    host, port = parts.hostname, parts.port or 80
+    payloads = loadtest_payloads(n_requests, seed)
+    if endpoint == '/score/batch':
+        bodies = [json.dumps({'profiles': payloads[i:i + batch_size]}).encode() for i in range(0, n_requests, batch_size)]
+    else:
+        bodies = [json.dumps(payload).encode() for payload in payloads]
+    latencies = []
+    errors = 0
+    next_body = iter(range(len(bodies)))
+
+    async def worker():
+        nonlocal errors
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            for i in next_body:
+                started = time.perf_counter()
+                status, _ = await _request(reader, writer, host, 'POST', endpoint, bodies[i])
+                latencies.append(time.perf_counter() - started)
+                errors += status != 200
+        finally:
+            writer.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, len(bodies)))))
+    elapsed = time.perf_counter() - started
+    latencies = np.array(latencies)
+    return {
+        'endpoint': endpoint, 'requests': len(bodies), 'profiles': n_requests, 'concurrency': concurrency, 'errors': errors,
+        'seconds': elapsed, 'requests_per_second': len(bodies) / elapsed, 'profiles_per_second': n_requests / elapsed,
+        **{f'p{q}_ms': float(np.percentile(latencies, q) * 1000) for q in (50, 90, 99)},
+        'max_ms': float(latencies.max() * 1000),
+    }
+
+
+async def _local_loadtest(service, **options):
+    server = await service.start('127.0.0.1', 0)
+    async with server:
+        port = server.sockets[0].getsockname()[1]
+        report = await loadtest(f'http://127.0.0.1:{port}', **options)
+        report['server_batch_size'] = service.batch_sizes.snapshot()
+        return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local AI-Readiness scoring service.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    serve = commands.add_parser('serve', help="Run the HTTP service")
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8000)
+    for command in (serve, commands.add_parser('loadtest', help="Load-test a running service (or an in-process one without --url)")):
+        command.add_argument('--max-batch-size', type=int, default=256)
+        command.add_argument('--max-delay', type=float, default=0.002, help="Seconds to wait for a micro-batch to fill")
+    loadtest_parser = commands.choices['loadtest']
+    loadtest_parser.add_argument('--url', help="Service URL; starts an in-process service when omitted")
+    loadtest_parser.add_argument('--requests', type=int, default=10_000, help="Number of profiles to send")
+    loadtest_parser.add_argument('--concurrency', type=int, default=64)
+    loadtest_parser.add_argument('--endpoint', choices=['/score', '/score/batch'], default='/score')
+    loadtest_parser.add_argument('--batch-size', type=int, default=100, help="Profiles per request for /score/batch")
+    loadtest_parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.command == 'serve':
+        service = ScoringService(max_batch_size=args.max_batch_size, max_delay=args.max_delay)
+        try:
+            asyncio.run(service.serve_forever(args.host, args.port))
+        except KeyboardInterrupt:
+            pass
+        return
+
+    options = {'n_requests': args.requests, 'concurrency': args.concurrency, 'endpoint': args.endpoint, 'batch_size': args.batch_size, 'seed': args.seed}
+    if args.url:
+        report = asyncio.run(loadtest(args.url, **options))
+    else:
+        report = asyncio.run(_local_loadtest(ScoringService(max_batch_size=args.max_batch_size, max_delay=args.max_delay), **options))
+    print(json.dumps(report, indent=2))
+    if report['errors']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""Per-session state of the AI-Readiness Score and Pathway Simulation pages.
+
+One ``ProfileState`` per session holds the page inputs and the last results as
+typed ``__slots__`` attributes, and one ``PathwayState`` holds the projected
+scores and Monte Carlo results of the pathway page. This replaces several dozen loose
+``st.session_state`` keys, each of which had to be checked and initialized on
+every rerun. The defaults are kept in module-level dicts and copied into a
+new state in one pass. The default skills table is a shallow copy of the
+shared reference frame, so sessions that never edit it hold no copy of
+the data.
+"""
+import pandas as pd
+
+from ai_readiness.batch import PROFILE_COLUMNS
+from ai_readiness.model import SCORE_GRAPH_INPUTS
+from ai_readiness.reference_data import reference_frame
+
+INPUT_DEFAULTS = {
+    'alpha': 0.6, 'beta': 0.15,
+    'prompting_score': 0.75, 'tools_score': 0.6, 'understanding_score': 0.8, 'datalit_score': 0.9,
+    'output_quality_with_ai': 90, 'output_quality_without_ai': 60, 'time_without_ai': 4, 'time_with_ai': 1,
+    'errors_caught': 15, 'total_ai_errors': 20, 'appropriate_trust_decisions': 25, 'total_decisions': 30,
+    'delta_proficiency': 0.3, 'delta_t_hours_invested': 10,
+    'education_level': "Master's", 'years_experience': 5,
+    'portfolio_score': 0.85, 'recognition_score': 0.7, 'credentials_score': 0.9,
+    'cognitive_flexibility': 85, 'social_emotional_intelligence': 90, 'strategic_career_management': 75,
+    'target_occupation': 'Data Analyst with AI Skills', 'lambda_val': 0.3, 'gamma_val': 0.2,
+    'max_possible_skills_match': 100,
+}
+RESULT_DEFAULTS = {'vr_score': 0, 'hr_score': 0, 'synergy_percentage': 0, 'ai_r_score': 0}
+
+
+class ProfileState:
+    __slots__ = tuple(INPUT_DEFAULTS) + ('individual_skills',) + tuple(RESULT_DEFAULTS) + ('vr_components', 'h_base_components', 'calculated_inputs', 'uplift_target')
+
+    alpha: float
+    beta: float
+    prompting_score: float
+    tools_score: float
+    understanding_score: float
+    datalit_score: float
+    output_quality_with_ai: int
+    output_quality_without_ai: int
+    time_without_ai: float
+    time_with_ai: float
+    errors_caught: int
+    total_ai_errors: int
+    appropriate_trust_decisions: int
+    total_decisions: int
+    delta_proficiency: float
+    delta_t_hours_invested: float
+    education_level: str
+    years_experience: float
+    portfolio_score: float
+    recognition_score: float
+    credentials_score: float
+    cognitive_flexibility: int
+    social_emotional_intelligence: int
+    strategic_career_management: int
+    target_occupation: str
+    lambda_val: float
+    gamma_val: float
+    max_possible_skills_match: float
+    individual_skills: pd.DataFrame
+    vr_score: float
+    hr_score: float
+    synergy_percentage: float
+    ai_r_score: float
+    vr_components: dict
+    h_base_components: dict
+    calculated_inputs: dict
+    uplift_target: float
+
+    def __init__(self):
+        for defaults in (INPUT_DEFAULTS, RESULT_DEFAULTS):
+            for name, value in defaults.items():
+                setattr(self, name, value)
+        self.individual_skills = reference_frame('individual_skills')[['skill_name', 'individual_skill_score']]
+        self.vr_components = {}
+        self.h_base_components = {}
+        self.calculated_inputs = None
+        self.uplift_target = None
+
+    @property
+    def has_results(self):
+        return self.vr_score != 0
+
+    def score_inputs(self):
+        """Return the ``SCORE_GRAPH_INPUTS`` of this profile as a dict."""
+        return {name: getattr(self, name) for name in SCORE_GRAPH_INPUTS}
+
+    def profile_frame(self, inputs=None):
+        """Return the profile fields and ``target_occupation`` as a one-row DataFrame for the batch engines.
+
+        ``inputs`` is a ``score_inputs()`` snapshot to use instead of the current fields.
+        """
+        inputs = self.score_inputs() if inputs is None else inputs
+        return pd.DataFrame([{name: inputs[name] for name in PROFILE_COLUMNS + ['target_occupation']}])
+
+
+class PathwayState:
+    __slots__ = ('vr_score_new', 'hr_score_new', 'synergy_percentage_new', 'ai_r_score_new', 'monte_carlo_results')
+
+    vr_score_new: float
+    hr_score_new: float
+    synergy_percentage_new: float
+    ai_r_score_new: float
+    monte_carlo_results: pd.DataFrame
+
+    def __init__(self):
+        for name in self.__slots__:
+            setattr(self, name, None)
+
+    @property
+    def has_projection(self):
+        return self.ai_r_score_new is not None
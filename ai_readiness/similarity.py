@@ -0,0 +1,193 @@
+"""Nearest-neighbor search over occupations for career-transition suggestions.
+
+Every occupation is embedded as two unit vectors:
+
+* its ``batch.OCCUPATION_COLUMNS`` values, standardized with the mean and
+  standard deviation of the catalog the index was built from;
+* its required skills, one dimension per skill with value
+  ``skill_importance * required_skill_score / 100``.
+
+Similarity is the blend of the two cosine similarities
+``(1 - skill_weight) * numeric + skill_weight * skills``, in ``[-1, 1]``. The
+numeric vectors are kept in a dense (F, M) buffer and the skill vectors in a
+skill-major sparse matrix, so a query costs one (B, F) x (F, M) product plus
+one pass over the occupations that share a skill with the query, followed by
+an ``argpartition``. Numeric vectors are stored in float32, which bounds the
+error of a similarity at about 1e-7. ``add`` appends new occupations; their skill vectors are
+merged into the skill-major matrix at the next query. The standardization
+stays fixed after construction so existing vectors never change. Skills of a
+``query`` that no indexed occupation requires match nothing but still count
+in the query's norm.
+"""
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from ai_readiness.batch import OCCUPATION_COLUMNS
+
+INITIAL_CAPACITY = 1024
+
+
+def _unit_rows(values):
+    norms = np.linalg.norm(values, axis=1, keepdims=True)
+    return np.divide(values, norms, out=np.zeros_like(values), where=norms != 0)
+
+
+class OccupationSimilarityIndex:
+    def __init__(self, occupations_df, required_skills_df=None, skill_weight=0.5):
+        if not 0 <= skill_weight <= 1:
+            raise ValueError("skill_weight must be in [0, 1]")
+        if occupations_df.empty:
+            raise ValueError("The occupation catalog is empty")
+        values = occupations_df[OCCUPATION_COLUMNS].to_numpy(dtype=np.float64)
+        self._mean = values.mean(axis=0)
+        scale = values.std(axis=0)
+        self._scale = np.where(scale > 0, scale, 1.0)
+        self._numeric_weight = np.sqrt(1 - skill_weight)
+        self._skill_weight = np.sqrt(skill_weight)
+
+        self.occupation_names = []
+        self.occupation_ids = {}
+        self.skill_names = []
+        self.skill_ids = {}
+        # Feature-major float32, so a query is a (B, F) x (F, M) product over contiguous rows.
+        self._numeric = np.empty((len(OCCUPATION_COLUMNS), INITIAL_CAPACITY), dtype=np.float32)
+        self._by_occupation = sparse.csr_matrix((0, 0))
+        self._by_skill = sparse.csc_matrix((0, 0))
+        self._pending = []
+        self.add(occupations_df, required_skills_df)
+
+    def __len__(self):
+        return len(self.occupation_names)
+
+    def __contains__(self, occupation_name):
+        return occupation_name in self.occupation_ids
+
+    def _embed_numeric(self, occupations_df):
+        values = (occupations_df[OCCUPATION_COLUMNS].to_numpy(dtype=np.float64) - self._mean) / self._scale
+        return _unit_rows(values) * self._numeric_weight
+
+    def _embed_skills(self, names, required_skills_df, register):
+        """Return the (len(names), n_skills) CSR skill vectors; ``register`` adds unseen skills to the vocabulary."""
+        if required_skills_df is None or required_skills_df.empty:
+            return sparse.csr_matrix((len(names), len(self.skill_names)))
+        required = required_skills_df.dropna(subset=['skill_name'])
+        rows = pd.Index(names).get_indexer(required['occupation_name'])
+        required = required[rows >= 0].assign(row=rows[rows >= 0]).drop_duplicates(subset=['row', 'skill_name'], keep='last')
+        if register:
+            for name in pd.unique(required['skill_name']):
+                if name not in self.skill_ids:
+                    self.skill_ids[name] = len(self.skill_names)
+                    self.skill_names.append(name)
+        rows = required['row'].to_numpy()
+        columns = required['skill_name'].map(self.skill_ids).to_numpy(dtype=np.float64, na_value=-1).astype(np.int64)
+        values = required['skill_importance'].to_numpy(dtype=np.float64) * required['required_skill_score'].to_numpy(dtype=np.float64) / 100
+        # Norms include skills outside the vocabulary: they match nothing but still dilute the query.
+        norms = np.sqrt(np.bincount(rows, weights=values * values, minlength=len(names)))
+        scale = np.divide(self._skill_weight, norms, out=np.zeros_like(norms), where=norms != 0)
+        known = columns >= 0
+        return sparse.csr_matrix((values[known] * scale[rows[known]], (rows[known], columns[known])), shape=(len(names), len(self.skill_names)))
+
+    def add(self, occupations_df, required_skills_df=None):
+        """Insert new occupations (and their rows of ``required_skills_df``); existing names raise ``ValueError``."""
+        names = [str(name) for name in occupations_df['occupation_name']]
+        counts = pd.Series(names, dtype=object).value_counts()
+        duplicates = sorted({name for name in names if name in self.occupation_ids} | set(counts.index[counts > 1]))
+        if duplicates:
+            raise ValueError(f"Occupations already indexed or repeated: {duplicates[:10]}")
+        numeric = self._embed_numeric(occupations_df)
+        skills = self._embed_skills(names, required_skills_df, register=True)
+
+        start = len(self.occupation_names)
+        needed = start + len(names)
+        if needed > self._numeric.shape[1]:
+            capacity = self._numeric.shape[1]
+            while capacity < needed:
+                capacity *= 2
+            grown = np.empty((self._numeric.shape[0], capacity), dtype=np.float32)
+            grown[:, :start] = self._numeric[:, :start]
+            self._numeric = grown
+        self._numeric[:, start:needed] = numeric.T
+        for offset, name in enumerate(names):
+            self.occupation_ids[name] = start + offset
+        self.occupation_names.extend(names)
+        self._pending.append(skills)
+        return self
+
+    def _merge_pending(self):
+        # Append pending inserts to the skill vectors, widened to the current vocabulary.
+        if self._pending:
+            n_skills = len(self.skill_names)
+            blocks = [self._by_occupation] + self._pending
+            for block in blocks:
+                block.resize(block.shape[0], n_skills)
+            self._by_occupation = sparse.vstack(blocks, format='csr')
+            self._by_skill = self._by_occupation.tocsc()
+            self._pending = []
+
+    def _similarities(self, numeric, query_rows, skill_ids, values):
+        """Return the (B, M) similarity of query vectors to every indexed occupation.
+
+        The skill vectors of the queries are given as ``(query_rows, skill_ids,
+        values)`` entries.
+        """
+        n = len(self.occupation_names)
+        scores = (numeric.astype(np.float32) @ self._numeric[:, :n]).astype(np.float64)
+        self._merge_pending()
+        by_skill = self._by_skill
+        if len(skill_ids):
+            # Expand every query skill against the occupations requiring it.
+            per_skill = np.diff(by_skill.indptr)[skill_ids]
+            entry = np.repeat(np.arange(len(skill_ids)), per_skill)
+            offsets = np.arange(entry.size) - np.repeat(np.cumsum(per_skill) - per_skill, per_skill)
+            stored = np.repeat(by_skill.indptr[skill_ids], per_skill) + offsets
+            products = values[entry] * by_skill.data[stored]
+            scores += np.bincount(query_rows[entry] * n + by_skill.indices[stored], weights=products, minlength=scores.size).reshape(scores.shape)
+        return scores
+
+    def _top_k(self, scores, k):
+        k = min(k, scores.shape[1])
+        if k <= 0:
+            return np.empty((len(scores), 0), dtype=np.int64), np.empty((len(scores), 0))
+        if k < scores.shape[1]:
+            candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        else:
+            candidates = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+        candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+        order = np.argsort(-candidate_scores, axis=1, kind='stable')
+        return np.take_along_axis(candidates, order, axis=1), np.take_along_axis(candidate_scores, order, axis=1)
+
+    def nearest(self, occupation_names, k=5):
+        """Return ``(indices, similarities)`` of the ``k`` indexed occupations closest to each named one, itself excluded.
+
+        Both arrays have shape ``(len(occupation_names), k)`` and are ordered
+        most similar first; indices are positions in ``self.occupation_names``.
+        """
+        unknown = [name for name in occupation_names if name not in self.occupation_ids]
+        if unknown:
+            raise KeyError(f"Unknown occupations: {unknown[:10]}")
+        rows = np.array([self.occupation_ids[name] for name in occupation_names], dtype=np.int64)
+        self._merge_pending()
+        by_occupation = self._by_occupation
+        counts = np.diff(by_occupation.indptr)[rows]
+        stored = np.repeat(by_occupation.indptr[rows], counts) + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        query_rows = np.repeat(np.arange(len(rows)), counts)
+        scores = self._similarities(self._numeric[:, rows].T, query_rows, by_occupation.indices[stored], by_occupation.data[stored])
+        scores[np.arange(len(rows)), rows] = -np.inf
+        return self._top_k(scores, min(k, len(self) - 1))
+
+    def query(self, occupations_df, required_skills_df=None, k=5):
+        """Return the ``k`` nearest indexed occupations of occupations that are not (necessarily) in the index."""
+        names = [str(name) for name in occupations_df['occupation_name']]
+        numeric = self._embed_numeric(occupations_df)
+        skills = self._embed_skills(names, required_skills_df, register=False)
+        query_rows = np.repeat(np.arange(len(names)), np.diff(skills.indptr))
+        return self._top_k(self._similarities(numeric, query_rows, skills.indices, skills.data), k)
+
+    def similar_occupations(self, occupation_name, k=5):
+        """Return the ``k`` occupations most similar to ``occupation_name`` as a DataFrame."""
+        indices, similarities = self.nearest([occupation_name], k)
+        return pd.DataFrame({
+            'occupation_name': [self.occupation_names[i] for i in indices[0]],
+            'similarity': similarities[0],
+        })
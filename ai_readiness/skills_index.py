@@ -0,0 +1,192 @@
+"""Sparse skill-match index.
+
+``skill_name`` values are mapped to integer ids, individual skills become an
+N x S CSR matrix and ``occupation_required_skills_df`` becomes a pair of M x S
+CSR matrices (required score and importance). The skills-match score of every
+person/occupation pair is then one sparse *min-weighted* product::
+
+    match[p, o] = 100 * sum_s min(U[p, s], R[o, s]) / 100 * W[o, s] / sum_s W[o, s]
+
+which is exactly what ``calculate_skills_match_score`` computes for one pair.
+"""
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+
+class SkillMatchIndex:
+    def __init__(self, required_skills_df, occupation_names=None, occupation_column='occupation_name'):
+        required = required_skills_df.dropna(subset=['skill_name'])
+        if occupation_column is None or occupation_column not in required.columns:
+            occupation_keys = np.zeros(len(required), dtype=np.int64)
+            self.occupation_names = [None]
+        else:
+            if occupation_names is None:
+                occupation_names = pd.unique(required[occupation_column])
+            self.occupation_names = list(occupation_names)
+            occupation_keys = pd.Index(self.occupation_names).get_indexer(required[occupation_column])
+            keep = occupation_keys >= 0
+            required, occupation_keys = required[keep], occupation_keys[keep]
+        self.occupation_ids = {name: i for i, name in enumerate(self.occupation_names)}
+
+        self.skill_names = list(pd.unique(required['skill_name']))
+        self.skill_ids = {name: i for i, name in enumerate(self.skill_names)}
+
+        frame = pd.DataFrame({
+            'occupation': occupation_keys,
+            'skill': required['skill_name'].map(self.skill_ids).to_numpy(),
+            'score': required['required_skill_score'].to_numpy(dtype=np.float64),
+            'importance': required['skill_importance'].to_numpy(dtype=np.float64),
+        }).drop_duplicates(subset=['occupation', 'skill'], keep='last')
+
+        shape = (len(self.occupation_names), len(self.skill_names))
+        coords = (frame['occupation'].to_numpy(), frame['skill'].to_numpy())
+        self.required_scores = sparse.csr_matrix((frame['score'].to_numpy(), coords), shape=shape)
+        self.required_importance = sparse.csr_matrix((frame['importance'].to_numpy(), coords), shape=shape)
+        self.total_importance = np.bincount(coords[0], weights=frame['importance'].to_numpy(), minlength=shape[0]).astype(np.float64, copy=False)
+
+        # Skill-major views used to join person skills against occupations.
+        self._scores_by_skill = self.required_scores.tocsc()
+        self._importance_by_skill = self.required_importance.tocsc()
+
+    @property
+    def n_occupations(self):
+        return len(self.occupation_names)
+
+    @property
+    def n_skills(self):
+        return len(self.skill_names)
+
+    def encode_individual_skills(self, individual_skills_df, person_ids=None, person_column='user_id'):
+        """Return an N x S CSR matrix of individual skill scores.
+
+        Without a ``person_column`` the whole frame is one person. Skills that
+        no occupation requires are dropped since they can never match; if a
+        person lists a skill twice the last entry wins.
+        """
+        skills = individual_skills_df.dropna(subset=['skill_name', 'individual_skill_score'])
+        if person_column in skills.columns:
+            if person_ids is None:
+                person_ids = pd.unique(skills[person_column])
+            rows = pd.Index(person_ids).get_indexer(skills[person_column])
+            n_persons = len(person_ids)
+        else:
+            rows = np.zeros(len(skills), dtype=np.int64)
+            n_persons = 1
+        cols = skills['skill_name'].map(self.skill_ids).to_numpy(dtype=np.float64, na_value=-1).astype(np.int64)
+
+        frame = pd.DataFrame({
+            'person': rows,
+            'skill': cols,
+            'score': skills['individual_skill_score'].to_numpy(dtype=np.float64),
+        })
+        frame = frame[(frame['person'] >= 0) & (frame['skill'] >= 0)].drop_duplicates(subset=['person', 'skill'], keep='last')
+        return sparse.csr_matrix((frame['score'].to_numpy(), (frame['person'].to_numpy(), frame['skill'].to_numpy())), shape=(n_persons, self.n_skills))
+
+    @classmethod
+    def from_arrays(cls, arrays, occupation_names, skill_names):
+        """Rebuild an index from ``to_arrays`` output without copying the arrays."""
+        index = cls.__new__(cls)
+        index.occupation_names = list(occupation_names)
+        index.occupation_ids = {name: i for i, name in enumerate(index.occupation_names)}
+        index.skill_names = list(skill_names)
+        index.skill_ids = {name: i for i, name in enumerate(index.skill_names)}
+        shape = (len(index.occupation_names), len(index.skill_names))
+        structure = (arrays['by_skill_indices'], arrays['by_skill_indptr'])
+        index._scores_by_skill = sparse.csc_matrix((arrays['by_skill_scores'], *structure), shape=shape, copy=False)
+        index._importance_by_skill = sparse.csc_matrix((arrays['by_skill_importance'], *structure), shape=shape, copy=False)
+        index.required_scores = index._scores_by_skill.tocsr()
+        index.required_importance = index._importance_by_skill.tocsr()
+        index.total_importance = arrays['total_importance']
+        return index
+
+    def to_arrays(self):
+        """Return the flat NumPy arrays needed to rebuild the index with ``from_arrays``."""
+        return {
+            'by_skill_indptr': self._scores_by_skill.indptr,
+            'by_skill_indices': self._scores_by_skill.indices,
+            'by_skill_scores': self._scores_by_skill.data,
+            'by_skill_importance': self._importance_by_skill.data,
+            'total_importance': self.total_importance,
+        }
+
+    def _pairs(self, person_matrix):
+        # Expand every person-skill entry against each occupation requiring that skill.
+        person_matrix = sparse.csr_matrix(person_matrix)
+        person_rows = np.repeat(np.arange(person_matrix.shape[0]), np.diff(person_matrix.indptr))
+        person_skills = person_matrix.indices
+        per_skill = np.diff(self._scores_by_skill.indptr)
+        counts = per_skill[person_skills]
+        n_pairs = int(counts.sum())
+        entry = np.repeat(np.arange(person_skills.size), counts)
+        offsets = np.arange(n_pairs) - np.repeat(np.cumsum(counts) - counts, counts)
+        required = np.repeat(self._scores_by_skill.indptr[person_skills], counts) + offsets
+
+        contributions = (np.minimum(person_matrix.data[entry], self._scores_by_skill.data[required]) / 100) * self._importance_by_skill.data[required]
+        return person_rows[entry], self._scores_by_skill.indices[required], contributions
+
+    def weighted_overlap(self, person_matrix):
+        """Return the dense N x M matrix of ``sum_s min(u, r) / 100 * importance``."""
+        n_persons = person_matrix.shape[0]
+        rows, occupations, contributions = self._pairs(person_matrix)
+        totals = np.bincount(rows * self.n_occupations + occupations, weights=contributions, minlength=n_persons * self.n_occupations).astype(np.float64, copy=False)
+        return totals.reshape(n_persons, self.n_occupations)
+
+    def pair_scores(self, person_matrix, occupation_positions):
+        """Return the skills-match score of person ``i`` against occupation ``occupation_positions[i]``."""
+        n_persons = person_matrix.shape[0]
+        occupation_positions = np.broadcast_to(np.asarray(occupation_positions, dtype=np.int64), (n_persons,))
+        rows, occupations, contributions = self._pairs(person_matrix)
+        keep = occupations == occupation_positions[rows]
+        weighted_sum = np.bincount(rows[keep], weights=contributions[keep], minlength=n_persons).astype(np.float64, copy=False)
+        total_importance = self.total_importance[occupation_positions]
+        out = np.zeros(n_persons)
+        np.divide(weighted_sum, total_importance, out=out, where=total_importance != 0)
+        return out * 100
+
+    def match_scores(self, person_matrix):
+        """Return the dense N x M matrix of skills-match scores in ``[0, 100]``."""
+        weighted_sum = self.weighted_overlap(person_matrix)
+        out = np.zeros_like(weighted_sum)
+        np.divide(weighted_sum, self.total_importance, out=out, where=self.total_importance != 0)
+        return out * 100
+
+    def match_blocks(self, person_matrix):
+        """Return a ``(start, stop) -> block`` callable for ``matrix.top_k_occupations``."""
+        person_matrix = sparse.csr_matrix(person_matrix)
+        return lambda start, stop: self.match_scores(person_matrix[start:stop])
+
+
+def _present(value):
+    return value is not None and value == value
+
+
+def skills_match_score(user_skills_df, required_skills_df):
+    """Return the skills-match score of one person against one occupation.
+
+    A single pair does not amortize building a ``SkillMatchIndex``, so this
+    joins the two tables through dicts with the same rules as the index: rows
+    with a missing skill name or individual score are ignored and the last
+    entry of a repeated skill wins.
+    """
+    if user_skills_df.empty or required_skills_df.empty:
+        return 0
+    required_by_skill = {
+        skill_name: (required_score, importance)
+        for skill_name, required_score, importance in zip(required_skills_df['skill_name'].tolist(), required_skills_df['required_skill_score'].tolist(), required_skills_df['skill_importance'].tolist())
+        if _present(skill_name)
+    }
+    total_importance = sum(importance for _, importance in required_by_skill.values())
+    if total_importance == 0:
+        return 0.0
+    user_scores = {
+        skill_name: score
+        for skill_name, score in zip(user_skills_df['skill_name'].tolist(), user_skills_df['individual_skill_score'].tolist())
+        if _present(skill_name) and _present(score)
+    }
+    weighted_sum = 0.0
+    for skill_name, score in user_scores.items():
+        if skill_name in required_by_skill:
+            required_score, importance = required_by_skill[skill_name]
+            weighted_sum += (min(score, required_score) / 100) * importance
+    return weighted_sum / total_importance * 100
@@ -0,0 +1,150 @@
+"""Stream-score profile files that do not fit in memory.
+
+Profiles are read in fixed-size chunks from CSV or Parquet, scored with the
+vectorized model in ``ai_readiness.batch`` and appended to the output file
+before the next chunk is read, so memory use is bounded by the chunk size.
+
+Usage::
+
+    python -m ai_readiness.stream profiles.csv scores.parquet --occupation "Data Scientist"
+
+If the profile file has a ``target_occupation`` column it is used per row
+unless ``--occupation`` is given: an explicit occupation applies to every row
+and replaces the column in the output, with a warning. A
+``skills_match_score`` column, when present, feeds the synergy term.
+"""
+import argparse
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from ai_readiness import batch
+from ai_readiness.hr_table import OccupationHRTable
+from ai_readiness.reference_data import OCCUPATIONAL_DATA
+
+PASSTHROUGH_COLUMNS = ['user_id', 'target_occupation']
+
+
+def _is_parquet(path):
+    return os.path.splitext(path)[1].lower() in ('.parquet', '.pq')
+
+
+def read_chunks(path, chunk_size):
+    if _is_parquet(path):
+        import pyarrow.parquet as pq
+
+        for record_batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            yield record_batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunk_size)
+
+
+class ChunkWriter:
+    def __init__(self, path):
+        self.path = path
+        self._parquet_writer = None
+        self._started = False
+
+    def write(self, frame):
+        if _is_parquet(self.path):
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(self.path, table.schema)
+            self._parquet_writer.write_table(table)
+        else:
+            frame.to_csv(self.path, mode='a' if self._started else 'w', header=not self._started, index=False)
+        self._started = True
+
+    def close(self):
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def score_chunk(chunk, hr_table, occupation=None, alpha=0.6, beta=0.15, lambda_val=0.3, gamma_val=0.2, max_possible_match=100):
+    if occupation is not None:
+        if occupation not in hr_table:
+            raise ValueError(f"Unknown occupation: {occupation!r}")
+        hr_score = hr_table.lookup(occupation, lambda_val, gamma_val)['hr_score']
+    elif 'target_occupation' in chunk.columns:
+        hr_score = hr_table.hr_scores(lambda_val, gamma_val)[hr_table.positions(chunk['target_occupation'])]
+    else:
+        raise ValueError("An occupation is required when profiles have no 'target_occupation' column")
+
+    skills_match_score = chunk['skills_match_score'] if 'skills_match_score' in chunk.columns else 0.0
+    scores = batch.score_profiles_with_hr(chunk, hr_score, skills_match_score, alpha, beta, max_possible_match)
+
+    result = chunk[[c for c in PASSTHROUGH_COLUMNS if c in chunk.columns]].copy()
+    if occupation is not None and 'target_occupation' in result.columns:
+        result['target_occupation'] = occupation
+    for column in batch.SCORE_COLUMNS:
+        result[column] = scores[column].to_numpy()
+    return result
+
+
+def stream_scores(input_path, output_path, occupation=None, occupations_df=None, chunk_size=100_000, alpha=0.6, beta=0.15, lambda_val=0.3, gamma_val=0.2, max_possible_match=100, progress=None):
+    """Score ``input_path`` chunk by chunk into ``output_path`` and return run statistics.
+
+    ``progress`` is called after every chunk with ``(rows_done, rows_per_second)``.
+    """
+    hr_table = OccupationHRTable(occupations_df if occupations_df is not None else pd.DataFrame(OCCUPATIONAL_DATA))
+    rows = 0
+    chunks = 0
+    started = time.perf_counter()
+    with ChunkWriter(output_path) as writer:
+        for chunk in read_chunks(input_path, chunk_size):
+            if chunks == 0 and occupation is not None and 'target_occupation' in chunk.columns:
+                warnings.warn(f"{input_path} has a 'target_occupation' column; scoring every row for {occupation!r} instead", stacklevel=2)
+            writer.write(score_chunk(chunk, hr_table, occupation, alpha, beta, lambda_val, gamma_val, max_possible_match))
+            rows += len(chunk)
+            chunks += 1
+            if progress is not None:
+                progress(rows, rows / max(time.perf_counter() - started, 1e-9))
+    elapsed = time.perf_counter() - started
+    return {'rows': rows, 'chunks': chunks, 'seconds': elapsed, 'rows_per_second': rows / elapsed if elapsed else float(np.inf)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stream-score AI-Readiness profiles from CSV/Parquet.")
+    parser.add_argument('input', help="Profile file (.csv or .parquet)")
+    parser.add_argument('output', help="Output file (.csv or .parquet)")
+    parser.add_argument('--occupation', help="Target occupation for every profile; overrides a target_occupation column")
+    parser.add_argument('--occupations', help="Occupation table (.csv or .parquet); defaults to the built-in reference data")
+    parser.add_argument('--chunk-size', type=int, default=100_000)
+    parser.add_argument('--alpha', type=float, default=0.6)
+    parser.add_argument('--beta', type=float, default=0.15)
+    parser.add_argument('--lambda-val', type=float, default=0.3)
+    parser.add_argument('--gamma-val', type=float, default=0.2)
+    parser.add_argument('--max-possible-match', type=float, default=100)
+    parser.add_argument('--quiet', action='store_true')
+    args = parser.parse_args(argv)
+
+    occupations_df = None
+    if args.occupations:
+        occupations_df = pd.read_parquet(args.occupations) if _is_parquet(args.occupations) else pd.read_csv(args.occupations)
+
+    def report(rows, rate):
+        print(f"scored {rows:,} rows ({rate:,.0f} rows/s)", file=sys.stderr)
+
+    stats = stream_scores(
+        args.input, args.output, args.occupation, occupations_df, args.chunk_size,
+        args.alpha, args.beta, args.lambda_val, args.gamma_val, args.max_possible_match,
+        progress=None if args.quiet else report,
+    )
+    print(f"done: {stats['rows']:,} rows in {stats['chunks']} chunks, {stats['seconds']:.2f}s ({stats['rows_per_second']:,.0f} rows/s)", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
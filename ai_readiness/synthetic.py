@@ -0,0 +1,264 @@
+"""Seeded synthetic populations for load testing.
+
+Generates profiles, occupations, occupation required-skill tables, individual
+skill tables and learning-pathway catalogs with the columns of the sample data
+in ``page3.py``. Every value stays inside the range of the matching page1
+widget. The distributions are loosely realistic: profile scores share a latent
+ability factor, errors caught never exceed the errors made, AI-assisted time
+and quality are tied to their unassisted values, and skill popularity follows
+a power law.
+
+Rows are produced in blocks of ``block_rows``, each from its own
+``numpy.random.default_rng((seed, kind, block))``, so a seed yields the same
+rows whatever the output format, and files are written block by block with
+bounded memory.
+
+Usage::
+
+    python -m ai_readiness.synthetic profiles 10000000 profiles.parquet --seed 7 --target-occupations 2000
+    python -m ai_readiness.synthetic occupations 2000 occupations.csv
+    python -m ai_readiness.synthetic required-skills 2000 required_skills.parquet
+    python -m ai_readiness.synthetic individual-skills 100000 individual_skills.parquet
+    python -m ai_readiness.synthetic pathways 500 pathways.csv
+"""
+import argparse
+import sys
+
+import numpy as np
+import pandas as pd
+
+from ai_readiness.encoding import EDUCATION_LEVELS
+from ai_readiness.stream import ChunkWriter
+
+KINDS = ['profiles', 'occupations', 'required-skills', 'individual-skills', 'pathways']
+BLOCK_ROWS = 100_000
+N_SKILLS = 500
+
+EDUCATION_SHARES = {
+    "PhD": 0.04,
+    "Master's": 0.14,
+    "Bachelor's": 0.35,
+    "Associate's/Certificate": 0.10,
+    "HS + significant coursework": 0.12,
+    "Some College": 0.15,
+    "Other": 0.10,
+}
+
+PATHWAY_TYPES = {
+    'AI-Fluency': 'impact_ai_fluency',
+    'Domain+AI Integration': 'impact_domain_expertise',
+    'Adaptive Capacity': 'impact_adaptive_capacity',
+}
+
+
+def _sigmoid(x):
+    return 1 / (1 + np.exp(-x))
+
+
+def _unit(rng, mean, concentration=8.0):
+    """Beta draws in [0, 1] with the given per-row mean."""
+    mean = np.clip(mean, 0.02, 0.98)
+    return rng.beta(mean * concentration, (1 - mean) * concentration)
+
+
+def _percent(rng, loc, scale, size):
+    return np.clip(np.rint(rng.normal(loc, scale, size)), 0, 100).astype(np.int64)
+
+
+def occupation_names(n_occupations, start=0):
+    return [f'Occupation {i:06d}' for i in range(start, start + n_occupations)]
+
+
+def skill_names(n_skills=N_SKILLS):
+    return [f'Skill {i:04d}' for i in range(n_skills)]
+
+
+def _skill_popularity(n_skills):
+    weights = 1 / np.arange(1, n_skills + 1) ** 0.8
+    return np.log(weights / weights.sum())
+
+
+def _distinct_skills(rng, n_rows, counts, n_skills):
+    # Gumbel top-k: per row, the ``counts[i]`` largest perturbed log-popularities
+    # are a weighted sample of distinct skills. Rows are keyed in slices to bound
+    # the (rows x skills) key matrix.
+    popularity = _skill_popularity(n_skills)
+    top = int(counts.max()) if n_rows else 0
+    step = max(1, 4_000_000 // n_skills)
+    skills = []
+    for start in range(0, n_rows, step):
+        keys = popularity + rng.gumbel(size=(min(step, n_rows - start), n_skills))
+        best = np.argpartition(-keys, top - 1, axis=1)[:, :top] if 0 < top < n_skills else np.argsort(-keys, axis=1)[:, :top]
+        best = np.take_along_axis(best, np.argsort(-np.take_along_axis(keys, best, axis=1), axis=1), axis=1)
+        skills.append(best[np.arange(top) < counts[start:start + len(best), None]])
+    return np.repeat(np.arange(n_rows), counts), np.concatenate(skills) if skills else np.empty(0, dtype=np.int64)
+
+
+def profiles(rng, n_rows, start=0, n_occupations=None):
+    """Return ``n_rows`` profiles with ``user_id`` from ``start + 1``.
+
+    With ``n_occupations`` each profile also gets a ``target_occupation`` from
+    ``occupation_names(n_occupations)``.
+    """
+    ability = rng.normal(size=n_rows)
+    data = {'user_id': np.arange(start + 1, start + n_rows + 1)}
+    for column, base in (('prompting_score', 0.2), ('tools_score', 0.0), ('understanding_score', 0.3), ('datalit_score', 0.1)):
+        data[column] = _unit(rng, _sigmoid(base + 0.8 * ability))
+
+    without_ai = np.clip(np.rint(rng.normal(60, 15, n_rows)), 1, 100)
+    data['output_quality_with_ai'] = np.clip(np.rint(without_ai + rng.normal(12, 10, n_rows) + 4 * ability), 0, 100).astype(np.int64)
+    data['output_quality_without_ai'] = without_ai.astype(np.int64)
+    time_without_ai = np.maximum(np.round(rng.gamma(2.0, 3.0, n_rows) * 2) / 2, 0.5)
+    data['time_without_ai'] = time_without_ai
+    data['time_with_ai'] = np.maximum(np.round(time_without_ai * _unit(rng, _sigmoid(-0.5 - 0.4 * ability)) * 2) / 2, 0.5)
+
+    judgment = _sigmoid(0.5 + 0.7 * ability)
+    total_ai_errors = np.minimum(rng.poisson(20, n_rows), 100)
+    data['errors_caught'] = rng.binomial(total_ai_errors, judgment)
+    data['total_ai_errors'] = total_ai_errors
+    total_decisions = np.minimum(rng.poisson(30, n_rows), 100)
+    data['appropriate_trust_decisions'] = rng.binomial(total_decisions, judgment)
+    data['total_decisions'] = total_decisions
+    data['delta_proficiency'] = _unit(rng, _sigmoid(-1.0 + 0.5 * ability), 6.0)
+    data['delta_t_hours_invested'] = np.round(rng.gamma(2.0, 8.0, n_rows))
+
+    data['education_level'] = rng.choice(EDUCATION_LEVELS, n_rows, p=[EDUCATION_SHARES[level] for level in EDUCATION_LEVELS])
+    years_experience = np.minimum(np.rint(rng.gamma(1.8, 5.0, n_rows)), 45).astype(np.int64)
+    data['years_experience'] = years_experience
+    seniority = np.log1p(years_experience) - 1.5
+    data['portfolio_score'] = _unit(rng, _sigmoid(0.3 * seniority + 0.5 * ability))
+    data['recognition_score'] = _unit(rng, _sigmoid(-0.5 + 0.6 * seniority + 0.3 * ability))
+    data['credentials_score'] = _unit(rng, _sigmoid(0.2 * seniority + 0.4 * ability))
+
+    data['cognitive_flexibility'] = _percent(rng, 68 + 6 * ability, 12, n_rows)
+    data['social_emotional_intelligence'] = _percent(rng, 70, 12, n_rows)
+    data['strategic_career_management'] = _percent(rng, 62 + 4 * ability, 14, n_rows)
+
+    frame = pd.DataFrame(data)
+    if n_occupations:
+        frame['target_occupation'] = np.asarray(occupation_names(n_occupations), dtype=object)[rng.integers(0, n_occupations, n_rows)]
+    return frame
+
+
+def occupations(rng, n_rows, start=0):
+    median_wage = np.round(rng.lognormal(np.log(70_000), 0.35, n_rows), -3)
+    growth = np.clip(rng.normal(0.15, 0.12, n_rows), -0.5, 1.0)
+    previous_job_postings = rng.poisson(rng.lognormal(np.log(300), 0.8, n_rows))
+    return pd.DataFrame({
+        'occupation_name': occupation_names(n_rows, start),
+        'ai_enhancement_score': np.round(rng.beta(5, 2, n_rows), 3),
+        'job_growth_rate_g': np.round(growth, 3),
+        'ai_skilled_wage': np.round(median_wage * (1 + rng.gamma(2.0, 0.12, n_rows)), -3),
+        'median_wage': median_wage,
+        'education_years_required': rng.choice([0, 2, 4, 6], n_rows, p=[0.15, 0.25, 0.45, 0.15]),
+        'experience_years_required': np.minimum(rng.poisson(2, n_rows), 10),
+        'current_job_postings': np.maximum(np.rint(previous_job_postings * (1 + growth + rng.normal(0, 0.1, n_rows))), 0).astype(np.int64),
+        'previous_job_postings': previous_job_postings,
+        'remote_work_factor': np.round(rng.beta(2, 3, n_rows), 2),
+        'local_demand': np.round(rng.lognormal(0, 0.2, n_rows), 2),
+        'national_avg_demand': np.ones(n_rows),
+    })
+
+
+def required_skills(rng, n_rows, start=0, n_skills=N_SKILLS):
+    """Return the required skills of occupations ``start`` to ``start + n_rows`` (3 to 12 each)."""
+    counts = rng.integers(3, min(12, n_skills) + 1, n_rows)
+    rows, skills = _distinct_skills(rng, n_rows, counts, n_skills)
+    return pd.DataFrame({
+        'occupation_name': np.asarray(occupation_names(n_rows, start), dtype=object)[rows],
+        'skill_name': np.asarray(skill_names(n_skills), dtype=object)[skills],
+        'required_skill_score': np.clip(np.rint(rng.normal(75, 10, len(rows))), 30, 100).astype(np.int64),
+        'skill_importance': np.round(rng.uniform(0.3, 1.0, len(rows)), 2),
+    })
+
+
+def individual_skills(rng, n_rows, start=0, n_skills=N_SKILLS):
+    """Return the skills of users ``start + 1`` to ``start + n_rows`` (up to 15 each)."""
+    # Draws with replacement and drops repeats: much cheaper than distinct
+    # sampling for millions of users, at the cost of slightly fewer skills.
+    counts = np.minimum(rng.poisson(6, n_rows), min(15, n_skills))
+    popularity = np.exp(_skill_popularity(n_skills))
+    pairs = np.sort(np.repeat(np.arange(n_rows), counts) * n_skills + rng.choice(n_skills, counts.sum(), p=popularity))
+    pairs = pairs[np.r_[True, pairs[1:] != pairs[:-1]]] if len(pairs) else pairs
+    rows, skills = np.divmod(pairs, n_skills)
+    return pd.DataFrame({
+        'user_id': start + 1 + rows,
+        'skill_name': np.asarray(skill_names(n_skills), dtype=object)[skills],
+        'individual_skill_score': np.clip(np.rint(rng.normal(60, 20, len(rows))), 0, 100).astype(np.int64),
+    })
+
+
+def pathways(rng, n_rows, start=0):
+    pathway_type = rng.choice(list(PATHWAY_TYPES), n_rows)
+    data = {
+        'pathway_id': np.arange(start + 1, start + n_rows + 1),
+        'pathway_name': [f'Pathway {i:05d}' for i in range(start + 1, start + n_rows + 1)],
+        'pathway_type': pathway_type,
+    }
+    for kind, column in PATHWAY_TYPES.items():
+        primary = pathway_type == kind
+        data[column] = np.round(np.where(primary, rng.uniform(0.1, 0.25, n_rows), rng.uniform(0.0, 0.1, n_rows)), 3)
+    data['duration_hours'] = np.maximum(np.round(rng.gamma(2.0, 12.0, n_rows)), 1)
+    return pd.DataFrame(data)
+
+
+GENERATORS = {
+    'profiles': profiles,
+    'occupations': occupations,
+    'required-skills': required_skills,
+    'individual-skills': individual_skills,
+    'pathways': pathways,
+}
+
+
+def generate(kind, n_rows, seed=0, block_rows=BLOCK_ROWS, **options):
+    """Yield ``n_rows`` rows of ``kind`` as DataFrames of at most ``block_rows`` rows.
+
+    For ``required-skills`` and ``individual-skills`` the rows are occupations
+    and users; each yields several skill rows.
+    """
+    generator = GENERATORS[kind]
+    for block, start in enumerate(range(0, n_rows, block_rows)):
+        rng = np.random.default_rng((seed, KINDS.index(kind), block))
+        yield generator(rng, min(block_rows, n_rows - start), start, **options)
+
+
+def write(kind, n_rows, path, seed=0, block_rows=BLOCK_ROWS, progress=None, **options):
+    """Generate ``n_rows`` rows of ``kind`` into a CSV/Parquet file and return the number of rows written."""
+    written = 0
+    with ChunkWriter(path) as writer:
+        for frame in generate(kind, n_rows, seed, block_rows, **options):
+            writer.write(frame)
+            written += len(frame)
+            if progress is not None:
+                progress(written)
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic AI-Readiness datasets.")
+    parser.add_argument('kind', choices=KINDS)
+    parser.add_argument('rows', type=int, help="Profiles, occupations, or pathways to generate (users/occupations for skill tables)")
+    parser.add_argument('output', help="Output file (.csv or .parquet)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--block-rows', type=int, default=BLOCK_ROWS)
+    parser.add_argument('--target-occupations', type=int, help="Add a target_occupation column drawn from this many synthetic occupations (profiles only)")
+    parser.add_argument('--skills', type=int, default=N_SKILLS, help="Size of the skill catalog (skill tables only)")
+    parser.add_argument('--quiet', action='store_true')
+    args = parser.parse_args(argv)
+
+    options = {}
+    if args.kind == 'profiles' and args.target_occupations:
+        options['n_occupations'] = args.target_occupations
+    if args.kind in ('required-skills', 'individual-skills'):
+        options['n_skills'] = args.skills
+
+    def report(rows):
+        print(f"wrote {rows:,} rows", file=sys.stderr)
+
+    written = write(args.kind, args.rows, args.output, args.seed, args.block_rows, progress=None if args.quiet else report, **options)
+    print(f"done: {written:,} {args.kind} rows in {args.output}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,222 @@
+"""Readiness trajectories: AI-R over time, updated one period at a time.
+
+A ``TrajectoryStore`` receives one snapshot of profile inputs per person and
+period (``append``) together with that period's job postings per occupation.
+Each append scores only the new rows and keeps two small pieces of state from
+the previous period:
+
+* the job postings of every occupation, so the growth multiplier of period t
+  uses ``current_job_postings`` = postings(t) and ``previous_job_postings`` =
+  postings(t - 1). The reference occupation table provides postings(0) and the
+  postings before it. A period without new postings keeps the last pair, and
+  so does an occupation missing from a period's postings.
+* every person's last technical AI skills score s1. When a snapshot has no
+  ``delta_proficiency``/``delta_t_hours_invested`` columns, the learning
+  velocity is the change in s1 since the person's previous snapshot divided by
+  the snapshot's ``hours_invested``. It is 0 at a person's first snapshot.
+
+Scored rows are kept in append-only column buffers, period after period, with
+each period's rows sorted by ``user_id``. A range of periods is a contiguous
+slice, and a person's rows in a period are found by binary search, so queries
+over millions of person-periods touch only the rows they return.
+"""
+import bisect
+
+import numpy as np
+import pandas as pd
+
+from ai_readiness import batch
+from ai_readiness.hr_table import OccupationHRTable
+from ai_readiness.reference_data import OCCUPATIONAL_DATA
+
+TRAJECTORY_COLUMNS = [
+    'ai_fluency', 'domain_expertise', 'adaptive_capacity', 'learning_velocity', 'vr_score',
+    'growth_multiplier', 'hr_score', 'synergy_percentage', 'ai_r_score',
+]
+INITIAL_CAPACITY = 1024
+
+
+class TrajectoryStore:
+    def __init__(self, occupations_df=None, alpha=0.6, beta=0.15, lambda_val=0.3, gamma_val=0.2, max_possible_match=100):
+        self.hr_table = OccupationHRTable(occupations_df if occupations_df is not None else pd.DataFrame(OCCUPATIONAL_DATA))
+        occupations = self.hr_table.occupations
+        self.alpha, self.beta, self.lambda_val, self.max_possible_match = alpha, beta, lambda_val, max_possible_match
+        self._h_base = self.hr_table.h_base()
+        self._regional = self.hr_table.regional_multipliers(gamma_val)
+
+        self.periods = []
+        self.job_postings = [occupations['current_job_postings'].to_numpy(dtype=np.float64)]
+        self._previous_postings = occupations['previous_job_postings'].to_numpy(dtype=np.float64)
+        self._growth = batch.calculate_growth_multiplier(self.job_postings[0], self._previous_postings, lambda_val)
+
+        self._last_user_ids = np.empty(0, dtype=np.int64)
+        self._last_s1 = np.empty(0)
+
+        self._offsets = [0]
+        self._size = 0
+        self._user_id = np.empty(INITIAL_CAPACITY, dtype=np.int64)
+        self._occupation = np.empty(INITIAL_CAPACITY, dtype=np.int32)
+        self._columns = {column: np.empty(INITIAL_CAPACITY) for column in TRAJECTORY_COLUMNS}
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def n_periods(self):
+        return len(self.periods)
+
+    def _reserve(self, n_rows):
+        needed = self._size + n_rows
+        capacity = len(self._user_id)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        self._user_id = np.resize(self._user_id, capacity)
+        self._occupation = np.resize(self._occupation, capacity)
+        self._columns = {column: np.resize(values, capacity) for column, values in self._columns.items()}
+
+    def _advance_postings(self, job_postings):
+        if job_postings is None:
+            self.job_postings.append(self.job_postings[-1])
+            return
+        postings = pd.Series(job_postings, dtype=np.float64)
+        unknown = postings.index.difference(pd.Index(self.hr_table.occupation_names))
+        if len(unknown):
+            raise ValueError(f"Unknown occupations in job_postings: {sorted(unknown)[:10]}")
+        # Only the occupations given move on; the others keep their last pair.
+        positions = self.hr_table.positions(postings.index)
+        current = self.job_postings[-1].copy()
+        current[positions] = postings.to_numpy()
+        previous = self._previous_postings.copy()
+        previous[positions] = self.job_postings[-1][positions]
+        self._previous_postings = previous
+        self.job_postings.append(current)
+        self._growth = batch.calculate_growth_multiplier(current, self._previous_postings, self.lambda_val)
+
+    def _locate(self, user_ids):
+        """Return where ``user_ids`` are (or would be inserted) in the last-seen state and which are there."""
+        positions = np.searchsorted(self._last_user_ids, user_ids)
+        seen = np.zeros(len(user_ids), dtype=bool)
+        inside = positions < len(self._last_user_ids)
+        seen[inside] = self._last_user_ids[positions[inside]] == user_ids[inside]
+        return positions, seen
+
+    def _learning_inputs(self, snapshots, s1, positions, seen):
+        if 'delta_proficiency' in snapshots and 'delta_t_hours_invested' in snapshots:
+            return snapshots['delta_proficiency'].to_numpy(dtype=np.float64), snapshots['delta_t_hours_invested'].to_numpy(dtype=np.float64)
+        if 'hours_invested' not in snapshots:
+            raise ValueError("Snapshots need 'hours_invested' or both 'delta_proficiency' and 'delta_t_hours_invested'")
+        delta_proficiency = np.zeros(len(s1))
+        delta_proficiency[seen] = s1[seen] - self._last_s1[positions[seen]]
+        return delta_proficiency, snapshots['hours_invested'].to_numpy(dtype=np.float64)
+
+    def _remember_s1(self, user_ids, s1, positions, seen):
+        # Update returning people in place and insert new ones, keeping the state sorted.
+        self._last_s1[positions[seen]] = s1[seen]
+        new = ~seen
+        if new.any():
+            self._last_user_ids = np.insert(self._last_user_ids, positions[new], user_ids[new])
+            self._last_s1 = np.insert(self._last_s1, positions[new], s1[new])
+
+    def append(self, period, snapshots, job_postings=None):
+        """Score the snapshots of a new ``period`` and append them.
+
+        ``snapshots`` holds one row per person with ``user_id``,
+        ``target_occupation`` and the profile fields (see the module docstring
+        for the learning-velocity inputs); an optional ``skills_match_score``
+        column feeds the synergy term. ``job_postings`` maps occupation names
+        to their postings in this period. Returns the scored rows.
+        """
+        if self.periods and not period > self.periods[-1]:
+            raise ValueError(f"Period {period!r} must come after {self.periods[-1]!r}")
+        snapshots = snapshots.sort_values('user_id', kind='stable').reset_index(drop=True)
+        user_ids = snapshots['user_id'].to_numpy(dtype=np.int64)
+        if len(user_ids) > 1 and (np.diff(user_ids) == 0).any():
+            raise ValueError(f"Period {period!r} has several snapshots for one user_id")
+        occupation = self.hr_table.positions(snapshots['target_occupation'])
+
+        s1 = batch.calculate_technical_ai_skills(snapshots['prompting_score'], snapshots['tools_score'], snapshots['understanding_score'], snapshots['datalit_score'])
+        positions, seen = self._locate(user_ids)
+        delta_proficiency, delta_hours = self._learning_inputs(snapshots, s1, positions, seen)
+        profiles = {column: snapshots[column] for column in batch.PROFILE_COLUMNS if column not in ('delta_proficiency', 'delta_t_hours_invested')}
+        profiles['delta_proficiency'] = delta_proficiency
+        profiles['delta_t_hours_invested'] = delta_hours
+        vr = batch.compute_vr_components(profiles)
+
+        self._advance_postings(job_postings)
+        growth = self._growth[occupation]
+        hr_score = batch.calculate_systematic_opportunity(self._h_base[occupation], growth, self._regional[occupation])
+        skills_match_score = snapshots['skills_match_score'].to_numpy(dtype=np.float64) if 'skills_match_score' in snapshots else 0.0
+        vr_score = vr['vr_score'].to_numpy()
+        _, synergy_percentage, ai_r_score = batch.combine_scores(vr_score, hr_score, snapshots['years_experience'], skills_match_score, self.alpha, self.beta, self.max_possible_match)
+
+        scored = {
+            'ai_fluency': vr['ai_fluency'].to_numpy(), 'domain_expertise': vr['domain_expertise'].to_numpy(),
+            'adaptive_capacity': vr['adaptive_capacity'].to_numpy(), 'learning_velocity': vr['s4'].to_numpy(),
+            'vr_score': vr_score, 'growth_multiplier': growth, 'hr_score': hr_score,
+            'synergy_percentage': synergy_percentage, 'ai_r_score': ai_r_score,
+        }
+        n = len(snapshots)
+        self._reserve(n)
+        rows = slice(self._size, self._size + n)
+        self._user_id[rows] = user_ids
+        self._occupation[rows] = occupation
+        for column, values in scored.items():
+            self._columns[column][rows] = values
+        self._size += n
+        self._offsets.append(self._size)
+        self.periods.append(period)
+        self._remember_s1(user_ids, s1, positions, seen)
+        return self._frame(np.arange(rows.start, rows.stop))
+
+    def _period_slice(self, start, stop):
+        first = 0 if start is None else bisect.bisect_left(self.periods, start)
+        last = len(self.periods) if stop is None else bisect.bisect_left(self.periods, stop)
+        return first, max(first, last)
+
+    def _frame(self, rows, columns=None):
+        period_index = np.searchsorted(self._offsets, rows, side='right') - 1
+        frame = pd.DataFrame({
+            'period': np.asarray(self.periods, dtype=object)[period_index] if len(self.periods) else np.empty(0, dtype=object),
+            'user_id': self._user_id[rows],
+            'target_occupation': self.hr_table.encoder.decode(self._occupation[rows]),
+        })
+        for column in columns or TRAJECTORY_COLUMNS:
+            frame[column] = self._columns[column][rows]
+        return frame
+
+    def query(self, user_ids=None, start=None, stop=None, columns=None):
+        """Return the rows of periods in ``[start, stop)``, optionally only for ``user_ids``."""
+        first, last = self._period_slice(start, stop)
+        if user_ids is None:
+            rows = np.arange(self._offsets[first], self._offsets[last])
+        else:
+            wanted = np.unique(np.asarray(user_ids, dtype=np.int64))
+            blocks = []
+            for period in range(first, last):
+                lo, hi = self._offsets[period], self._offsets[period + 1]
+                ids = self._user_id[lo:hi]
+                positions = np.searchsorted(ids, wanted)
+                found = positions < len(ids)
+                found[found] = ids[positions[found]] == wanted[found]
+                blocks.append(lo + positions[found])
+            rows = np.concatenate(blocks) if blocks else np.empty(0, dtype=np.int64)
+        return self._frame(rows, columns)
+
+    def trajectory(self, user_id, columns=None):
+        """Return one person's rows over all periods."""
+        return self.query([user_id], columns=columns)
+
+    def period_means(self, column='ai_r_score', start=None, stop=None):
+        """Return the mean of ``column`` per period in ``[start, stop)``."""
+        first, last = self._period_slice(start, stop)
+        offsets = np.asarray(self._offsets[first:last + 1])
+        counts = np.diff(offsets)
+        nonempty = counts > 0
+        sums = np.zeros(len(counts))
+        if nonempty.any():
+            sums[nonempty] = np.add.reduceat(self._columns[column][offsets[0]:offsets[-1]], offsets[:-1][nonempty] - offsets[0])
+        means = np.full(len(counts), np.nan)
+        np.divide(sums, counts, out=means, where=nonempty)
+        return pd.Series(means, index=pd.Index(self.periods[first:last], name='period'), name=column)
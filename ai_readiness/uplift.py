@@ -0,0 +1,263 @@
+"""Reverse search: the cheapest input changes that reach a target AI-R.
+
+With the occupation, H^R and the timing factor fixed, AI-R depends on a
+person's inputs only through V^R and the skills-match score m::
+
+    AI-R = alpha * V + (1 - alpha) * H^R + k * V * m,    k = beta * H^R * timing / (100 * max_possible_match)
+
+Both are linear in the adjustable inputs ("levers"):
+
+* V^R in the four technical AI skill scores, the three specialization scores
+  and the three adaptive-capacity sliders (``VR_LEVERS``; the weights are read
+  off the ``ai_readiness.batch`` functions);
+* m in the individual score of every skill the occupation requires, up to the
+  required score, at ``importance / total importance`` match points per skill
+  point (the weighting of ``calculate_skills_match_score``).
+
+Effort is linear too: every lever has a cost per unit of change, by default
+1 for a full sweep of its range. The cheapest way to raise V^R (or m) by a
+given amount is then to fill the levers in order of gain per unit of cost,
+which makes the minimum effort ``E_V`` (``E_m``) a convex piecewise-linear
+function of the increase. For a V^R increase x the smallest m that reaches the
+target is a convex decreasing function of x, so the total effort
+``E_V(x) + E_m(m_needed(x) - m)`` is convex in x and its minimum is found by a
+golden-section search, vectorized over all person/occupation pairs at once.
+"""
+import numpy as np
+import pandas as pd
+
+from ai_readiness import batch
+from ai_readiness.attribution import component_weights, linear_weights
+from ai_readiness.hr_table import OccupationHRTable
+from ai_readiness.reference_data import OCCUPATION_REQUIRED_SKILLS_DATA, OCCUPATIONAL_DATA
+from ai_readiness.skills_index import SkillMatchIndex
+
+# Adjustable profile fields and the upper bound of their range.
+VR_LEVERS = {
+    'prompting_score': 1.0, 'tools_score': 1.0, 'understanding_score': 1.0, 'datalit_score': 1.0,
+    'portfolio_score': 1.0, 'recognition_score': 1.0, 'credentials_score': 1.0,
+    'cognitive_flexibility': 100.0, 'social_emotional_intelligence': 100.0, 'strategic_career_management': 100.0,
+}
+SKILL_SCORE_RANGE = 100.0
+SEARCH_ITERATIONS = 64
+GOLDEN = (np.sqrt(5) - 1) / 2
+
+
+def vr_lever_gains():
+    """Return the V^R gained per unit of every ``VR_LEVERS`` field."""
+    vr_weights, _ = component_weights()
+    s1 = linear_weights(batch.calculate_technical_ai_skills, 4)
+    specialization = linear_weights(batch.calculate_specialization_depth, 3)
+    return np.concatenate([vr_weights[0] * s1, vr_weights[6] * specialization, vr_weights[7:10]])
+
+
+def _ladder(capacity, unit_cost):
+    """Precompute the lever offsets for ``_fill``; levers must be sorted by ascending ``unit_cost``."""
+    cumulative = np.cumsum(capacity, axis=1)
+    total = cumulative[:, -1] if capacity.shape[1] else np.zeros(len(capacity))
+    return cumulative - capacity, capacity, unit_cost, total * (1 + 1e-12) + 1e-12
+
+
+def _fill(amount, ladder):
+    """Spend ``amount`` of gain on a ``_ladder``, cheapest levers first.
+
+    Returns the cost (``inf`` where ``amount`` exceeds the total capacity) and
+    the gain taken from each lever.
+    """
+    start, capacity, unit_cost, total = ladder
+    used = np.clip(amount[:, None] - start, 0.0, capacity)
+    return np.where(amount > total, np.inf, (used * unit_cost).sum(axis=1)), used
+
+
+class UpliftSolver:
+    """Finds the minimum-effort profile and skill changes that reach a target AI-R."""
+
+    def __init__(self, occupations_df=None, required_skills_df=None):
+        self.hr_table = OccupationHRTable(occupations_df if occupations_df is not None else pd.DataFrame(OCCUPATIONAL_DATA))
+        required_skills_df = required_skills_df if required_skills_df is not None else pd.DataFrame(OCCUPATION_REQUIRED_SKILLS_DATA)
+        self.skills_index = SkillMatchIndex(required_skills_df, occupation_names=self.hr_table.occupation_names)
+        self._gains = vr_lever_gains()
+        self._required = self._padded_requirements()
+
+    def _padded_requirements(self):
+        # Required skills of every occupation as (M, K) arrays, most important first.
+        scores = self.skills_index.required_scores
+        importance = self.skills_index.required_importance
+        counts = np.diff(scores.indptr)
+        width = int(counts.max()) if counts.size else 0
+        rows = np.repeat(np.arange(len(counts)), counts)
+        order = np.lexsort((-importance.data, rows))
+        slots = np.arange(len(order)) - np.repeat(scores.indptr[:-1], counts)
+        skill = np.full((len(counts), width), -1, dtype=np.int64)
+        required = np.zeros((len(counts), width))
+        weight = np.zeros((len(counts), width))
+        skill[rows, slots] = scores.indices[order]
+        required[rows, slots] = scores.data[order]
+        weight[rows, slots] = importance.data[order]
+        return skill, required, weight
+
+    def _skill_levers(self, profiles, positions, individual_skills_df):
+        """Return the current match, each required skill's id, current score, capacity in points and match points per point."""
+        skill, required, weight = (values[positions] for values in self._required)
+        n, width = skill.shape
+        total_importance = self.skills_index.total_importance[positions]
+        if individual_skills_df is None:
+            current = np.zeros((n, width))
+            match = np.asarray(profiles['skills_match_score'], dtype=np.float64) if 'skills_match_score' in profiles else np.zeros(n)
+            return np.broadcast_to(match, (n,)).copy(), skill, current, np.zeros((n, width)), np.zeros((n, width))
+
+        if 'user_id' in individual_skills_df.columns:
+            person_ids = pd.unique(np.asarray(profiles['user_id']))
+            person_matrix = self.skills_index.encode_individual_skills(individual_skills_df, person_ids)
+            person_rows = pd.Index(person_ids).get_indexer(np.asarray(profiles['user_id']))
+        else:
+            person_matrix = self.skills_index.encode_individual_skills(individual_skills_df, person_column=None)
+            person_rows = np.zeros(n, dtype=np.int64)
+        match = self.skills_index.pair_scores(person_matrix[person_rows], positions)
+
+        valid = skill >= 0
+        current = np.zeros((n, width))
+        if valid.any():
+            rows = np.broadcast_to(person_rows[:, None], skill.shape)
+            current[valid] = np.asarray(person_matrix[rows[valid], skill[valid]]).ravel()
+        capacity = np.where(valid, np.maximum(required - current, 0.0), 0.0)
+        per_point = np.zeros((n, width))
+        np.divide(weight, total_importance[:, None], out=per_point, where=valid & (total_importance[:, None] != 0))
+        capacity[per_point == 0] = 0.0
+        return match, skill, current, capacity, per_point
+
+    def solve(self, profiles, target, individual_skills_df=None, alpha=0.6, beta=0.15, lambda_val=0.3, gamma_val=0.2, max_possible_match=100, costs=None):
+        """Return the cheapest uplift of every row of ``profiles`` to AI-R >= ``target``.
+
+        ``profiles`` holds one row per person/occupation pair: the
+        ``batch.PROFILE_COLUMNS`` fields and ``target_occupation`` (cross-join
+        people and occupations to search several occupations per person).
+        ``target`` is a scalar or per-row array. ``individual_skills_df`` has
+        ``skill_name`` and ``individual_skill_score`` rows, keyed by
+        ``user_id`` (matched to the ``user_id`` column of ``profiles``) or for
+        a single person shared by all rows; without it the skills match is held at the
+        ``skills_match_score`` column (or 0). ``costs`` maps ``VR_LEVERS``
+        fields and ``'skills'`` to the effort of one unit (one skill point)
+        of change.
+
+        Returns ``(plan, skill_changes)``: ``plan`` has one row per profile
+        with the current and reachable scores, the total ``effort`` and a
+        ``<field>_delta`` column per V^R lever; ``skill_changes`` lists every
+        raised skill score. Unreachable targets have ``reachable`` False and
+        NaN effort and deltas.
+        """
+        costs = dict(costs or {})
+        unknown = set(costs) - set(VR_LEVERS) - {'skills'}
+        if unknown:
+            raise ValueError(f"Unknown levers in costs: {sorted(unknown)}")
+        lever_costs = np.array([costs.get(name, 1 / upper) for name, upper in VR_LEVERS.items()], dtype=np.float64)
+        skill_cost = float(costs.get('skills', 1 / SKILL_SCORE_RANGE))
+        if (lever_costs < 0).any() or skill_cost < 0:
+            raise ValueError("Lever costs must be non-negative")
+
+        positions = self.hr_table.positions(profiles['target_occupation'])
+        n = len(positions)
+        target = np.broadcast_to(np.asarray(target, dtype=np.float64), (n,))
+        hr_score = self.hr_table.hr_scores(lambda_val, gamma_val)[positions]
+        timing = batch.calculate_timing_factor(profiles['years_experience'])
+        vr_score = batch.compute_vr_components(profiles)['vr_score'].to_numpy()
+        match, skill, current_skills, skill_capacity, per_point = self._skill_levers(profiles, positions, individual_skills_df)
+        _, _, ai_r_score = batch.combine_scores(vr_score, hr_score, profiles['years_experience'], match, alpha, beta, max_possible_match)
+
+        # V^R levers, cheapest gain first; capacities are in V^R points.
+        order = np.argsort(lever_costs / self._gains, kind='stable')
+        names = np.array(list(VR_LEVERS))[order]
+        gains = self._gains[order]
+        values = np.column_stack([np.asarray(profiles[name], dtype=np.float64) for name in names]) if n else np.zeros((0, len(names)))
+        vr_capacity = np.maximum(np.array([VR_LEVERS[name] for name in names]) - values, 0.0) * gains
+        vr_unit_cost = lever_costs[order] / gains
+        # Skill levers are already ordered by importance, i.e. by cost per match point.
+        match_capacity = skill_capacity * per_point
+        match_unit_cost = np.zeros_like(per_point)
+        np.divide(skill_cost, per_point, out=match_unit_cost, where=per_point != 0)
+        vr_ladder = _ladder(vr_capacity, vr_unit_cost)
+        match_ladder = _ladder(match_capacity, match_unit_cost)
+
+        k = beta * hr_score * timing / (100 * max_possible_match) if max_possible_match != 0 else np.zeros(n)
+        k = np.broadcast_to(k, (n,))
+        goal = target + 1e-9 * np.maximum(1.0, np.abs(target)) - (1 - alpha) * hr_score
+
+        def match_needed(x):
+            vr = vr_score + x
+            slope = k * vr
+            reached = alpha * vr >= goal
+            needed = np.full(n, np.inf)
+            np.divide(goal - alpha * vr, slope, out=needed, where=slope > 0)
+            needed = np.where(reached, -np.inf, needed)
+            return np.maximum(needed - match, 0.0)
+
+        def effort(x):
+            vr_effort, _ = _fill(x, vr_ladder)
+            match_effort, _ = _fill(match_needed(x), match_ladder)
+            return vr_effort + match_effort
+
+        high = vr_capacity.sum(axis=1)
+        reachable = np.isfinite(effort(high))
+        done = ai_r_score >= target
+        low = np.zeros(n)
+        high = np.where(done | ~reachable, 0.0, high)
+        x1 = high - GOLDEN * (high - low)
+        x2 = low + GOLDEN * (high - low)
+        f1, f2 = effort(x1), effort(x2)
+        for _ in range(SEARCH_ITERATIONS):
+            # The infeasible x lie below the feasible ones, so ``high`` always stays feasible.
+            left = np.isfinite(f1) & (f1 <= f2)
+            high = np.where(left, x2, high)
+            low = np.where(left, low, x1)
+            probe = np.where(left, high - GOLDEN * (high - low), low + GOLDEN * (high - low))
+            f_probe = effort(probe)
+            x1, f1, x2, f2 = np.where(left, probe, x2), np.where(left, f_probe, f2), np.where(left, x1, probe), np.where(left, f1, f_probe)
+
+        x = np.where(done, 0.0, high)
+        _, vr_used = _fill(x, vr_ladder)
+        match_increase = np.where(done, 0.0, match_needed(x))
+        _, match_used = _fill(match_increase, match_ladder)
+        deltas = vr_used / gains
+        points = np.zeros_like(match_used)
+        np.divide(match_used, per_point, out=points, where=per_point != 0)
+        total_effort = deltas @ lever_costs[order] + points.sum(axis=1) * skill_cost
+
+        adjusted = {column: profiles[column] for column in batch.PROFILE_COLUMNS}
+        for i, name in enumerate(names):
+            adjusted[name] = values[:, i] + deltas[:, i]
+        vr_after = batch.compute_vr_components(adjusted)['vr_score'].to_numpy()
+        match_after = match + match_used.sum(axis=1)
+        _, _, ai_r_after = batch.combine_scores(vr_after, hr_score, profiles['years_experience'], match_after, alpha, beta, max_possible_match)
+
+        plan = pd.DataFrame({'target_occupation': np.asarray(profiles['target_occupation'])})
+        if 'user_id' in profiles:
+            plan.insert(0, 'user_id', np.asarray(profiles['user_id']))
+        plan['ai_r_score'] = ai_r_score
+        plan['target_ai_r'] = target
+        plan['reachable'] = reachable | done
+        plan['effort'] = np.where(plan['reachable'], total_effort, np.nan)
+        plan['vr_score'] = vr_score
+        plan['vr_score_after'] = vr_after
+        plan['skills_match_score'] = match
+        plan['skills_match_score_after'] = match_after
+        plan['ai_r_score_after'] = ai_r_after
+        delta_columns = dict(zip(names, deltas.T))
+        for name in VR_LEVERS:
+            plan[f'{name}_delta'] = delta_columns[name]
+        unreachable = ~plan['reachable'].to_numpy()
+        plan.loc[unreachable, [f'{name}_delta' for name in VR_LEVERS] + ['vr_score_after', 'skills_match_score_after', 'ai_r_score_after']] = np.nan
+        if isinstance(profiles, pd.DataFrame):
+            plan.index = profiles.index
+
+        raised = (points > 1e-9) & ~unreachable[:, None]
+        rows, slots = np.nonzero(raised)
+        skill_changes = pd.DataFrame({
+            'row': plan.index[rows],
+            'target_occupation': plan['target_occupation'].to_numpy()[rows],
+            'skill_name': np.asarray(self.skills_index.skill_names, dtype=object)[skill[rows, slots]] if len(rows) else np.empty(0, dtype=object),
+            'current_score': current_skills[rows, slots],
+            'new_score': current_skills[rows, slots] + points[rows, slots],
+        })
+        if 'user_id' in plan:
+            skill_changes.insert(1, 'user_id', plan['user_id'].to_numpy()[rows])
+        return plan, skill_changes
@@ -26,17 +26,17 @@ Where:
 This framework allows for dynamic "what-if" scenario planning, enabling users to understand how different learning pathways and career transitions impact their future career prospects.
 """)
 
-page = st.sidebar.selectbox(label="Navigation", options=["AI-Readiness Score", "Pathway Simulation", "Data Explorer"])
-
-if page == "AI-Readiness Score":
+@st.cache_resource
+def load_pages():
     from application_pages.page1 import run_page1
-    run_page1()
-elif page == "Pathway Simulation":
     from application_pages.page2 import run_page2
-    run_page2()
-elif page == "Data Explorer":
     from application_pages.page3 import run_page3
-    run_page3()
+    from application_pages.page4 import run_page4
+    return {"AI-Readiness Score": run_page1, "Pathway Simulation": run_page2, "Data Explorer": run_page3, "Diagnostics": run_page4}
+
+pages = load_pages()
+page = st.sidebar.selectbox(label="Navigation", options=list(pages))
+pages[page]()
 
 
 # License
@@ -0,0 +1,18 @@
+import streamlit as st
+
+from ai_readiness.cache import ResultCache
+from ai_readiness.session_state import PathwayState, ProfileState
+
+@st.cache_resource
+def load_result_cache():
+    return ResultCache()
+
+def load_profile_state():
+    if 'profile' not in st.session_state:
+        st.session_state.profile = ProfileState()
+    return st.session_state.profile
+
+def load_pathway_state():
+    if 'pathway' not in st.session_state:
+        st.session_state.pathway = PathwayState()
+    return st.session_state.pathway
@@ -1,66 +1,108 @@
 
 import streamlit as st
 import pandas as pd
+import plotly.graph_objects as go
 
-def run_page3():
-    st.header("Data Explorer")
+from ai_readiness import batch, synthetic
+from ai_readiness.aggregates import page, summarize
+from ai_readiness.reference_data import OCCUPATIONAL_DATA, reference_frame
+from ai_readiness.similarity import OccupationSimilarityIndex
 
-    st.markdown("This section allows you to explore the synthetic datasets used in this application.")
+POPULATION_SIZES = [10_000, 100_000, 1_000_000]
 
-    individual_profiles_data = {
-        'user_id': [1], 'prompting_score': [0.75], 'tools_score': [0.6],
-        'understanding_score': [0.8], 'datalit_score': [0.9],
-        'output_quality_with_ai': [90], 'output_quality_without_ai': [60],
-        'time_without_ai': [4], 'time_with_ai': [1], 'errors_caught': [15],
-        'total_ai_errors': [20], 'appropriate_trust_decisions': [25],
-        'total_decisions': [30], 'delta_proficiency': [0.3],
-        'delta_t_hours_invested': [10], 'education_level': ["Master's"],
-        'years_experience': [5], 'portfolio_score': [0.85], 'recognition_score': [0.7],
-        'credentials_score': [0.9], 'cognitive_flexibility': [85],
-        'social_emotional_intelligence': [90], 'strategic_career_management': [75]
-    }
-    individual_profiles_df = pd.DataFrame(individual_profiles_data)
-
-    occupational_data = {
-        'occupation_name': ['Data Analyst with AI Skills', 'AI UX Researcher', 'AI Prompt Engineer', 'Data Scientist', 'Nursing Informatics', 'Medical Coding'],
-        'ai_enhancement_score': [0.8, 0.9, 0.7, 0.95, 0.75, 0.6],
-        'job_growth_rate_g': [0.25, 0.35, 0.4, 0.3, 0.2, 0.15],
-        'ai_skilled_wage': [120000, 130000, 140000, 150000, 110000, 90000],
-        'median_wage': [90000, 95000, 100000, 110000, 85000, 70000],
-        'education_years_required': [4, 4, 4, 4, 4, 2],
-        'experience_years_required': [2, 3, 1, 3, 2, 0],
-        'current_job_postings': [500, 400, 600, 700, 300, 200],
-        'previous_job_postings': [400, 300, 450, 500, 250, 180],
-        'remote_work_factor': [0.6, 0.7, 0.8, 0.5, 0.4, 0.3],
-        'local_demand': [1.2, 1.1, 1.3, 1.4, 1.0, 0.9],
-        'national_avg_demand': [1.0, 1.0, 1.0, 1.0, 1.0, 1.0]
-    }
-    occupational_data_df = pd.DataFrame(occupational_data)
-
-    learning_pathways_data = {
-        'pathway_id': [1, 2, 3],
-        'pathway_name': ['Prompt Engineering Fundamentals', 'AI for Financial Analysis', 'Human-AI Collaboration'],
-        'pathway_type': ['AI-Fluency', 'Domain+AI Integration', 'Adaptive Capacity'],
-        'impact_ai_fluency': [0.2, 0.1, 0.05],
-        'impact_domain_expertise': [0.05, 0.2, 0.1],
-        'impact_adaptive_capacity': [0.1, 0.05, 0.2]
-    }
-    learning_pathways_df = pd.DataFrame(learning_pathways_data)
+@st.cache_resource(max_entries=2)
+def load_scored_population(n_rows, occupation, seed):
+    occupational_data_df = reference_frame('occupations')
+    occupation_record = occupational_data_df[occupational_data_df['occupation_name'] == occupation].iloc[0]
+    frames = []
+    for profiles in synthetic.generate('profiles', n_rows, seed):
+        scores = batch.score_population(profiles, occupation_record)
+        scores.insert(0, 'user_id', profiles['user_id'].to_numpy())
+        frames.append(scores[['user_id'] + batch.SCORE_COLUMNS])
+    return pd.concat(frames, ignore_index=True)
 
-    occupation_required_skills_data = {
-        'occupation_name': ['Data Analyst with AI Skills'] * 3 + ['AI UX Researcher'] * 3,
-        'skill_name': ['Python', 'Data Visualization', 'Machine Learning'] + ['User Research', 'UI Design', 'AI Ethics'],
-        'required_skill_score': [80, 70, 60, 90, 80, 75],
-        'skill_importance': [0.7, 0.8, 0.5, 0.9, 0.7, 0.6]
+@st.cache_data(max_entries=16)
+def population_aggregates(n_rows, occupation, seed, bins, n_quantile_bins):
+    aggregates = summarize(load_scored_population(n_rows, occupation, seed))
+    return {
+        column: {'stats': aggregate.stats(), 'histogram': aggregate.histogram(bins), 'quantile_bins': aggregate.quantile_bins(n_quantile_bins)}
+        for column, aggregate in aggregates.items()
     }
-    occupation_required_skills_df = pd.DataFrame(occupation_required_skills_data)
 
-    individual_skills_data = {
-        'user_id': [1] * 3,
-        'skill_name': ['Python', 'Data Visualization', 'Machine Learning'],
-        'individual_skill_score': [70, 60, 40]
-    }
-    individual_skills_df = pd.DataFrame(individual_skills_data)
+@st.cache_resource
+def load_similarity_index():
+    return OccupationSimilarityIndex(reference_frame('occupations'), reference_frame('required_skills'))
+
+def run_similar_occupations():
+    st.subheader("Similar Occupations")
+    st.markdown("Candidate career transitions: the occupations closest to a current one by their market data and required skills.")
+
+    index = load_similarity_index()
+    col1, col2 = st.columns(2)
+    with col1:
+        occupation = st.selectbox("Current Occupation", index.occupation_names)
+    with col2:
+        k = st.slider("Suggestions", 1, len(index) - 1, min(3, len(index) - 1))
+    st.dataframe(index.similar_occupations(occupation, k), hide_index=True)
+
+def run_population_explorer():
+    st.subheader("Population Scores")
+    st.markdown("Scores of a synthetic population against one occupation. Distributions are aggregated on the server and cached, so only the binned counts and one page of rows are sent to the browser.")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        n_rows = st.selectbox("Population Size", POPULATION_SIZES, index=1, format_func=lambda n: f"{n:,}")
+    with col2:
+        occupation = st.selectbox("Occupation", OCCUPATIONAL_DATA['occupation_name'])
+    with col3:
+        seed = st.number_input("Population Seed", value=0, step=1)
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        column = st.selectbox("Score", batch.SCORE_COLUMNS, index=batch.SCORE_COLUMNS.index('ai_r_score'))
+    with col2:
+        bins = st.slider("Histogram Bins", 10, 200, 50)
+    with col3:
+        n_quantile_bins = st.slider("Quantile Bins", 2, 20, 10)
+
+    aggregates = population_aggregates(n_rows, occupation, int(seed), bins, n_quantile_bins)[column]
+    stats = aggregates['stats']
+    metric_cols = st.columns(4)
+    metric_cols[0].metric("Mean", f"{stats['mean']:.2f}")
+    metric_cols[1].metric("Std", f"{stats['std']:.2f}")
+    metric_cols[2].metric("Min", f"{stats['min']:.2f}")
+    metric_cols[3].metric("Max", f"{stats['max']:.2f}")
+
+    histogram = aggregates['histogram']
+    fig = go.Figure(data=[go.Bar(x=(histogram['bin_left'] + histogram['bin_right']) / 2, y=histogram['count'], width=histogram['bin_right'] - histogram['bin_left'])])
+    fig.update_layout(title_text=f'{column} Distribution ({n_rows:,} profiles)', bargap=0)
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.markdown("**Quantile Bins**")
+    st.dataframe(aggregates['quantile_bins'], hide_index=True)
+
+    st.markdown("**Scored Profiles**")
+    col1, col2 = st.columns(2)
+    with col1:
+        page_size = st.selectbox("Rows per Page", [50, 100, 500], index=1)
+    scores = load_scored_population(n_rows, occupation, int(seed))
+    n_pages = -(-len(scores) // page_size)
+    with col2:
+        page_number = st.number_input("Page", min_value=1, max_value=n_pages, value=1, step=1)
+    rows, _ = page(scores, int(page_number), page_size)
+    st.dataframe(rows, hide_index=True)
+    st.caption(f"Page {int(page_number):,} of {n_pages:,} ({len(scores):,} rows)")
+
+def run_page3():
+    st.header("Data Explorer")
+
+    st.markdown("This section allows you to explore the synthetic datasets used in this application.")
+
+    individual_profiles_df = reference_frame('individual_profiles')
+    occupational_data_df = reference_frame('occupations')
+    learning_pathways_df = reference_frame('learning_pathways')
+    occupation_required_skills_df = reference_frame('required_skills')
+    individual_skills_df = reference_frame('individual_skills')
 
     with st.expander("Individual Profiles Data"):
         st.dataframe(individual_profiles_df)
@@ -76,3 +118,6 @@ def run_page3():
         
     with st.expander("Individual Skills Data"):
         st.dataframe(individual_skills_df)
+
+    run_similar_occupations()
+    run_population_explorer()
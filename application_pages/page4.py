@@ -0,0 +1,58 @@
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+
+from ai_readiness.metrics import REGISTRY
+from application_pages.common import load_result_cache
+
+def run_page4():
+    st.header("Diagnostics")
+
+    st.markdown("""
+    Per-stage timings of the scoring pipeline: the $V^R$, $H^R$, skills-match and synergy stages of the AI-Readiness Score page,
+    its chart rendering, and the pathway simulations. Instrumentation is off by default; metrics are collected for every
+    session served by this process once it is enabled. Allocation tracing uses `tracemalloc` and slows the app down noticeably.
+    """)
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        enabled = st.toggle("Enable instrumentation", value=REGISTRY.enabled)
+    with col2:
+        trace_allocations = st.toggle("Trace allocations", value=REGISTRY.trace_allocations, disabled=not enabled)
+    with col3:
+        if st.button("Reset metrics"):
+            REGISTRY.reset()
+
+    if enabled:
+        if not REGISTRY.enabled or trace_allocations != REGISTRY.trace_allocations:
+            REGISTRY.enable(trace_allocations)
+    elif REGISTRY.enabled:
+        REGISTRY.disable()
+
+    st.subheader("Result Cache")
+    result_cache = load_result_cache()
+    cache_stats = result_cache.stats()
+    st.markdown(f"{len(result_cache):,} of {result_cache.maxsize:,} entries, shared by all sessions.")
+    if cache_stats:
+        st.dataframe(pd.DataFrame.from_dict(cache_stats, orient='index').rename_axis('namespace'), use_container_width=True)
+    if st.button("Clear result cache"):
+        result_cache.clear()
+
+    st.subheader("Stage Timings")
+    stats = REGISTRY.snapshot()
+    if not stats:
+        st.info("No stages recorded yet. Enable instrumentation and run a calculation on the other pages.")
+        return
+
+    metrics_df = pd.DataFrame.from_dict(stats, orient='index').rename_axis('stage').sort_index()
+    st.dataframe(metrics_df, use_container_width=True)
+
+    fig = go.Figure(data=[go.Bar(x=metrics_df.index, y=metrics_df['mean_seconds'] * 1000)])
+    fig.update_layout(title_text='Mean Time per Stage', yaxis_title='ms')
+    st.plotly_chart(fig, use_container_width=True)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button("Download JSON", REGISTRY.to_json(), file_name="ai_readiness_metrics.json", mime="application/json")
+    with col2:
+        st.download_button("Download Prometheus Metrics", REGISTRY.to_prometheus(), file_name="ai_readiness_metrics.prom", mime="text/plain")
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ai_readiness import aggregates
+
+
+def test_chunked_statistics_match_numpy():
+    rng = np.random.default_rng(0)
+    # A large offset, where E[x^2] - E[x]^2 loses every significant digit.
+    values = 1e6 + rng.normal(0, 1e-2, 100_000)
+    aggregate = aggregates.ColumnAggregate(values.min(), values.max())
+    for chunk in np.array_split(values, 37):
+        aggregate.update(chunk)
+    stats = aggregate.stats()
+    assert stats['count'] == values.size
+    assert stats['mean'] == pytest.approx(values.mean(), rel=1e-15)
+    assert stats['std'] == pytest.approx(values.std(), rel=1e-9)
+    assert (stats['min'], stats['max']) == (values.min(), values.max())
+
+
+def test_missing_and_infinite_values_are_only_counted():
+    aggregate = aggregates.ColumnAggregate(0, 10).update([1.0, np.nan, np.inf, -np.inf, 3.0, np.nan])
+    stats = aggregate.stats()
+    assert (stats['count'], stats['missing'], stats['infinite']) == (2, 2, 2)
+    assert (stats['mean'], stats['std']) == (2.0, 1.0)
+
+
+def test_empty_aggregate_has_no_statistics():
+    aggregate = aggregates.ColumnAggregate(0, 1).update([np.nan])
+    stats = aggregate.stats()
+    assert stats['count'] == 0 and np.isnan(stats['mean']) and np.isnan(stats['std'])
+    assert np.isnan(aggregate.quantiles([0.5])).all()
+
+
+def test_histogram_and_quantiles_follow_the_data():
+    rng = np.random.default_rng(1)
+    values = rng.uniform(0, 100, 200_000)
+    aggregate = aggregates.ColumnAggregate(0, 100).update(values)
+    histogram = aggregate.histogram(50)
+    # Display bins are unions of fine bins, so their counts are exact.
+    edges = np.append(histogram['bin_left'].to_numpy(), histogram['bin_right'].iloc[-1])
+    np.testing.assert_array_equal(histogram['count'], np.histogram(values, bins=edges)[0])
+    np.testing.assert_allclose(np.diff(edges), 2.0, atol=100 / aggregate.fine_bins)
+
+    qs = np.linspace(0, 1, 11)
+    np.testing.assert_allclose(aggregate.quantiles(qs), np.quantile(values, qs), atol=100 / aggregate.fine_bins)
+    bins = aggregate.quantile_bins(4)
+    assert bins['count'].sum() == values.size
+    assert list(bins['bin']) == [1, 2, 3, 4]
+
+
+def test_summarize_takes_ranges_from_the_data():
+    rng = np.random.default_rng(2)
+    frame = pd.DataFrame({'vr_score': rng.uniform(10, 20, 5_000), 'ai_r_score': rng.uniform(-5, 5, 5_000)})
+    frame.loc[3, 'ai_r_score'] = np.nan
+    result = aggregates.summarize(frame, columns=['vr_score', 'ai_r_score'], ranges={'vr_score': (0, 100)}, chunk_rows=777)
+    assert (result['vr_score'].low, result['vr_score'].high) == (0, 100)
+    assert (result['ai_r_score'].low, result['ai_r_score'].high) == (frame['ai_r_score'].min(), frame['ai_r_score'].max())
+    assert result['ai_r_score'].stats()['missing'] == 1
+    assert result['vr_score'].stats()['mean'] == pytest.approx(frame['vr_score'].mean(), rel=1e-12)
+
+
+def test_page_clamps_the_page_number():
+    frame = pd.DataFrame({'x': range(250)})
+    rows, n_pages = aggregates.page(frame, 9, page_size=100)
+    assert n_pages == 3 and list(rows['x']) == list(range(200, 250))
+    rows, _ = aggregates.page(frame, 0, page_size=100)
+    assert rows['x'].iloc[0] == 0
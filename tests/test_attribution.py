@@ -0,0 +1,22 @@
+import numpy as np
+import pytest
+
+from ai_readiness import batch, synthetic
+from ai_readiness.attribution import attribute, term_totals
+
+
+@pytest.mark.parametrize('alpha, beta', [(0.6, 0.15), (0.0, 1.0), (1.0, 0.0)])
+def test_contributions_sum_to_the_score(alpha, beta):
+    rng = np.random.default_rng(0)
+    profiles = synthetic.profiles(rng, 500)
+    occupations = synthetic.occupations(rng, 500)
+    occupations.loc[::7, 'previous_job_postings'] = 0
+    skills_match_score = rng.uniform(0, 100, 500)
+    expected = batch.score_population(profiles, occupations, skills_match_score, alpha, beta, 0.4, 0.3)
+
+    frame = attribute(profiles, occupations, skills_match_score, alpha, beta, 0.4, 0.3)
+    np.testing.assert_allclose(frame.sum(axis=1), expected['ai_r_score'], rtol=1e-12, atol=1e-12)
+    totals = term_totals(frame)
+    np.testing.assert_allclose(totals['vr'], alpha * expected['vr_score'], rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(totals['hr'], (1 - alpha) * expected['hr_score'], rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(totals['synergy'], beta * expected['synergy_percentage'], rtol=1e-12, atol=1e-12)
@@ -0,0 +1,147 @@
+import inspect
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ai_readiness import batch, model, synthetic
+from ai_readiness.encoding import EDUCATION_LEVELS
+from ai_readiness.hr_table import OccupationHRTable
+from ai_readiness.reference_data import OCCUPATION_REQUIRED_SKILLS_DATA, OCCUPATIONAL_DATA
+from ai_readiness.skills_index import SkillMatchIndex
+
+N_ROWS = 2_000
+
+# Every vectorized function that mirrors a scalar one with numeric arguments.
+NUMERIC_FUNCTIONS = [
+    name for name, function in inspect.getmembers(batch, inspect.isfunction)
+    if name.startswith('calculate_') and name != 'calculate_education_foundation' and hasattr(model, name)
+]
+
+
+def _edge_values(rng, n_rows):
+    """Non-negative values with many zeros and small integers, to hit every zero-denominator branch."""
+    kind = rng.integers(0, 4, n_rows)
+    return np.select(
+        [kind == 0, kind == 1, kind == 2],
+        [0.0, rng.integers(1, 6, n_rows).astype(np.float64), rng.random(n_rows)],
+        default=rng.uniform(0, 100, n_rows),
+    )
+
+
+def _required_arguments(function):
+    return [name for name, parameter in inspect.signature(function).parameters.items() if parameter.default is inspect.Parameter.empty]
+
+
+def test_every_vectorized_function_has_a_scalar_counterpart():
+    vectorized = {name for name, _ in inspect.getmembers(batch, inspect.isfunction) if name.startswith('calculate_')}
+    assert vectorized - set(dir(model)) == set()
+    assert len(NUMERIC_FUNCTIONS) == len(vectorized) - 1
+
+
+@pytest.mark.parametrize('name', NUMERIC_FUNCTIONS)
+def test_function_matches_scalar_model_exactly(name):
+    rng = np.random.default_rng(list(map(ord, name)))
+    arguments = [_edge_values(rng, N_ROWS) for _ in _required_arguments(getattr(model, name))]
+    expected = np.array([getattr(model, name)(*row) for row in zip(*(values.tolist() for values in arguments))], dtype=np.float64)
+    np.testing.assert_array_equal(getattr(batch, name)(*arguments), expected)
+
+
+def test_growth_multiplier_matches_scalar_model_for_every_lambda():
+    rng = np.random.default_rng(3)
+    current, previous = _edge_values(rng, N_ROWS), _edge_values(rng, N_ROWS)
+    for lambda_val in (0.0, 0.1, 0.3, 0.7, 1.0):
+        expected = [model.calculate_growth_multiplier(c, p, lambda_val) for c, p in zip(current.tolist(), previous.tolist())]
+        np.testing.assert_array_equal(batch.calculate_growth_multiplier(current, previous, lambda_val), expected)
+
+
+def test_education_foundation_matches_scalar_model():
+    levels = np.array(EDUCATION_LEVELS * 3, dtype=object)
+    np.testing.assert_array_equal(batch.calculate_education_foundation(levels), [model.calculate_education_foundation(level) for level in levels])
+
+
+def test_education_foundation_rejects_unknown_levels():
+    with pytest.raises(ValueError, match='Bogus'):
+        batch.calculate_education_foundation(np.array(["PhD", "Bogus"], dtype=object))
+
+
+def _scalar_vr(row):
+    s1 = model.calculate_technical_ai_skills(row['prompting_score'], row['tools_score'], row['understanding_score'], row['datalit_score'])
+    s2 = model.calculate_ai_augmented_productivity(row['output_quality_with_ai'], row['output_quality_without_ai'], row['time_without_ai'], row['time_with_ai'])
+    s3 = model.calculate_critical_ai_judgment(row['errors_caught'], row['total_ai_errors'], row['appropriate_trust_decisions'], row['total_decisions'])
+    s4 = model.calculate_ai_learning_velocity(row['delta_proficiency'], row['delta_t_hours_invested'])
+    ai_fluency = model.calculate_ai_fluency(s1, s2, s3, s4)
+    education_foundation = model.calculate_education_foundation(row['education_level'])
+    practical_experience = model.calculate_practical_experience(row['years_experience'])
+    specialization_depth = model.calculate_specialization_depth(row['portfolio_score'], row['recognition_score'], row['credentials_score'])
+    domain_expertise = model.calculate_domain_expertise(education_foundation, practical_experience, specialization_depth)
+    adaptive_capacity = model.calculate_adaptive_capacity(row['cognitive_flexibility'], row['social_emotional_intelligence'], row['strategic_career_management'])
+    return ai_fluency, domain_expertise, adaptive_capacity, model.calculate_idiosyncratic_readiness(ai_fluency, domain_expertise, adaptive_capacity)
+
+
+def _scalar_hr(row, lambda_val=0.3, gamma_val=0.2):
+    h_base = model.calculate_base_opportunity_score(
+        model.calculate_ai_enhancement_potential(row['ai_enhancement_score']),
+        model.calculate_job_growth_projection(row['job_growth_rate_g']),
+        model.calculate_wage_premium(row['ai_skilled_wage'], row['median_wage']),
+        model.calculate_entry_accessibility(row['education_years_required'], row['experience_years_required']),
+    )
+    growth_multiplier = model.calculate_growth_multiplier(row['current_job_postings'], row['previous_job_postings'], lambda_val)
+    regional_multiplier = model.calculate_regional_multiplier(row['local_demand'], row['national_avg_demand'], row['remote_work_factor'], gamma_val)
+    return model.calculate_systematic_opportunity(h_base, growth_multiplier, regional_multiplier)
+
+
+def test_compute_vr_components_matches_scalar_model():
+    profiles = synthetic.profiles(np.random.default_rng(0), 500)
+    # Zero denominators that the synthetic generator never produces.
+    profiles.loc[::7, 'output_quality_without_ai'] = 0
+    profiles.loc[::11, ['total_ai_errors', 'total_decisions']] = 0
+    profiles.loc[::13, 'delta_t_hours_invested'] = 0
+    vr = batch.compute_vr_components(profiles)
+    expected = np.array([_scalar_vr(row) for row in profiles.to_dict('records')])
+    np.testing.assert_array_equal(vr[['ai_fluency', 'domain_expertise', 'adaptive_capacity', 'vr_score']].to_numpy(), expected)
+
+
+def test_compute_hr_components_matches_scalar_model():
+    occupations = synthetic.occupations(np.random.default_rng(1), 300)
+    occupations.loc[::5, 'previous_job_postings'] = 0
+    occupations.loc[::7, 'national_avg_demand'] = 0
+    occupations.loc[::9, 'median_wage'] = 0
+    for lambda_val, gamma_val in ((0.3, 0.2), (0.0, 1.0), (0.85, 0.05)):
+        hr = batch.compute_hr_components(occupations, lambda_val, gamma_val)
+        expected = [_scalar_hr(row, lambda_val, gamma_val) for row in occupations.to_dict('records')]
+        np.testing.assert_array_equal(hr['hr_score'].to_numpy(), expected)
+
+
+def test_score_profiles_with_hr_matches_page1_score_graph():
+    occupations = pd.DataFrame(OCCUPATIONAL_DATA)
+    required_skills = pd.DataFrame(OCCUPATION_REQUIRED_SKILLS_DATA)
+    hr_table = OccupationHRTable(occupations)
+    skills_index = SkillMatchIndex(required_skills, occupation_names=hr_table.occupation_names)
+    graph = model.build_score_graph(hr_table, required_skills)
+
+    rng = np.random.default_rng(2)
+    n_profiles = 40
+    profiles = synthetic.profiles(rng, n_profiles)
+    profiles['target_occupation'] = rng.choice(hr_table.occupation_names, n_profiles)
+    skill_names = required_skills['skill_name'].unique()
+    individual_skills = pd.DataFrame({
+        'user_id': np.repeat(profiles['user_id'].to_numpy(), 3),
+        'skill_name': rng.choice(skill_names, 3 * n_profiles),
+        'individual_skill_score': rng.integers(0, 101, 3 * n_profiles),
+    })
+
+    positions = hr_table.positions(profiles['target_occupation'])
+    skills_match_score = skills_index.pair_scores(skills_index.encode_individual_skills(individual_skills, person_ids=profiles['user_id']), positions)
+    scores = batch.score_profiles_with_hr(profiles, hr_table.hr_scores(0.3, 0.2)[positions], skills_match_score, alpha=0.6, beta=0.15, max_possible_match=100)
+
+    for i, row in enumerate(profiles.to_dict('records')):
+        graph.update({
+            **{name: row[name] for name in batch.PROFILE_COLUMNS + ['target_occupation']},
+            'lambda_val': 0.3, 'gamma_val': 0.2, 'alpha': 0.6, 'beta': 0.15, 'max_possible_skills_match': 100,
+            'individual_skills': individual_skills[individual_skills['user_id'] == row['user_id']][['skill_name', 'individual_skill_score']],
+        })
+        expected = graph.evaluate(['vr_score', 'hr_score', 'synergy_percentage', 'ai_r_score'])
+        assert scores['vr_score'].iloc[i] == expected['vr_score']
+        assert scores['hr_score'].iloc[i] == expected['hr_score']
+        np.testing.assert_allclose(scores[['synergy_percentage', 'ai_r_score']].iloc[i].to_numpy(), [expected['synergy_percentage'], expected['ai_r_score']], rtol=1e-12)
@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ai_readiness import batch, model, synthetic
+from ai_readiness.cache import ResultCache, cached_scores, profile_key
+from ai_readiness.hr_table import OccupationHRTable
+from ai_readiness.reference_data import OCCUPATION_REQUIRED_SKILLS_DATA, OCCUPATIONAL_DATA
+
+
+@pytest.fixture
+def occupations():
+    return synthetic.occupations(np.random.default_rng(0), 30)
+
+
+def test_hr_scores_match_batch_components(occupations):
+    table = OccupationHRTable(occupations)
+    for lambda_val, gamma_val in ((0.3, 0.2), (0.0, 0.0), (0.9, 0.6), (0.3, 0.2)):
+        expected = batch.compute_hr_components(occupations, lambda_val, gamma_val)['hr_score'].to_numpy()
+        np.testing.assert_array_equal(table.hr_scores(lambda_val, gamma_val), expected)
+    record = table.lookup(occupations['occupation_name'].iloc[4], 0.9, 0.6)
+    assert record['hr_score'] == batch.compute_hr_components(occupations, 0.9, 0.6)['hr_score'].iloc[4]
+
+
+def test_cached_arrays_are_read_only_and_never_change(occupations):
+    table = OccupationHRTable(occupations)
+    growth = table.growth_multipliers(0.5)
+    before = growth.copy()
+    with pytest.raises(ValueError):
+        growth[0] = 0.0
+
+    record = occupations.iloc[0].to_dict()
+    record['current_job_postings'] *= 3
+    table.upsert(record)
+    np.testing.assert_array_equal(growth, before)
+    updated = table.growth_multipliers(0.5)
+    assert updated[0] != before[0]
+    np.testing.assert_array_equal(updated[1:], before[1:])
+    occupations.loc[0, 'current_job_postings'] *= 3
+    np.testing.assert_array_equal(updated, batch.compute_hr_components(occupations, 0.5, 0.2)['growth_multiplier'].to_numpy())
+
+
+def test_upsert_appends_new_occupations_and_notifies_listeners(occupations):
+    table = OccupationHRTable(occupations.iloc[:-1])
+    table.hr_scores(0.3, 0.2)
+    changed = []
+    table.add_listener(changed.append)
+    new = occupations.iloc[-1].to_dict()
+    table.upsert(new)
+    assert changed == [new['occupation_name']]
+    assert len(table) == len(occupations)
+    np.testing.assert_array_equal(table.hr_scores(0.3, 0.2), batch.compute_hr_components(occupations, 0.3, 0.2)['hr_score'].to_numpy())
+    assert table.positions([new['occupation_name']])[0] == len(occupations) - 1
+    with pytest.raises(ValueError):
+        table.positions(['Unknown occupation'])
+
+
+def _inputs(occupation):
+    profile = synthetic.profiles(np.random.default_rng(1), 1).iloc[0].to_dict()
+    inputs = {name: profile[name] for name in batch.PROFILE_COLUMNS}
+    inputs.update({
+        'target_occupation': occupation, 'lambda_val': 0.3, 'gamma_val': 0.2, 'alpha': 0.6, 'beta': 0.15,
+        'max_possible_skills_match': 100,
+        'individual_skills': pd.DataFrame({'skill_name': ['Python Programming'], 'individual_skill_score': [70]}),
+    })
+    assert set(inputs) == set(model.SCORE_GRAPH_INPUTS)
+    return inputs
+
+
+def test_cached_scores_follow_occupation_updates():
+    occupations = pd.DataFrame(OCCUPATIONAL_DATA)
+    table = OccupationHRTable(occupations)
+    graph = model.build_score_graph(table, pd.DataFrame(OCCUPATION_REQUIRED_SKILLS_DATA))
+    cache = ResultCache()
+    table.add_listener(lambda name: cache.invalidate('hr', 'ai_r'))
+    name = table.occupation_names[0]
+    inputs = _inputs(name)
+
+    first = cached_scores(graph, cache, inputs)
+    assert cached_scores(graph, cache, inputs) == first
+    assert cache.stats()['ai_r']['hits'] == 1
+
+    record = occupations.iloc[0].to_dict()
+    record['ai_enhancement_score'] /= 2
+    table.upsert(record)
+    second = cached_scores(graph, cache, inputs)
+    assert second['hr_score'] == table.lookup(name)['hr_score'] < first['hr_score']
+    assert second['vr_score'] == first['vr_score']
+
+
+def test_profile_key_normalizes_equal_inputs():
+    inputs = _inputs('Data Scientist')
+    same = {**inputs, 'years_experience': float(inputs['years_experience']),
+            'individual_skills': pd.DataFrame({'skill_name': ['Python Programming', 'Python Programming'], 'individual_skill_score': [10, 70]})}
+    assert profile_key(inputs) == profile_key(same)
+    assert profile_key(inputs) != profile_key({**inputs, 'alpha': 0.5})
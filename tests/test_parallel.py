@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from ai_readiness import batch, matrix, synthetic
+from ai_readiness.hr_table import OccupationHRTable
+from ai_readiness.parallel import ParallelScorer
+from ai_readiness.skills_index import SkillMatchIndex
+
+
+@pytest.fixture(scope='module')
+def population():
+    rng = np.random.default_rng(0)
+    occupations = synthetic.occupations(rng, 40)
+    required_skills = synthetic.required_skills(rng, 40, n_skills=80)
+    profiles = synthetic.profiles(rng, 300, n_occupations=40)
+    individual_skills = synthetic.individual_skills(rng, 300, n_skills=80)
+    return occupations, required_skills, profiles, individual_skills
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_score_matches_in_process_path(population, workers):
+    occupations, required_skills, profiles, individual_skills = population
+    hr_table = OccupationHRTable(occupations)
+    index = SkillMatchIndex(required_skills, occupation_names=hr_table.occupation_names)
+    positions = hr_table.positions(profiles['target_occupation'])
+    skills_match_score = index.pair_scores(index.encode_individual_skills(individual_skills, person_ids=profiles['user_id']), positions)
+    expected = batch.score_profiles_with_hr(profiles, hr_table.hr_scores(0.4, 0.1)[positions], skills_match_score, alpha=0.5, beta=0.2)
+
+    scorer = ParallelScorer(occupations, required_skills, workers=workers, chunk_size=64)
+    scores = scorer.score(profiles, profiles['target_occupation'], individual_skills, alpha=0.5, beta=0.2, lambda_val=0.4, gamma_val=0.1)
+    np.testing.assert_array_equal(scores.to_numpy(), expected[batch.SCORE_COLUMNS].to_numpy())
+    assert scores.index.equals(profiles.index)
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_top_k_matches_in_process_path(population, workers):
+    occupations, required_skills, profiles, individual_skills = population
+    index = SkillMatchIndex(required_skills, occupation_names=list(occupations['occupation_name']))
+    skills_match = index.match_scores(index.encode_individual_skills(individual_skills, person_ids=profiles['user_id']))
+    expected_indices, expected_scores = matrix.top_k_occupations(profiles, occupations, k=5, skills_match=skills_match)
+
+    scorer = ParallelScorer(occupations, required_skills, workers=workers, chunk_size=64)
+    indices, scores = scorer.top_k(profiles, k=5, individual_skills_df=individual_skills)
+    np.testing.assert_array_equal(indices, expected_indices)
+    np.testing.assert_array_equal(scores, expected_scores)
@@ -0,0 +1,76 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from ai_readiness import batch, synthetic
+from ai_readiness.profile_store import STORE_SCHEMA, ProfileStore, ProfileStoreWriter, write_profiles
+
+
+@pytest.fixture
+def profiles():
+    return synthetic.profiles(np.random.default_rng(0), 500)
+
+
+def test_round_trip_keeps_values_at_their_stored_width(profiles, tmp_path):
+    store = write_profiles(profiles, tmp_path / 'roster.profiles')
+    assert len(store) == len(profiles)
+    frame = store.to_frame()
+    for column, dtype in STORE_SCHEMA.items():
+        if column == 'education_level':
+            assert list(frame[column]) == list(profiles[column])
+        else:
+            np.testing.assert_array_equal(frame[column], profiles[column].to_numpy().astype(dtype))
+
+
+def test_scores_match_the_frame_path_within_float32_precision(profiles, tmp_path):
+    store = write_profiles(profiles, tmp_path / 'roster.profiles')
+    occupation = synthetic.occupations(np.random.default_rng(1), 1).iloc[0]
+    expected = batch.score_population(profiles, occupation)
+    scores = batch.score_population(store, occupation)
+    np.testing.assert_allclose(scores['ai_r_score'], expected['ai_r_score'], rtol=1e-6)
+    # Slices score the same rows as the whole store.
+    chunks = [batch.score_population(chunk, occupation)['ai_r_score'] for chunk in store.iter_chunks(128)]
+    np.testing.assert_array_equal(np.concatenate(chunks), scores['ai_r_score'])
+
+
+def test_large_integer_ids_are_stored_exactly(profiles, tmp_path):
+    profiles['user_id'] = 2**62 + np.arange(len(profiles), dtype=np.int64)
+    store = write_profiles(profiles, tmp_path / 'roster.profiles')
+    np.testing.assert_array_equal(store['user_id'], profiles['user_id'])
+
+
+def test_fractional_counts_are_rejected(profiles, tmp_path):
+    profiles['errors_caught'] = profiles['errors_caught'].astype(np.float64) + 0.5
+    with pytest.raises(ValueError, match='errors_caught'):
+        write_profiles(profiles, tmp_path / 'roster.profiles')
+
+
+def test_missing_and_unknown_education_levels_are_not_scored(profiles, tmp_path):
+    profiles['education_level'] = profiles['education_level'].astype(object)
+    profiles.loc[[3, 7], 'education_level'] = None
+    store = write_profiles(profiles, tmp_path / 'missing.profiles')
+    with pytest.raises(ValueError, match='missing for 2 profiles'):
+        store['education_foundation']
+    assert store.rows(8, 500)['education_foundation'].shape == (492,)
+
+    profiles.loc[[3, 7], 'education_level'] = 'Apprenticeship'
+    store = write_profiles(profiles, tmp_path / 'unknown.profiles')
+    with pytest.raises(ValueError, match='Apprenticeship'):
+        store['education_foundation']
+
+
+def test_store_pickles_as_its_path_and_rows(profiles, tmp_path):
+    store = write_profiles(profiles, tmp_path / 'roster.profiles').rows(100, 200)
+    copy = pickle.loads(pickle.dumps(store))
+    assert (copy.start, copy.stop) == (100, 200)
+    np.testing.assert_array_equal(copy['user_id'], store['user_id'])
+
+
+def test_failed_write_leaves_no_manifest(profiles, tmp_path):
+    path = tmp_path / 'roster.profiles'
+    with pytest.raises(ValueError):
+        with ProfileStoreWriter(path) as writer:
+            writer.write(profiles.drop(columns='years_experience'))
+    with pytest.raises(FileNotFoundError):
+        ProfileStore(path)
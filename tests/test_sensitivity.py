@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from ai_readiness import batch, sensitivity, synthetic
+
+
+@pytest.fixture(scope='module')
+def population():
+    rng = np.random.default_rng(0)
+    profiles = synthetic.profiles(rng, 200)
+    occupations = synthetic.occupations(rng, 200)
+    # Rows whose growth and regional terms take the zero-denominator branches.
+    occupations.loc[::9, 'previous_job_postings'] = 0
+    occupations.loc[::11, 'national_avg_demand'] = 0
+    return profiles, occupations, rng.uniform(0, 100, 200)
+
+
+def test_scores_match_batch_scoring(population):
+    profiles, occupations, skills_match_score = population
+    samples = sensitivity.latin_hypercube(5, seed=1)
+    result = sensitivity.evaluate(profiles, occupations, samples, skills_match_score)
+    for i, parameters in enumerate(samples.to_dict('records')):
+        hr_score = batch.compute_hr_components(occupations, parameters['lambda_val'], parameters['gamma_val'])['hr_score'].to_numpy()
+        expected = batch.score_profiles_with_hr(profiles, hr_score, skills_match_score, alpha=parameters['alpha'], beta=parameters['beta'])
+        np.testing.assert_allclose(result['hr_score'][i], expected['hr_score'], rtol=1e-12)
+        np.testing.assert_allclose(result['ai_r_score'][i], expected['ai_r_score'], rtol=1e-12)
+
+
+@pytest.mark.parametrize('name', sensitivity.PARAMETERS)
+def test_derivatives_match_central_differences(population, name):
+    profiles, occupations, skills_match_score = population
+    samples = sensitivity.latin_hypercube(4, bounds={p: (0.1, 0.9) for p in sensitivity.PARAMETERS}, seed=2)
+    result = sensitivity.evaluate(profiles, occupations, samples, skills_match_score)
+    step = 1e-6
+    above = sensitivity.evaluate(profiles, occupations, samples.assign(**{name: samples[name] + step}), skills_match_score)['ai_r_score']
+    below = sensitivity.evaluate(profiles, occupations, samples.assign(**{name: samples[name] - step}), skills_match_score)['ai_r_score']
+    np.testing.assert_allclose(result[f'd_{name}'], (above - below) / (2 * step), rtol=1e-5, atol=1e-5)
+
+
+def test_elasticities_and_summary(population):
+    profiles, occupations, skills_match_score = population
+    samples = sensitivity.parameter_grid(alpha=[0.2, 0.8], gamma_val=[0.0, 0.5])
+    assert len(samples) == 4
+    result = sensitivity.evaluate(profiles, occupations, samples, skills_match_score)
+    alpha = samples['alpha'].to_numpy()[:, None]
+    np.testing.assert_allclose(result['elasticity_alpha'], result['d_alpha'] * alpha / result['ai_r_score'])
+    summary = sensitivity.summarize(result)
+    assert list(summary[sensitivity.PARAMETERS].itertuples(index=False, name=None)) == list(samples.itertuples(index=False, name=None))
+    np.testing.assert_allclose(summary['ai_r_mean'], result['ai_r_score'].mean(axis=1))
+
+
+def test_latin_hypercube_covers_every_stratum():
+    samples = sensitivity.latin_hypercube(20, bounds={'alpha': (0.2, 0.4)}, seed=3)
+    for name in sensitivity.PARAMETERS:
+        low, high = (0.2, 0.4) if name == 'alpha' else sensitivity.DEFAULT_BOUNDS[name]
+        strata = np.floor((samples[name] - low) / (high - low) * 20).astype(int)
+        assert sorted(strata) == list(range(20))
@@ -0,0 +1,89 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ai_readiness import model
+from ai_readiness.sequence import IMPACT_COLUMNS, VR_WEIGHTS, optimize_sequence
+
+
+def _catalog(rng, n_pathways):
+    catalog = pd.DataFrame({'pathway_name': [f'pathway_{i}' for i in range(n_pathways)]})
+    for column in IMPACT_COLUMNS:
+        catalog[column] = rng.uniform(0, 0.3, n_pathways)
+    catalog['cost'] = rng.integers(0, 20, n_pathways).astype(np.float64)
+    return catalog
+
+
+def _brute_force(current, catalog, budget, max_steps=None):
+    """Best V^R over every subset of the catalog within the budget."""
+    start = np.minimum(current, 1.0)
+    impacts = catalog[IMPACT_COLUMNS].to_numpy()
+    costs = catalog['cost'].to_numpy()
+    best = start @ VR_WEIGHTS
+    for size in range(1, (max_steps or len(catalog)) + 1):
+        for subset in itertools.combinations(range(len(catalog)), size):
+            subset = list(subset)
+            if costs[subset].sum() <= budget:
+                best = max(best, np.minimum(start + impacts[subset].sum(axis=0), 1.0) @ VR_WEIGHTS)
+    return best
+
+
+def _planned_vr(current, result):
+    return result['vr_score'] if len(result['plan']) else np.minimum(current, 1.0) @ VR_WEIGHTS
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_matches_brute_force_search(seed):
+    rng = np.random.default_rng(seed)
+    for _ in range(100):
+        catalog = _catalog(rng, int(rng.integers(1, 9)))
+        # Some components start above the 1.0 cap, as page1 inputs can.
+        current = rng.uniform(0, 1.5, 3) * np.where(rng.random(3) < 0.2, 60, 1)
+        budget = rng.uniform(0, 50)
+        result = optimize_sequence(*current, catalog, budget, 'cost')
+        assert _planned_vr(current, result) == pytest.approx(_brute_force(current, catalog, budget), abs=1e-9)
+        assert result['total_cost'] <= budget
+
+
+def test_matches_brute_force_search_with_max_steps():
+    rng = np.random.default_rng(10)
+    for _ in range(100):
+        catalog = _catalog(rng, int(rng.integers(1, 8)))
+        current = rng.uniform(0, 1, 3)
+        budget = rng.uniform(0, 60)
+        max_steps = int(rng.integers(1, 4))
+        result = optimize_sequence(*current, catalog, budget, 'cost', max_steps=max_steps)
+        assert len(result['plan']) <= max_steps
+        assert _planned_vr(current, result) == pytest.approx(_brute_force(current, catalog, budget, max_steps), abs=1e-9)
+
+
+def test_plan_replays_with_the_scalar_model():
+    rng = np.random.default_rng(20)
+    catalog = _catalog(rng, 8)
+    catalog['pathway_type'] = 'AI-Fluency'
+    current = (0.4, 0.5, 0.3)
+    result = optimize_sequence(*current, catalog, 40.0, 'cost', hr_score=50.0, alignment_factor=0.4, completion_score=0.9, mastery_score=0.8)
+    state = current
+    by_name = catalog.set_index('pathway_name')
+    for step in result['plan'].to_dict('records'):
+        pathway = by_name.loc[step['pathway_name']]
+        state = model.simulate_pathway_impact(*state, pathway['pathway_type'], *(pathway[column] for column in IMPACT_COLUMNS), 0.9, 0.8)
+        assert (step['ai_fluency'], step['domain_expertise'], step['adaptive_capacity']) == pytest.approx(state, abs=1e-12)
+    vr_score = model.calculate_idiosyncratic_readiness(*state)
+    synergy_percentage = model.calculate_synergy_percentage(vr_score, 50.0, 0.4)
+    assert result['ai_r_score'] == pytest.approx(model.calculate_ai_readiness_score(vr_score, 50.0, synergy_percentage, 0.6, 0.15))
+
+
+def test_unknown_cost_column_is_rejected():
+    catalog = _catalog(np.random.default_rng(0), 3)
+    with pytest.raises(ValueError, match='duration_hours'):
+        optimize_sequence(0.5, 0.5, 0.5, catalog, 10.0, 'duration_hours')
+
+
+def test_negative_impacts_are_rejected():
+    catalog = _catalog(np.random.default_rng(0), 3)
+    catalog.loc[0, 'impact_ai_fluency'] = -0.1
+    with pytest.raises(ValueError, match='non-negative'):
+        optimize_sequence(0.5, 0.5, 0.5, catalog, 10.0, 'cost')
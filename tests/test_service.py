@@ -0,0 +1,95 @@
+import asyncio
+import json
+
+import pandas as pd
+import pytest
+
+from ai_readiness import model
+from ai_readiness.hr_table import OccupationHRTable
+from ai_readiness.reference_data import OCCUPATION_REQUIRED_SKILLS_DATA, OCCUPATIONAL_DATA
+from ai_readiness.service import ScoringModel, ScoringService, loadtest_payloads
+
+
+@pytest.fixture(scope='module')
+def service():
+    return ScoringService(ScoringModel())
+
+
+def _post(service, path, payload):
+    body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+    status, _, response = asyncio.run(service.handle('POST', path, body))
+    return status, json.loads(response)
+
+
+def test_batch_scores_match_the_page1_score_graph(service):
+    payloads = loadtest_payloads(20, seed=3)
+    status, response = _post(service, '/score/batch', {'profiles': payloads})
+    assert status == 200
+
+    required_skills = pd.DataFrame(OCCUPATION_REQUIRED_SKILLS_DATA)
+    graph = model.build_score_graph(OccupationHRTable(pd.DataFrame(OCCUPATIONAL_DATA)), required_skills)
+    for payload, scores in zip(payloads, response['scores']):
+        inputs = {name: payload[name] for name in model.SCORE_GRAPH_INPUTS if name in payload}
+        inputs.update({'lambda_val': 0.3, 'gamma_val': 0.2, 'alpha': 0.6, 'beta': 0.15, 'max_possible_skills_match': 100})
+        inputs['individual_skills'] = pd.DataFrame(payload.get('individual_skills', []), columns=['skill_name', 'individual_skill_score'])
+        graph.update(inputs)
+        expected = graph.evaluate(['vr_score', 'hr_score', 'skills_match_score', 'ai_r_score'])
+        for name, value in expected.items():
+            assert scores[name] == pytest.approx(value, rel=1e-12, abs=1e-12)
+
+
+def test_single_score_matches_the_batch_endpoint(service):
+    payload = loadtest_payloads(1, seed=4)[0]
+    status, single = _post(service, '/score', payload)
+    assert status == 200
+    assert single == _post(service, '/score/batch', {'profiles': [payload]})[1]['scores'][0]
+
+
+@pytest.mark.parametrize('field, value, message', [
+    ('prompting_score', 'high', 'must be a number'),
+    ('prompting_score', True, 'must be a number'),
+    ('education_level', 3, 'must be a string'),
+    ('target_occupation', ['Data Scientist'], 'must be a string'),
+    ('target_occupation', 'Astronaut', 'Unknown target_occupation'),
+])
+def test_invalid_fields_are_rejected(service, field, value, message):
+    payload = {**loadtest_payloads(1, seed=5)[0], field: value}
+    status, response = _post(service, '/score', payload)
+    assert status == 400
+    assert message in response['error']
+
+
+@pytest.mark.parametrize('literal', ['NaN', 'Infinity', '-Infinity'])
+def test_non_finite_numbers_are_rejected(service, literal):
+    body = json.dumps(loadtest_payloads(1, seed=6)[0])
+    body = body.replace('"years_experience": ', f'"years_experience": {literal}, "unused": ', 1)
+    status, response = _post(service, '/score', body.encode())
+    assert status == 400
+    assert 'finite' in response['error']
+
+
+def test_stats_are_strict_json_before_any_request():
+    service = ScoringService(ScoringModel())
+    status, _, body = asyncio.run(service.handle('GET', '/stats', b''))
+    assert status == 200
+    assert json.loads(body, parse_constant=lambda constant: pytest.fail(constant))['batch_size']['count'] == 0
+
+
+async def _raw_exchange(service, request):
+    server = await service.start(port=0)
+    async with server:
+        reader, writer = await asyncio.open_connection(*server.sockets[0].getsockname()[:2])
+        writer.write(request)
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+    return response
+
+
+@pytest.mark.parametrize('length', ['abc', '-5'])
+def test_invalid_content_length_closes_the_connection(service, length):
+    request = f"POST /score HTTP/1.1\r\nHost: localhost\r\nContent-Length: {length}\r\n\r\n{{}}".encode()
+    response = asyncio.run(_raw_exchange(service, request))
+    assert response.startswith(b'HTTP/1.1 400')
+    assert b'Connection: close' in response
+    assert b'Invalid Content-Length' in response
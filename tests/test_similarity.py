@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ai_readiness import synthetic
+from ai_readiness.batch import OCCUPATION_COLUMNS
+from ai_readiness.similarity import OccupationSimilarityIndex
+
+
+def _unit(values):
+    norms = np.linalg.norm(values, axis=1, keepdims=True)
+    return np.divide(values, norms, out=np.zeros_like(values), where=norms != 0)
+
+
+def _dense_similarity(catalog, required, queries, query_required, skill_weight, fitted=None):
+    """Blended cosine similarity of ``queries`` to ``catalog`` with dense vectors, standardized on ``fitted``."""
+    fitted = (catalog if fitted is None else fitted)[OCCUPATION_COLUMNS].to_numpy(dtype=np.float64)
+    mean, scale = fitted.mean(axis=0), fitted.std(axis=0)
+    scale = np.where(scale > 0, scale, 1.0)
+    numeric = _unit((catalog[OCCUPATION_COLUMNS].to_numpy(dtype=np.float64) - mean) / scale)
+    query_numeric = _unit((queries[OCCUPATION_COLUMNS].to_numpy(dtype=np.float64) - mean) / scale)
+
+    vocabulary = sorted(set(required['skill_name'].dropna()) | set(query_required['skill_name'].dropna()))
+
+    def skill_vectors(names, table):
+        table = table.dropna(subset=['skill_name']).drop_duplicates(subset=['occupation_name', 'skill_name'], keep='last')
+        frame = table.assign(value=table['skill_importance'] * table['required_skill_score'] / 100)
+        dense = frame.pivot(index='occupation_name', columns='skill_name', values='value').reindex(index=names, columns=vocabulary).fillna(0.0)
+        return _unit(dense.to_numpy())
+
+    skills = skill_vectors(list(catalog['occupation_name']), required)
+    query_skills = skill_vectors(list(queries['occupation_name']), query_required)
+    return (1 - skill_weight) * query_numeric @ numeric.T + skill_weight * query_skills @ skills.T
+
+
+@pytest.fixture(scope='module')
+def catalog():
+    rng = np.random.default_rng(0)
+    return synthetic.occupations(rng, 150), synthetic.required_skills(rng, 150, n_skills=40)
+
+
+@pytest.mark.parametrize('skill_weight', [0.0, 0.5, 1.0])
+def test_nearest_matches_dense_cosine_search(catalog, skill_weight):
+    occupations, required = catalog
+    index = OccupationSimilarityIndex(occupations, required, skill_weight=skill_weight)
+    names = list(occupations['occupation_name'][:30])
+    expected = _dense_similarity(occupations, required, occupations.iloc[:30], required, skill_weight)
+    expected[np.arange(30), np.arange(30)] = -np.inf
+    expected = -np.sort(-expected, axis=1)[:, :5]
+
+    _, similarities = index.nearest(names, k=5)
+    np.testing.assert_allclose(similarities, expected, atol=1e-6)
+
+
+def test_query_counts_unknown_skills_in_the_norm(catalog):
+    occupations, required = catalog
+    index = OccupationSimilarityIndex(occupations, required, skill_weight=1.0)
+    query = occupations.iloc[:1].assign(occupation_name='New occupation')
+    known = required[required['occupation_name'] == occupations['occupation_name'].iloc[0]].assign(occupation_name='New occupation')
+    unknown = pd.DataFrame({
+        'occupation_name': 'New occupation',
+        'skill_name': [f'Unlisted {i}' for i in range(9)],
+        'required_skill_score': 80,
+        'skill_importance': 0.9,
+    })
+    query_required = pd.concat([known.iloc[:1], unknown], ignore_index=True)
+
+    _, similarities = index.query(query, query_required, k=3)
+    expected = -np.sort(-_dense_similarity(occupations, required, query, query_required, 1.0), axis=1)[:, :3]
+    np.testing.assert_allclose(similarities, expected, atol=1e-6)
+
+
+def test_added_occupations_keep_the_original_standardization(catalog):
+    occupations, required = catalog
+    first, rest = occupations.iloc[:100], occupations.iloc[100:]
+    index = OccupationSimilarityIndex(first, required[required['occupation_name'].isin(first['occupation_name'])])
+    index.add(rest, required[required['occupation_name'].isin(rest['occupation_name'])])
+    assert len(index) == 150
+
+    expected = _dense_similarity(occupations, required, rest, required, 0.5, fitted=first)
+    expected[np.arange(50), np.arange(100, 150)] = -np.inf
+    expected = -np.sort(-expected, axis=1)[:, :5]
+    _, similarities = index.nearest(list(rest['occupation_name']), k=5)
+    np.testing.assert_allclose(similarities, expected, atol=1e-6)
+
+
+def test_repeated_occupations_are_rejected(catalog):
+    occupations, required = catalog
+    index = OccupationSimilarityIndex(occupations, required)
+    with pytest.raises(ValueError, match='already indexed'):
+        index.add(occupations.iloc[:1])
+    with pytest.raises(KeyError):
+        index.nearest(['New occupation'])
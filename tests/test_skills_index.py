@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ai_readiness import model, synthetic
+from ai_readiness.skills_index import SkillMatchIndex, skills_match_score
+
+
+def _tables(seed, n_occupations=12, n_persons=60, n_skills=25):
+    """Random required and individual skill tables with repeats, gaps and unknown skills."""
+    rng = np.random.default_rng(seed)
+    names = np.array([f'skill_{i}' for i in range(n_skills)], dtype=object)
+    n_required = n_occupations * 6
+    required = pd.DataFrame({
+        'occupation_name': np.array([f'occupation_{i}' for i in range(n_occupations)], dtype=object)[rng.integers(0, n_occupations, n_required)],
+        'skill_name': rng.choice(names[:20], n_required),
+        'required_skill_score': rng.integers(0, 101, n_required).astype(np.float64),
+        'skill_importance': np.round(rng.uniform(0, 1, n_required), 2),
+    })
+    required.loc[rng.random(n_required) < 0.05, 'skill_name'] = None
+    # One occupation whose skills carry no importance at all.
+    required.loc[required['occupation_name'] == 'occupation_0', 'skill_importance'] = 0.0
+
+    n_individual = n_persons * 5
+    individual = pd.DataFrame({
+        'user_id': rng.integers(1, n_persons + 1, n_individual),
+        # skill_20 and above are required by no occupation.
+        'skill_name': rng.choice(names, n_individual),
+        'individual_skill_score': rng.integers(0, 101, n_individual).astype(np.float64),
+    })
+    individual.loc[rng.random(n_individual) < 0.05, 'individual_skill_score'] = np.nan
+    individual.loc[rng.random(n_individual) < 0.05, 'skill_name'] = None
+    return required, individual
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_single_pair_score_matches_index_pair_scores(seed):
+    required, individual = _tables(seed)
+    index = SkillMatchIndex(required)
+    person_ids = np.arange(1, 61)
+    person_matrix = index.encode_individual_skills(individual, person_ids=person_ids)
+    for position, occupation in enumerate(index.occupation_names):
+        expected = index.pair_scores(person_matrix, position)
+        occupation_required = required[required['occupation_name'] == occupation]
+        got = [skills_match_score(individual[individual['user_id'] == person_id][['skill_name', 'individual_skill_score']], occupation_required) for person_id in person_ids]
+        np.testing.assert_allclose(got, expected, rtol=1e-12, atol=1e-12)
+
+
+def test_single_pair_score_matches_index_on_synthetic_catalog():
+    rng = np.random.default_rng(7)
+    required = synthetic.required_skills(rng, 50, n_skills=60)
+    individual = synthetic.individual_skills(rng, 200, n_skills=60)
+    index = SkillMatchIndex(required)
+    match = index.match_scores(index.encode_individual_skills(individual, person_ids=np.arange(1, 201)))
+    by_person = dict(tuple(individual.groupby('user_id')))
+    for person in range(0, 200, 9):
+        user_skills = by_person.get(person + 1, individual.iloc[:0])[['skill_name', 'individual_skill_score']]
+        for position, occupation in enumerate(index.occupation_names):
+            got = skills_match_score(user_skills, required[required['occupation_name'] == occupation])
+            assert got == pytest.approx(match[person, position], rel=1e-12, abs=1e-12)
+
+
+def test_repeated_skills_keep_the_last_entry():
+    required = pd.DataFrame({'skill_name': ['a', 'b', 'a'], 'required_skill_score': [100, 80, 50], 'skill_importance': [1.0, 1.0, 3.0]})
+    user = pd.DataFrame({'skill_name': ['a', 'b', 'a'], 'individual_skill_score': [10, 80, 90]})
+    # a: min(90, 50) / 100 * 3 = 1.5, b: 0.8; total importance 4.
+    assert skills_match_score(user, required) == pytest.approx((1.5 + 0.8) / 4 * 100)
+    index = SkillMatchIndex(required, occupation_column=None)
+    assert index.pair_scores(index.encode_individual_skills(user), 0)[0] == pytest.approx((1.5 + 0.8) / 4 * 100)
+
+
+def test_empty_tables_and_zero_importance_score_zero():
+    required = pd.DataFrame({'skill_name': ['a'], 'required_skill_score': [80], 'skill_importance': [0.0]})
+    user = pd.DataFrame({'skill_name': ['a'], 'individual_skill_score': [80]})
+    assert skills_match_score(user, required) == 0
+    assert skills_match_score(user.iloc[:0], required.assign(skill_importance=1.0)) == 0
+    assert skills_match_score(user, required.iloc[:0]) == 0
+
+
+def test_model_delegates_to_the_single_pair_score():
+    required = pd.DataFrame({'skill_name': ['a', 'b'], 'required_skill_score': [80, 60], 'skill_importance': [0.5, 1.5]})
+    user = pd.DataFrame({'skill_name': ['b', 'c'], 'individual_skill_score': [90, 70]})
+    assert model.calculate_skills_match_score(user, required) == skills_match_score(user, required) == pytest.approx(45.0)
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ai_readiness import batch, synthetic
+from ai_readiness.reference_data import OCCUPATIONAL_DATA
+from ai_readiness.stream import stream_scores
+
+
+@pytest.fixture
+def profiles_path(tmp_path):
+    rng = np.random.default_rng(0)
+    profiles = synthetic.profiles(rng, 1_000)
+    profiles['target_occupation'] = rng.choice(OCCUPATIONAL_DATA['occupation_name'], len(profiles))
+    profiles['skills_match_score'] = rng.uniform(0, 100, len(profiles))
+    path = tmp_path / 'profiles.csv'
+    profiles.to_csv(path, index=False)
+    return path
+
+
+def _expected(profiles, occupation_names):
+    occupations = pd.DataFrame(OCCUPATIONAL_DATA).set_index('occupation_name').loc[occupation_names].reset_index()
+    return batch.score_population(profiles, occupations, profiles['skills_match_score'])
+
+
+def test_chunked_scores_match_one_batch(profiles_path, tmp_path):
+    output = tmp_path / 'scores.csv'
+    stats = stream_scores(str(profiles_path), str(output), chunk_size=128)
+    assert (stats['rows'], stats['chunks']) == (1_000, 8)
+
+    profiles = pd.read_csv(profiles_path)
+    scores = pd.read_csv(output)
+    assert list(scores['user_id']) == list(profiles['user_id'])
+    expected = _expected(profiles, profiles['target_occupation'])
+    for column in batch.SCORE_COLUMNS:
+        np.testing.assert_allclose(scores[column], expected[column], rtol=1e-12)
+
+
+def test_explicit_occupation_replaces_the_column(profiles_path, tmp_path):
+    output = tmp_path / 'scores.csv'
+    occupation = OCCUPATIONAL_DATA['occupation_name'][0]
+    with pytest.warns(UserWarning, match='target_occupation'):
+        stream_scores(str(profiles_path), str(output), occupation=occupation, chunk_size=300)
+
+    profiles = pd.read_csv(profiles_path)
+    scores = pd.read_csv(output)
+    assert (scores['target_occupation'] == occupation).all()
+    np.testing.assert_allclose(scores['ai_r_score'], _expected(profiles, [occupation] * len(profiles))['ai_r_score'], rtol=1e-12)
+
+
+def test_unknown_occupation_is_rejected(profiles_path, tmp_path):
+    with pytest.raises(ValueError, match='Astronaut'), pytest.warns(UserWarning):
+        stream_scores(str(profiles_path), str(tmp_path / 'scores.csv'), occupation='Astronaut')
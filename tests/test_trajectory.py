@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ai_readiness import batch, model, synthetic
+from ai_readiness.reference_data import OCCUPATIONAL_DATA
+from ai_readiness.trajectory import TrajectoryStore
+
+
+def _snapshots(rng, user_ids, occupations):
+    snapshots = synthetic.profiles(rng, len(user_ids)).drop(columns=['delta_proficiency', 'delta_t_hours_invested'])
+    snapshots['user_id'] = user_ids
+    snapshots['target_occupation'] = rng.choice(occupations, len(user_ids))
+    snapshots['hours_invested'] = np.where(rng.random(len(user_ids)) < 0.1, 0.0, rng.uniform(1, 40, len(user_ids)))
+    return snapshots
+
+
+def test_periods_match_a_per_period_recomputation():
+    rng = np.random.default_rng(0)
+    occupations = pd.DataFrame(OCCUPATIONAL_DATA)
+    names = list(occupations['occupation_name'])
+    store = TrajectoryStore(occupations, lambda_val=0.5)
+
+    current = occupations['current_job_postings'].astype(np.float64).to_numpy()
+    previous = occupations['previous_job_postings'].astype(np.float64).to_numpy()
+    last_s1 = {}
+    for period in range(4):
+        # People join and leave between periods, and arrive in any order.
+        user_ids = rng.permutation(rng.choice(np.arange(1, 60), 40, replace=False))
+        snapshots = _snapshots(rng, user_ids, names)
+        postings = {name: float(rng.integers(500, 5000)) for name in rng.choice(names, 3, replace=False)} if period else None
+        scored = store.append(period, snapshots, postings)
+
+        if postings:
+            moved = occupations['occupation_name'].isin(list(postings)).to_numpy()
+            previous = np.where(moved, current, previous)
+            current = np.where(moved, occupations['occupation_name'].map(postings).to_numpy(dtype=np.float64), current)
+        table = occupations.assign(current_job_postings=current, previous_job_postings=previous).set_index('occupation_name')
+        expected = snapshots.sort_values('user_id').reset_index(drop=True)
+        s1 = [model.calculate_technical_ai_skills(*row) for row in expected[['prompting_score', 'tools_score', 'understanding_score', 'datalit_score']].itertuples(index=False)]
+        expected['delta_proficiency'] = [s - last_s1[user_id] if user_id in last_s1 else 0.0 for user_id, s in zip(expected['user_id'], s1)]
+        expected['delta_t_hours_invested'] = expected['hours_invested']
+        last_s1.update(zip(expected['user_id'], s1))
+        hr = batch.compute_hr_components(table.loc[expected['target_occupation']].reset_index(), lambda_val=0.5)
+        scores = batch.score_profiles_with_hr(expected, hr['hr_score'].to_numpy())
+
+        assert list(scored['user_id']) == list(expected['user_id'])
+        np.testing.assert_allclose(scored['ai_r_score'], scores['ai_r_score'], rtol=1e-12)
+        np.testing.assert_allclose(scored['growth_multiplier'], hr['growth_multiplier'], rtol=1e-12)
+
+    assert len(store.query(start=1, stop=3)) == 80
+    person = int(store.query()['user_id'].iloc[0])
+    trajectory = store.trajectory(person)
+    assert list(trajectory['period']) == sorted(trajectory['period'])
+    assert (trajectory['user_id'] == person).all()
+
+
+def test_periods_must_increase_and_users_be_unique():
+    rng = np.random.default_rng(1)
+    store = TrajectoryStore()
+    names = store.hr_table.occupation_names
+    store.append(1, _snapshots(rng, np.array([1, 2]), names))
+    with pytest.raises(ValueError, match='must come after'):
+        store.append(1, _snapshots(rng, np.array([1, 2]), names))
+    with pytest.raises(ValueError, match='several snapshots'):
+        store.append(2, _snapshots(rng, np.array([3, 3]), names))
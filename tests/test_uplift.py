@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ai_readiness import batch, synthetic
+from ai_readiness.reference_data import OCCUPATION_REQUIRED_SKILLS_DATA
+from ai_readiness.skills_index import skills_match_score
+from ai_readiness.uplift import VR_LEVERS, UpliftSolver
+
+OCCUPATION = 'Data Analyst with AI Skills'
+
+
+@pytest.fixture(scope='module')
+def solver():
+    return UpliftSolver()
+
+
+@pytest.fixture
+def person():
+    profiles = synthetic.profiles(np.random.default_rng(0), 1).assign(target_occupation=OCCUPATION)
+    required = pd.DataFrame(OCCUPATION_REQUIRED_SKILLS_DATA)
+    required = required[required['occupation_name'] == OCCUPATION]
+    skills = pd.DataFrame({
+        'user_id': profiles['user_id'].iloc[0],
+        'skill_name': required['skill_name'].iloc[:2].tolist() + ['Unrelated skill'],
+        'individual_skill_score': [20, 40, 90],
+    })
+    return profiles, skills, required
+
+
+def _score(profiles, skills, required, hr_score):
+    match = skills_match_score(skills[['skill_name', 'individual_skill_score']], required)
+    return batch.score_profiles_with_hr(profiles, hr_score, match)['ai_r_score'].iloc[0]
+
+
+def test_plan_replays_to_the_target(solver, person):
+    profiles, skills, required = person
+    hr_score = solver.hr_table.lookup(OCCUPATION)['hr_score']
+    current = _score(profiles, skills, required, hr_score)
+    target = current + 4
+    plan, skill_changes = solver.solve(profiles, target, skills)
+    assert plan['reachable'].iloc[0]
+    assert plan['ai_r_score'].iloc[0] == pytest.approx(current, rel=1e-12)
+
+    adjusted = profiles.copy()
+    for name in VR_LEVERS:
+        adjusted[name] = adjusted[name] + plan[f'{name}_delta'].iloc[0]
+        assert adjusted[name].iloc[0] <= VR_LEVERS[name] + 1e-9
+    raised = skills.set_index('skill_name')['individual_skill_score'].astype(np.float64).to_dict()
+    raised.update(zip(skill_changes['skill_name'], skill_changes['new_score']))
+    adjusted_skills = pd.DataFrame({'skill_name': list(raised), 'individual_skill_score': list(raised.values())})
+
+    replayed = _score(adjusted, adjusted_skills, required, hr_score)
+    assert replayed == pytest.approx(plan['ai_r_score_after'].iloc[0], rel=1e-9)
+    assert replayed >= target - 1e-9
+
+
+def test_no_random_plan_is_cheaper(solver, person):
+    profiles, skills, required = person
+    hr_score = solver.hr_table.lookup(OCCUPATION)['hr_score']
+    target = _score(profiles, skills, required, hr_score) + 4
+    plan, skill_changes = solver.solve(profiles, target, skills)
+
+    names = list(VR_LEVERS)
+    vr_capacity = np.array([VR_LEVERS[name] - profiles[name].iloc[0] for name in names])
+    current = skills.set_index('skill_name')['individual_skill_score'].reindex(required['skill_name']).fillna(0).to_numpy()
+    skill_capacity = np.maximum(required['required_skill_score'].to_numpy() - current, 0)
+    per_point = required['skill_importance'].to_numpy() / required['skill_importance'].sum()
+    capacity = np.concatenate([vr_capacity, skill_capacity])
+    unit_cost = np.concatenate([[1 / VR_LEVERS[name] for name in names], np.full(len(skill_capacity), 1 / 100)])
+    points = skill_changes.set_index('skill_name').reindex(required['skill_name'])
+    planned = np.concatenate([plan[[f'{name}_delta' for name in names]].to_numpy()[0], (points['new_score'] - points['current_score']).fillna(0).to_numpy()])
+
+    # Random mixes of the levers and perturbations of the plan, each scaled
+    # down to the smallest share that reaches the target.
+    rng = np.random.default_rng(1)
+    n_samples = 4000
+    weights = rng.random((n_samples // 2, len(capacity))) ** 3
+    nearby = planned * rng.uniform(0.5, 1.5, (n_samples // 2, len(capacity))) + rng.uniform(0, 0.05, (n_samples // 2, len(capacity))) * capacity
+    mix = np.minimum(np.vstack([weights / weights.max(axis=1, keepdims=True) * capacity, nearby]), capacity)
+
+    def ai_r(share):
+        change = mix * share[:, None]
+        adjusted = {column: np.repeat(profiles[column].to_numpy(), n_samples) for column in batch.PROFILE_COLUMNS}
+        for i, name in enumerate(names):
+            adjusted[name] = adjusted[name] + change[:, i]
+        match = plan['skills_match_score'].iloc[0] + change[:, len(names):] @ per_point
+        return batch.score_profiles_with_hr(adjusted, hr_score, match)['ai_r_score'].to_numpy()
+
+    low, high = np.zeros(n_samples), np.ones(n_samples)
+    feasible = ai_r(high) >= target
+    for _ in range(60):
+        middle = (low + high) / 2
+        reached = ai_r(middle) >= target
+        high, low = np.where(reached, middle, high), np.where(reached, low, middle)
+    efforts = (mix * high[:, None]) @ unit_cost
+    assert feasible.any()
+    assert plan['effort'].iloc[0] <= efforts[feasible].min() * (1 + 1e-6)
+
+
+def test_targets_already_met_cost_nothing(solver, person):
+    profiles, skills, required = person
+    plan, skill_changes = solver.solve(profiles, 0.0, skills)
+    assert plan['effort'].iloc[0] == 0
+    assert skill_changes.empty
+
+
+def test_unreachable_targets_are_reported(solver, person):
+    profiles, skills, _ = person
+    plan, skill_changes = solver.solve(profiles, 1e6, skills)
+    assert not plan['reachable'].iloc[0]
+    assert np.isnan(plan['effort'].iloc[0])
+    assert skill_changes.empty
+
+
+def test_unknown_cost_levers_are_rejected(solver, person):
+    profiles, skills, _ = person
+    with pytest.raises(ValueError, match='years_experience'):
+        solver.solve(profiles, 50.0, skills, costs={'years_experience': 1.0})